@@ -0,0 +1,88 @@
+"""
+Benchmark of the plugin loading time at QGIS startup.
+
+Each measurement runs in a fresh Python process (imports are cached per process),
+after qgis.core, qgis.gui and qgis.PyQt are imported since QGIS has loaded them already:
+
+- plugin load: the modules imported when QGIS loads the plugin
+- eager load: the plugin with its GUI modules, as imported at startup before they were deferred
+- first use: the data browser modules, with their forms
+- precompiled forms: importing the forms compiled by scripts/compile_ui.py
+- loadUiType: parsing all the .ui files of the plugin with loadUiType, as before they were compiled
+
+    python benchmarks/bench_startup.py --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PRELUDE = """
+import sys, time
+sys.path.insert(0, {root!r})
+import qgis.core, qgis.gui, qgis.PyQt.QtWidgets
+start = time.perf_counter()
+"""
+
+SNIPPETS = {
+    "plugin load": "import wincan2teksi.wincan2teksi_plugin",
+    "eager load": (
+        "import wincan2teksi.wincan2teksi_plugin\n"
+        "import wincan2teksi.core.read_data\n"
+        "import wincan2teksi.gui.databrowserdialog\n"
+        "import wincan2teksi.gui.settings_dialog"
+    ),
+    "first use": "import wincan2teksi.gui.databrowserdialog",
+    "precompiled forms": (
+        "import glob, importlib, os\n"
+        "for path in glob.glob(os.path.join({root!r}, 'wincan2teksi', 'ui', 'ui_*.py')):\n"
+        "    importlib.import_module('wincan2teksi.ui.' + os.path.basename(path)[:-3])"
+    ),
+    "loadUiType (all .ui files)": (
+        "import glob, os\n"
+        "from qgis.PyQt.uic import loadUiType\n"
+        "for path in glob.glob(os.path.join({root!r}, 'wincan2teksi', 'ui', '*.ui')):\n"
+        "    loadUiType(path)"
+    ),
+}
+
+
+def measure(snippet: str) -> float:
+    """
+    Returns the time in seconds of the snippet run in a new Python process
+    """
+    code = PRELUDE.format(root=ROOT) + snippet.format(root=ROOT)
+    code += "\nprint(time.perf_counter() - start)"
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    for name, snippet in SNIPPETS.items():
+        results[name] = statistics.median(measure(snippet) for _ in range(args.repeat))
+
+    print(f"{'measurement':<28} {'median (ms)':>12}")
+    for name, elapsed in results.items():
+        print(f"{name:<28} {elapsed * 1000:>12.1f}")
+    saved = results["eager load"] - results["plugin load"]
+    print(f"\nstartup time saved by deferring the GUI modules: {saved * 1000:.1f} ms")
+    saved = results["loadUiType (all .ui files)"] - results["precompiled forms"]
+    print(f"time saved by the precompiled forms: {saved * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
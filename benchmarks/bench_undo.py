@@ -0,0 +1,107 @@
+"""
+Benchmark of the undo deletion on a generated GeoPackage stand-in.
+
+Compares the former per obj_id request/delete loop with the chunked
+"obj_id" IN (...) request and a single deleteFeatures() call.
+
+Runs headless with qgis.core only:
+
+    python benchmarks/bench_undo.py --features 30000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from qgis.core import (
+    Qgis,
+    QgsApplication,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsField,
+    QgsFields,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransformContext,
+)
+from qgis.PyQt.QtCore import QMetaType
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from wincan2teksi.core.layer_edit import edit  # noqa: E402
+from wincan2teksi.core.undo import delete_obj_ids  # noqa: E402
+
+
+def create_layer(path: str, feature_count: int) -> tuple:
+    fields = QgsFields()
+    fields.append(QgsField("obj_id", QMetaType.Type.QString))
+    fields.append(QgsField("remark", QMetaType.Type.QString))
+
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.layerName = "damage"
+    writer = QgsVectorFileWriter.create(
+        path,
+        fields,
+        Qgis.WkbType.NoGeometry,
+        QgsCoordinateReferenceSystem(),
+        QgsCoordinateTransformContext(),
+        options,
+    )
+    obj_ids = []
+    for i in range(feature_count):
+        feature = QgsFeature(fields)
+        obj_id = f"ch000000{i:08d}"
+        feature.setAttributes([obj_id, "benchmark"])
+        writer.addFeature(feature)
+        obj_ids.append(obj_id)
+    del writer
+
+    layer = QgsVectorLayer(f"{path}|layername=damage", "damage", "ogr")
+    assert layer.isValid()
+    return layer, obj_ids
+
+
+def legacy_delete(layer, obj_ids):
+    with edit(layer):
+        for obj_id in obj_ids:
+            request = QgsFeatureRequest().setFilterExpression(f"\"obj_id\" = '{obj_id}'")
+            for feature in layer.getFeatures(request):
+                layer.deleteFeature(feature.id())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--features", type=int, default=10000)
+    parser.add_argument(
+        "--skip-legacy", action="store_true", help="do not run the per obj_id deletion"
+    )
+    args = parser.parse_args()
+
+    QgsApplication.setPrefixPath(os.environ.get("QGIS_PREFIX_PATH", "/usr"), True)
+    app = QgsApplication([], False)
+    app.initQgis()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        runs = [("chunked IN", delete_obj_ids)]
+        if not args.skip_legacy:
+            runs.insert(0, ("per obj_id", legacy_delete))
+        for name, delete in runs:
+            layer, obj_ids = create_layer(
+                os.path.join(tmp_dir, f"{name.replace(' ', '_')}.gpkg"), args.features
+            )
+            start = time.perf_counter()
+            delete(layer, obj_ids)
+            elapsed = time.perf_counter() - start
+            remaining = layer.featureCount()
+            print(f"{name:>12}: {args.features} features in {elapsed:.2f} s ({remaining} left)")
+            del layer
+
+    app.exitQgis()
+
+
+if __name__ == "__main__":
+    main()
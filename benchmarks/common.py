@@ -0,0 +1,123 @@
+"""
+Helpers shared by the benchmarks: headless QGIS application, measurements
+and comparison with a baseline.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from qgis.core import QgsApplication
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from wincan2teksi.core import layer_access  # noqa: E402
+
+
+def start_qgis() -> QgsApplication:
+    """
+    Starts a headless QGIS application with a temporary profile,
+    so that the plugin settings written by the benchmarks do not leak in the user profile
+    """
+    profile_dir = tempfile.mkdtemp(prefix="wincan2teksi_benchmark_profile_")
+    QgsApplication.setPrefixPath(os.environ.get("QGIS_PREFIX_PATH", "/usr"), True)
+    app = QgsApplication([], False, profile_dir)
+    app.initQgis()
+    return app
+
+
+class Measurement:
+    """
+    Measures the wall time, the layer requests, the SQLite statements and
+    the peak memory allocated by Python in the enclosed block
+
+    Only the statements run through the Python sqlite3 module are counted (the WinCan
+    database, the SQLite writer), not those of the QGIS providers. Likewise, memory
+    allocated by QGIS itself (C++) is not seen by tracemalloc.
+    """
+
+    def __init__(self, name: str, trace_memory: bool = True):
+        self.name = name
+        self.trace_memory = trace_memory
+        self.result = {}
+        self._sqlite_statements = 0
+        self._connect = None
+
+    def _count_statement(self, _statement):
+        self._sqlite_statements += 1
+
+    def __enter__(self):
+        layer_access.reset_statistics()
+        self._connect = sqlite3.connect
+
+        def connect(*args, **kwargs):
+            connection = self._connect(*args, **kwargs)
+            connection.set_trace_callback(self._count_statement)
+            return connection
+
+        sqlite3.connect = connect
+        if self.trace_memory:
+            tracemalloc.start()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self._start
+        peak_memory = None
+        if self.trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+        sqlite3.connect = self._connect
+        self.result = {
+            "time": elapsed,
+            "layer_requests": sum(entry["count"] for entry in layer_access.statistics().values()),
+            "sqlite_statements": self._sqlite_statements,
+            "peak_memory_mb": peak_memory,
+        }
+        return False
+
+
+def print_results(results: dict):
+    print(f"{'benchmark':<28} {'time (s)':>10} {'requests':>10} {'sqlite':>10} {'memory (MB)':>12}")
+    for name, result in results.items():
+        memory = result["peak_memory_mb"]
+        print(
+            f"{name:<28} {result['time']:>10.3f} {result['layer_requests']:>10}"
+            f" {result['sqlite_statements']:>10} {'-' if memory is None else f'{memory:.1f}':>12}"
+        )
+
+
+def save_results(path: str, results: dict):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def compare_with_baseline(results: dict, baseline_path: str, tolerance: float) -> list:
+    """
+    Returns the regressions of the results compared to a baseline:
+    time or memory higher than the baseline by more than the tolerance (ratio),
+    or more layer requests or SQLite statements
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for key in ("time", "peak_memory_mb"):
+            if result.get(key) is None or not reference.get(key):
+                continue
+            if result[key] > reference[key] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {key} {result[key]:.3f} > baseline {reference[key]:.3f}"
+                )
+        for key in ("layer_requests", "sqlite_statements"):
+            if key in reference and result[key] > reference[key]:
+                regressions.append(f"{name}: {key} {result[key]} > baseline {reference[key]}")
+    return regressions
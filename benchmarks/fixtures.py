@@ -0,0 +1,29 @@
+"""
+TEKSI stand-in layers for the benchmarks, opened from a GeoPackage written by
+generate_teksi_gpkg.
+"""
+
+from qgis.core import QgsVectorLayer
+
+from generate_teksi_gpkg import LAYERS, generate_teksi_gpkg
+
+
+def open_teksi_layers(path: str) -> dict:
+    """
+    Returns the TEKSI stand-in layers of a generated GeoPackage by their key in LAYERS
+    """
+    layers = {}
+    for key, (table, _has_geometry, _columns) in LAYERS.items():
+        layer = QgsVectorLayer(f"{path}|layername={table}", table, "ogr")
+        assert layer.isValid(), f"could not open {table} in {path}"
+        layers[key] = layer
+    return layers
+
+
+def create_teksi_gpkg(path: str, reaches: int, wincan: str = None) -> dict:
+    """
+    Writes the TEKSI stand-in layers to a GeoPackage, with a reach for each
+    section of the WinCan database if given, and returns them by key
+    """
+    generate_teksi_gpkg(path, reaches=reaches, wincan=wincan)
+    return open_teksi_layers(path)
@@ -0,0 +1,372 @@
+"""
+Generator of a synthetic TEKSI wastewater network in a GeoPackage.
+
+Writes stand-ins of the layers used by the plugin: the reach view, the wastewater
+structures, the maintenance events, damages, files, the join table between
+maintenance events and wastewater structures and the VSA value lists.
+
+Given a WinCan database (see generate_wincan_db3), a reach is created for each
+of its sections, joining the same nodes with the same length, so that all the
+sections are matched. The network is completed up to the requested size with
+further reaches.
+
+Only the Python standard library is used:
+
+    python benchmarks/generate_teksi_gpkg.py /tmp/teksi.gpkg --reaches 200000 \\
+        --wincan /tmp/wincan/DB/inspection.db3
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import struct
+
+from generate_wincan_db3 import CHANNEL_DAMAGE_CODES, node_identifier
+
+SRS_ID = 2056
+SRS_WKT = (
+    'PROJCS["CH1903+ / LV95",GEOGCS["CH1903+",DATUM["CH1903+",'
+    'SPHEROID["Bessel 1841",6377397.155,299.1528128]],PRIMEM["Greenwich",0],'
+    'UNIT["degree",0.0174532925199433]],PROJECTION["Hotine_Oblique_Mercator_Azimuth_Center"],'
+    'PARAMETER["latitude_of_center",46.9524055555556],'
+    'PARAMETER["longitude_of_center",7.43958333333333],PARAMETER["azimuth",90],'
+    'PARAMETER["rectified_grid_angle",90],PARAMETER["scale_factor",1],'
+    'PARAMETER["false_easting",2600000],PARAMETER["false_northing",1200000],'
+    'UNIT["metre",1],AUTHORITY["EPSG","2056"]]'
+)
+
+# layer key -> (table name, has geometry, columns)
+LAYERS = {
+    "reach": (
+        "vw_tww_reach",
+        True,
+        (
+            ("obj_id", "TEXT"),
+            ("identifier", "TEXT"),
+            ("rp_from_obj_id", "TEXT"),
+            ("rp_from_identifier", "TEXT"),
+            ("rp_to_obj_id", "TEXT"),
+            ("rp_to_identifier", "TEXT"),
+            ("length_effective", "REAL"),
+            ("ws_obj_id", "TEXT"),
+        ),
+    ),
+    "wastewater_structure": (
+        "vw_tww_wastewater_structure",
+        False,
+        (("obj_id", "TEXT"), ("identifier", "TEXT"), ("structure_condition", "INTEGER")),
+    ),
+    "maintenance": (
+        "vw_tww_maintenance_event",
+        False,
+        (
+            ("obj_id", "TEXT"),
+            ("maintenance_event_type", "TEXT"),
+            ("kind", "INTEGER"),
+            ("operator", "TEXT"),
+            ("time_point", "DATETIME"),
+            ("remark", "TEXT"),
+            ("status", "INTEGER"),
+            ("inspected_length", "REAL"),
+            ("base_data", "TEXT"),
+            ("fk_operating_company", "TEXT"),
+            ("fk_reach_point", "TEXT"),
+            ("videonumber", "TEXT"),
+        ),
+    ),
+    "damage": (
+        "vw_tww_damage_channel",
+        False,
+        (
+            ("obj_id", "TEXT"),
+            ("damage_type", "TEXT"),
+            ("comments", "TEXT"),
+            ("single_damage_class", "INTEGER"),
+            ("channel_damage_code", "INTEGER"),
+            ("distance", "REAL"),
+            ("video_counter", "TEXT"),
+            ("fk_examination", "TEXT"),
+        ),
+    ),
+    "file": (
+        "tww_od_file",
+        False,
+        (
+            ("obj_id", "TEXT"),
+            ("class", "INTEGER"),
+            ("kind", "INTEGER"),
+            ("object", "TEXT"),
+            ("identifier", "TEXT"),
+            ("path_relative", "TEXT"),
+        ),
+    ),
+    "join": (
+        "tww_od_re_maintenance_event_wastewater_structure",
+        False,
+        (
+            ("obj_id", "TEXT"),
+            ("fk_wastewater_structure", "TEXT"),
+            ("fk_maintenance_event", "TEXT"),
+        ),
+    ),
+    "vl_damage_channel_channel_damage_code": (
+        "tww_vl_damage_channel_channel_damage_code",
+        False,
+        (("code", "INTEGER"), ("value_en", "TEXT")),
+    ),
+    "vl_damage_single_damage_class": (
+        "tww_vl_damage_single_damage_class",
+        False,
+        (("code", "INTEGER"), ("value_en", "TEXT")),
+    ),
+    "vl_wastewater_structure_structure_condition": (
+        "tww_vl_wastewater_structure_structure_condition",
+        False,
+        (("code", "INTEGER"), ("value_en", "TEXT")),
+    ),
+}
+
+STRUCTURE_CONDITION_CODES = {f"Z{level}": 3359 + level for level in range(5)}
+SINGLE_DAMAGE_CLASS_CODES = {f"EZ{level}": 3707 + level for level in range(5)}
+
+
+def obj_id(kind: str, index: int) -> str:
+    return f"ch000000{kind}{index:06d}"
+
+
+def _line_blob(x0: float, y0: float, x1: float, y1: float) -> bytes:
+    """
+    Returns the GeoPackage binary of a 2 points line string, with its envelope
+    """
+    header = b"GP" + bytes((0, 0b00000011)) + struct.pack("<i", SRS_ID)
+    envelope = struct.pack("<4d", min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1))
+    wkb = struct.pack("<BII4d", 1, 2, 2, x0, y0, x1, y1)
+    return header + envelope + wkb
+
+
+def _create_gpkg(connection):
+    connection.execute("PRAGMA application_id = 1196444487")  # GPKG
+    connection.execute("PRAGMA user_version = 10300")
+    connection.executescript(
+        """
+        CREATE TABLE gpkg_spatial_ref_sys (
+            srs_name TEXT NOT NULL, srs_id INTEGER PRIMARY KEY, organization TEXT NOT NULL,
+            organization_coordsys_id INTEGER NOT NULL, definition TEXT NOT NULL,
+            description TEXT
+        );
+        CREATE TABLE gpkg_contents (
+            table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL,
+            identifier TEXT UNIQUE, description TEXT DEFAULT '',
+            last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE, srs_id INTEGER
+        );
+        CREATE TABLE gpkg_geometry_columns (
+            table_name TEXT NOT NULL, column_name TEXT NOT NULL,
+            geometry_type_name TEXT NOT NULL, srs_id INTEGER NOT NULL,
+            z TINYINT NOT NULL, m TINYINT NOT NULL,
+            CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name)
+        );
+        """
+    )
+    connection.executemany(
+        "INSERT INTO gpkg_spatial_ref_sys VALUES (?, ?, ?, ?, ?, NULL)",
+        (
+            ("Undefined cartesian SRS", -1, "NONE", -1, "undefined"),
+            ("Undefined geographic SRS", 0, "NONE", 0, "undefined"),
+            ("CH1903+ / LV95", SRS_ID, "EPSG", SRS_ID, SRS_WKT),
+        ),
+    )
+
+
+def _create_table(connection, key: str, index_obj_id: bool):
+    table, has_geometry, columns = LAYERS[key]
+    definitions = ["fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL"]
+    if has_geometry:
+        definitions.append("geom LINESTRING")
+    definitions.extend(f'"{name}" {column_type}' for name, column_type in columns)
+    connection.execute(f'CREATE TABLE "{table}" ({", ".join(definitions)})')
+    connection.execute(
+        "INSERT INTO gpkg_contents (table_name, data_type, identifier, srs_id) VALUES (?, ?, ?, ?)",
+        (table, "features" if has_geometry else "attributes", table, SRS_ID),
+    )
+    if has_geometry:
+        connection.execute(
+            "INSERT INTO gpkg_geometry_columns VALUES (?, 'geom', 'LINESTRING', ?, 0, 0)",
+            (table, SRS_ID),
+        )
+    if index_obj_id and columns[0][0] == "obj_id":
+        # the TEKSI tables have obj_id as primary key
+        connection.execute(f'CREATE UNIQUE INDEX "idx_{table}_obj_id" ON "{table}" (obj_id)')
+
+
+def _insert(connection, key: str, rows):
+    table, has_geometry, columns = LAYERS[key]
+    names = (["geom"] if has_geometry else []) + [name for name, _ in columns]
+    connection.executemany(
+        'INSERT INTO "{}" ({}) VALUES ({})'.format(
+            table, ", ".join(f'"{name}"' for name in names), ", ".join("?" * len(names))
+        ),
+        rows,
+    )
+
+
+def _wincan_sections(path: str) -> list:
+    """
+    Returns (from node, to node, length) of the sections of a WinCan database which are not deleted
+    """
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(
+            "SELECT from_node.OBJ_Key, to_node.OBJ_Key, SECTION.OBJ_Length FROM SECTION"
+            " JOIN NODE from_node ON from_node.OBJ_PK = SECTION.OBJ_FromNode_REF"
+            " JOIN NODE to_node ON to_node.OBJ_PK = SECTION.OBJ_ToNode_REF"
+            " WHERE SECTION.OBJ_Deleted IS NULL ORDER BY SECTION.OBJ_SortOrder"
+        ).fetchall()
+    finally:
+        connection.close()
+
+
+def generate_teksi_gpkg(
+    path: str,
+    reaches: int = 10000,
+    wincan: str = None,
+    channel: str = "",
+    existing_events_per_structure: int = 0,
+    length_range: tuple = (10.0, 80.0),
+    index_obj_id: bool = True,
+    seed: int = 0,
+) -> str:
+    """
+    Writes the TEKSI stand-in layers to a new GeoPackage and returns its path
+
+    The reaches join the nodes "{channel}-{node}" if a channel is given, as matched
+    by the data browser. existing_events_per_structure maintenance events with
+    their join and damages are added for each wastewater structure, to get tables
+    with a history as in production databases.
+    """
+    rng = random.Random(seed)
+    if os.path.exists(path):
+        os.remove(path)
+
+    sections = _wincan_sections(wincan) if wincan else []
+    reach_count = max(reaches, len(sections))
+
+    def node(identifier):
+        return f"{channel}-{identifier}" if channel else identifier
+
+    def network():
+        yield from sections
+        # further reaches continue the numbering of the nodes, without duplicating a section
+        used = {(from_node, to_node) for from_node, to_node, _ in sections}
+        j = 0
+        while True:
+            nodes = (node_identifier(j), node_identifier(j + 1))
+            if nodes not in used:
+                yield (*nodes, round(rng.uniform(*length_range), 2))
+            j += 1
+
+    def reach_rows():
+        for i, (from_node, to_node, length) in zip(range(reach_count), network()):
+            x0 = 2600000 + (i % 500) * 100
+            y0 = 1200000 + (i // 500) * 20
+            yield (
+                _line_blob(x0, y0, x0 + (length or 0), y0),
+                obj_id("RE", i),
+                f"{node(from_node)}-{node(to_node)}",
+                obj_id("RP", 2 * i),
+                node(from_node),
+                obj_id("RP", 2 * i + 1),
+                node(to_node),
+                length,
+                obj_id("WS", i),
+            )
+
+    def structure_rows():
+        for i in range(reach_count):
+            yield (obj_id("WS", i), f"WS{i}", rng.choice(list(STRUCTURE_CONDITION_CODES.values())))
+
+    connection = sqlite3.connect(path)
+    with connection:
+        _create_gpkg(connection)
+        for key in LAYERS:
+            _create_table(connection, key, index_obj_id)
+        _insert(connection, "reach", reach_rows())
+        _insert(connection, "wastewater_structure", structure_rows())
+        _insert(
+            connection,
+            "vl_damage_channel_channel_damage_code",
+            ((3900 + i, code) for i, code in enumerate(CHANNEL_DAMAGE_CODES)),
+        )
+        _insert(
+            connection,
+            "vl_damage_single_damage_class",
+            ((code, value) for value, code in SINGLE_DAMAGE_CLASS_CODES.items()),
+        )
+        _insert(
+            connection,
+            "vl_wastewater_structure_structure_condition",
+            ((code, value) for value, code in STRUCTURE_CONDITION_CODES.items()),
+        )
+
+        event = 0
+        for i in range(reach_count if existing_events_per_structure else 0):
+            events, joins, damages = [], [], []
+            for _ in range(existing_events_per_structure):
+                event_id = obj_id("ME", event)
+                events.append(
+                    (event_id, "examination", 4564, "operator", "2020-01-01T08:00:00", "",
+                     2550, None, "", None, obj_id("RP", 2 * i), None)
+                )  # fmt: skip
+                joins.append((obj_id("JO", event), obj_id("WS", i), event_id))
+                damages.extend(
+                    (obj_id("DA", event * 3 + d), "channel", "", 3707 + rng.randint(0, 4),
+                     3900 + rng.randrange(len(CHANNEL_DAMAGE_CODES)), d * 10.0, None, event_id)
+                    for d in range(3)
+                )  # fmt: skip
+                event += 1
+            _insert(connection, "maintenance", events)
+            _insert(connection, "join", joins)
+            _insert(connection, "damage", damages)
+    connection.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path", help="GeoPackage to write, replaced if it exists")
+    parser.add_argument("--reaches", type=int, default=10000, help="size of the network")
+    parser.add_argument("--wincan", help="WinCan database whose sections get a reach")
+    parser.add_argument("--channel", default="", help="channel prefix of the node identifiers")
+    parser.add_argument(
+        "--existing-events",
+        type=int,
+        default=0,
+        help="maintenance events already present for each wastewater structure",
+    )
+    parser.add_argument(
+        "--length-range", type=float, nargs=2, default=(10.0, 80.0), metavar=("MIN", "MAX")
+    )
+    parser.add_argument(
+        "--no-index", action="store_true", help="do not index obj_id, as on plain views"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = generate_teksi_gpkg(
+        args.path,
+        reaches=args.reaches,
+        wincan=args.wincan,
+        channel=args.channel,
+        existing_events_per_structure=args.existing_events,
+        length_range=tuple(args.length_range),
+        index_obj_id=not args.no_index,
+        seed=args.seed,
+    )
+    print(f"written {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Generator of synthetic WinCan VX data for scale testing.
+
+Writes the database and its _meta database in the layout of a WinCan export,
+optionally with the PDF report and placeholder media files:
+
+    root/DB/<name>.db3
+    root/DB/<name>_meta.db3
+    root/Misc/Docu/<name>.pdf
+    root/Picture/Sec/<files>
+    root/Video/Sec/<files>
+
+Only the Python standard library is used:
+
+    python benchmarks/generate_wincan_db3.py /tmp/wincan --sections 5000 --pdf --media 1 --media-files
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+CHANNEL_DAMAGE_CODES = (
+    "BAA", "BAB", "BABA", "BABB", "BABC", "BAC", "BACA", "BAD", "BAE", "BAF", "BAGA", "BAH",
+    "BAI", "BAJ", "BBA", "BBB", "BBC", "BCA", "BCB", "BCC", "BDA", "BDB", "BDC", "BDD", "BDE",
+)  # fmt: skip
+# codes not known by the VSA value lists, as found in real data
+UNKNOWN_CODES = ("BXX", "ZZZ")
+START_CODE = "BCD"
+END_CODE = "BCE"
+
+SCHEMA = """
+CREATE TABLE PROJECT (
+    PRJ_PK TEXT PRIMARY KEY, PRJ_Key TEXT, PRJ_Date TEXT, PRJ_Client TEXT, PRJ_Deleted TEXT
+);
+CREATE TABLE NODE (
+    OBJ_PK TEXT PRIMARY KEY, OBJ_Key TEXT, OBJ_Project_FK TEXT, OBJ_Type TEXT, OBJ_Deleted TEXT
+);
+CREATE TABLE SECTION (
+    OBJ_PK TEXT PRIMARY KEY, OBJ_Key TEXT, OBJ_Project_FK TEXT, OBJ_Length REAL,
+    OBJ_Size1 INTEGER, OBJ_Size2 INTEGER, OBJ_Material TEXT, OBJ_FlowDir INTEGER,
+    OBJ_FromNode_REF TEXT, OBJ_ToNode_REF TEXT, OBJ_City TEXT, OBJ_Street TEXT,
+    OBJ_SortOrder INTEGER, OBJ_Deleted TEXT
+);
+CREATE TABLE SECINSP (
+    INS_PK TEXT PRIMARY KEY, INS_Key TEXT, INS_Section_FK TEXT, INS_Type TEXT,
+    INS_InspectionDir INTEGER, INS_InspectedLength REAL, INS_HighestGrade TEXT,
+    INS_StartDate TEXT, INS_Method TEXT, INS_Operator_REF TEXT, INS_Deleted TEXT
+);
+CREATE TABLE SECOBS (
+    OBS_PK TEXT PRIMARY KEY, OBS_Inspection_FK TEXT, OBS_Distance REAL, OBS_OpCode TEXT,
+    OBS_Observation TEXT, OBS_TimeCtr TEXT, OBS_ClockPos1 INTEGER, OBS_ClockPos2 INTEGER,
+    OBS_Q1_Value TEXT, OBS_U1_Value TEXT, OBS_Q2_Value TEXT, OBS_U2_Value TEXT,
+    OBS_Q3_Value TEXT, OBS_U3_Value TEXT, OBS_RateValue INTEGER, OBS_Memo TEXT,
+    OBS_Deleted TEXT
+);
+CREATE TABLE SECOBSMM (
+    OMM_PK TEXT PRIMARY KEY, OMM_Observation_FK TEXT, OMM_Type TEXT, OMM_FileName TEXT,
+    OMM_Deleted TEXT
+);
+"""
+
+META_SCHEMA = """
+CREATE TABLE OPERATOR (
+    OP_PK TEXT PRIMARY KEY, OP_Key TEXT, OP_Name1 TEXT, OP_Deleted TEXT
+);
+"""
+
+
+def node_identifier(index: int) -> str:
+    return f"N{index:06d}"
+
+
+class _Generator:
+    def __init__(self, seed: int, deleted_ratio: float):
+        self.rng = random.Random(seed)
+        self.deleted_ratio = deleted_ratio
+        self.deleted_at = "2024-06-01 12:00:00"
+
+    def pk(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128))).upper()
+
+    def deleted(self):
+        """
+        Returns the value of the deleted column of a new row
+        """
+        if self.deleted_ratio and self.rng.random() < self.deleted_ratio:
+            return self.deleted_at
+        return None
+
+    def observations(self, length: float, count: int) -> list:
+        """
+        Returns (distance, code, rate) of the observations of an inspection,
+        starting with the start code and ending with the end code as WinCan does
+        """
+        if count == 1:
+            return [(0.0, START_CODE, None)]
+        observations = [(0.0, START_CODE, None)]
+        for distance in sorted(self.rng.uniform(0, length) for _ in range(count - 2)):
+            if self.rng.random() < 0.02:
+                code = self.rng.choice(UNKNOWN_CODES)
+            else:
+                code = self.rng.choice(CHANNEL_DAMAGE_CODES)
+            observations.append((round(distance, 2), code, self.rng.choice((None, 1, 2, 3, 4))))
+        observations.append((round(length, 2), END_CODE, None))
+        return observations
+
+
+def _write_pdf(path: str, pages: list):
+    """
+    Writes a minimal PDF with one text line per entry of each page
+    """
+
+    def escape(text):
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = []  # object bodies, object i + 1
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # set once the pages are known
+    pages_object = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_objects = []
+    for lines in pages:
+        content = "BT /F1 10 Tf 50 800 Td 14 TL\n"
+        content += "".join(f"({escape(line)}) Tj T*\n" for line in lines)
+        content += "ET"
+        data = content.encode("latin-1", "replace")
+        stream = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(data), data))
+        page_objects.append(
+            add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+                b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                % (pages_object, font, stream)
+            )
+        )
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_object
+    objects[pages_object - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page for page in page_objects),
+        len(page_objects),
+    )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        catalog,
+        xref,
+    )
+    with open(path, "wb") as f:
+        f.write(output)
+
+
+def _write_report(path: str, sections: list, lines_per_page: int = 50):
+    """
+    Writes a report with a table of contents listing the sections and one page per section
+    sections is a list of (counter, from node, to node)
+    """
+    toc_lines = [
+        f"Section: {counter}; {from_node} - {to_node} {page}"
+        for page, (counter, from_node, to_node) in enumerate(sections, start=1)
+    ]
+    pages = []
+    for start in range(0, max(len(toc_lines), 1), lines_per_page):
+        pages.append(["Table of Contents"] + toc_lines[start : start + lines_per_page])
+    for page, (counter, from_node, to_node) in enumerate(sections, start=1):
+        pages.append([f"Section {counter}: {from_node} - {to_node}", f"Page {page}"])
+    _write_pdf(path, pages)
+
+
+def generate_wincan_db3(
+    root: str,
+    name: str = "inspection",
+    projects: int = 1,
+    sections: int = 100,
+    inspections_per_section: int = 1,
+    observations_per_inspection: int = 10,
+    media_per_observation: int = 1,
+    deleted_ratio: float = 0.0,
+    length_range: tuple = (10.0, 80.0),
+    pdf: bool = False,
+    media: bool = False,
+    seed: int = 0,
+) -> str:
+    """
+    Writes a WinCan VX database in root/DB and returns its path
+
+    Section i of all projects goes from node i to node i + 1 (see node_identifier).
+    deleted_ratio is the share of the projects, sections, inspections, observations
+    and media rows which are marked as deleted.
+    """
+    generator = _Generator(seed, deleted_ratio)
+    db_dir = os.path.join(root, "DB")
+    os.makedirs(db_dir, exist_ok=True)
+    path = os.path.join(db_dir, f"{name}.db3")
+    meta_path = os.path.join(db_dir, f"{name}_meta.db3")
+    for existing in (path, meta_path):
+        if os.path.exists(existing):
+            os.remove(existing)
+
+    operators = [(generator.pk(), f"OP{i}", f"Operator {i}") for i in range(3)]
+    with sqlite3.connect(meta_path) as meta:
+        meta.executescript(META_SCHEMA)
+        meta.executemany("INSERT INTO OPERATOR VALUES (?, ?, ?, NULL)", operators)
+    meta.close()
+
+    report_sections = []
+    media_files = []
+    start_date = datetime(2024, 5, 1, 8, 0)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.executescript(SCHEMA)
+        nodes = [generator.pk() for _ in range(sections + 1)]
+        section_index = 0
+        for p in range(projects):
+            project_pk = generator.pk()
+            connection.execute(
+                "INSERT INTO PROJECT VALUES (?, ?, ?, 'Client', NULL)",
+                (project_pk, f"{name} {p + 1}", start_date.strftime("%Y-%m-%d %H:%M:%S")),
+            )
+            project_sections = sections // projects + (1 if p < sections % projects else 0)
+            for _ in range(project_sections):
+                for index in (section_index, section_index + 1):
+                    connection.execute(
+                        "INSERT OR IGNORE INTO NODE VALUES (?, ?, ?, 'Manhole', NULL)",
+                        (nodes[index], node_identifier(index), project_pk),
+                    )
+                section_pk = generator.pk()
+                length = round(generator.rng.uniform(*length_range), 2)
+                counter = section_index + 1
+                section_deleted = generator.deleted()
+                connection.execute(
+                    "INSERT INTO SECTION VALUES (?, ?, ?, ?, 300, 300, 'PVC', 1, ?, ?, 'City',"
+                    " 'Street', ?, ?)",
+                    (
+                        section_pk,
+                        f"{node_identifier(section_index)}-{node_identifier(section_index + 1)}",
+                        project_pk,
+                        length,
+                        nodes[section_index],
+                        nodes[section_index + 1],
+                        counter,
+                        section_deleted,
+                    ),
+                )
+                if section_deleted is None:
+                    report_sections.append(
+                        (
+                            counter,
+                            node_identifier(section_index),
+                            node_identifier(section_index + 1),
+                        )
+                    )
+                for i in range(inspections_per_section):
+                    inspection_pk = generator.pk()
+                    date = start_date + timedelta(minutes=section_index * 20 + i)
+                    connection.execute(
+                        "INSERT INTO SECINSP VALUES (?, ?, ?, 'TV', 1, ?, NULL, ?, 'TV', ?, ?)",
+                        (
+                            inspection_pk,
+                            f"{counter}.{i + 1}",
+                            section_pk,
+                            length,
+                            date.strftime("%Y-%m-%d %H:%M:%S.000"),
+                            generator.rng.choice(operators)[0],
+                            generator.deleted(),
+                        ),
+                    )
+                    video = f"{inspection_pk}.mpg"
+                    observations = generator.observations(length, observations_per_inspection)
+                    observation_rows = []
+                    media_rows = []
+                    for o, (distance, code, rate) in enumerate(observations):
+                        observation_pk = generator.pk()
+                        observation_rows.append(
+                            (
+                                observation_pk,
+                                inspection_pk,
+                                distance,
+                                code,
+                                f"observation {code}",
+                                f"00:{o // 60:02d}:{o % 60:02d}",
+                                generator.rng.randint(1, 12),
+                                rate,
+                                generator.deleted(),
+                            )
+                        )
+                        for m in range(media_per_observation):
+                            if m == 0 and o == 0:
+                                file_type, file_name = "MPG", video
+                            else:
+                                file_type, file_name = "PI1", f"{observation_pk}_{m}.jpg"
+                            media_rows.append(
+                                (generator.pk(), observation_pk, file_type, file_name)
+                            )
+                            media_files.append(
+                                ("Video" if file_type == "MPG" else "Picture", file_name)
+                            )
+                    connection.executemany(
+                        "INSERT INTO SECOBS VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, NULL, NULL,"
+                        " NULL, NULL, NULL, ?, NULL, ?)",
+                        observation_rows,
+                    )
+                    connection.executemany(
+                        "INSERT INTO SECOBSMM VALUES (?, ?, ?, ?, ?)",
+                        (row + (generator.deleted(),) for row in media_rows),
+                    )
+                section_index += 1
+        if deleted_ratio:
+            connection.execute(
+                "INSERT INTO PROJECT VALUES (?, 'deleted project', ?, 'Client', ?)",
+                (generator.pk(), start_date.strftime("%Y-%m-%d %H:%M:%S"), generator.deleted_at),
+            )
+    connection.close()
+
+    if pdf:
+        docu_dir = os.path.join(root, "Misc", "Docu")
+        os.makedirs(docu_dir, exist_ok=True)
+        _write_report(os.path.join(docu_dir, f"{name}.pdf"), report_sections)
+
+    if media:
+        for folder, file_name in media_files:
+            media_dir = os.path.join(root, folder, "Sec")
+            os.makedirs(media_dir, exist_ok=True)
+            open(os.path.join(media_dir, file_name), "wb").close()
+
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root", help="directory of the generated export")
+    parser.add_argument("--name", default="inspection")
+    parser.add_argument("--projects", type=int, default=1)
+    parser.add_argument("--sections", type=int, default=100)
+    parser.add_argument("--inspections", type=int, default=1, help="inspections per section")
+    parser.add_argument("--observations", type=int, default=10, help="observations per inspection")
+    parser.add_argument("--media", type=int, default=1, help="media per observation")
+    parser.add_argument(
+        "--deleted-ratio", type=float, default=0.0, help="share of rows marked as deleted"
+    )
+    parser.add_argument(
+        "--length-range", type=float, nargs=2, default=(10.0, 80.0), metavar=("MIN", "MAX")
+    )
+    parser.add_argument("--pdf", action="store_true", help="write the PDF report")
+    parser.add_argument("--media-files", action="store_true", help="write placeholder media")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = generate_wincan_db3(
+        args.root,
+        name=args.name,
+        projects=args.projects,
+        sections=args.sections,
+        inspections_per_section=args.inspections,
+        observations_per_inspection=args.observations,
+        media_per_observation=args.media,
+        deleted_ratio=args.deleted_ratio,
+        length_range=tuple(args.length_range),
+        pdf=args.pdf,
+        media=args.media_files,
+        seed=args.seed,
+    )
+    print(f"written {path}")
+
+
+if __name__ == "__main__":
+    main()
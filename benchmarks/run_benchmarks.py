@@ -0,0 +1,237 @@
+"""
+Benchmark suite of the reader, the channel matching, the import and the undo.
+
+Runs headless with qgis.core only, on a generated WinCan database and
+GeoPackage stand-ins of the TEKSI layers:
+
+    python benchmarks/run_benchmarks.py --size small
+    python benchmarks/run_benchmarks.py --size medium --output medium.json
+    python benchmarks/run_benchmarks.py --size medium --baseline medium.json
+
+Each benchmark reports its wall time, the layer requests made through
+core.layer_access, the SQLite statements and the peak memory allocated by Python.
+With --baseline, the results are compared with a previous --output and the
+script exits with an error if there are regressions beyond the tolerance.
+
+The import benchmark reproduces the lookups of the data browser import
+(reach, value lists, structure condition) without its dialogs.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import uuid
+
+from common import Measurement, compare_with_baseline, print_results, save_results, start_qgis
+from fixtures import create_teksi_gpkg
+from generate_wincan_db3 import generate_wincan_db3
+
+from qgis.core import QgsFeatureRequest, QgsProject
+
+from wincan2teksi.core.distance import distribute_distances
+from wincan2teksi.core.import_plan import ImportPlan
+from wincan2teksi.core.layer_access import get_feature
+from wincan2teksi.core.read_data import read_data
+from wincan2teksi.core.section import find_section, section_at_id
+from wincan2teksi.core.settings import Settings
+from wincan2teksi.core.undo import deletion_plan, delete_features
+from wincan2teksi.core.vsacode import (
+    damage_code_to_vl,
+    damage_level_2_structure_condition,
+    damage_level_to_vl,
+    structure_condition_2_damage_level,
+)
+from wincan2teksi.core.writers import LayerImportWriter, SqliteImportWriter
+
+SIZES = {
+    "small": {"sections": 200, "observations": 10, "reaches": 10_000},
+    "medium": {"sections": 1_000, "observations": 20, "reaches": 50_000},
+    "large": {"sections": 5_000, "observations": 20, "reaches": 200_000},
+}
+
+# plugin setting -> stand-in layer
+LAYER_SETTINGS = {
+    "channel_layer": "reach",
+    "wastewater_structure_layer": "wastewater_structure",
+    "maintenance_layer": "maintenance",
+    "damage_layer": "damage",
+    "file_layer": "file",
+    "join_maintence_wastewaterstructure_layer": "join",
+    "vl_damage_channel_layer": "vl_damage_channel_channel_damage_code",
+    "vl_damage_single_class": "vl_damage_single_damage_class",
+    "vl_wastewater_structure_structure_condition": "vl_wastewater_structure_structure_condition",
+}
+
+
+class BenchmarkLayerWriter(LayerImportWriter):
+    """
+    The GeoPackage stand-ins have no default value for obj_id, unlike the TEKSI views
+    """
+
+    def new_obj_id(self, layer):
+        return uuid.uuid4().hex[:16]
+
+
+def setup_layers(layers: dict):
+    settings = Settings()
+    for setting_key, name in LAYER_SETTINGS.items():
+        QgsProject.instance().addMapLayer(layers[name], False)
+        getattr(settings, setting_key).setValue(layers[name].id())
+
+
+def match_sections(data):
+    for project in data.projects.values():
+        for section in project.sections.values():
+            feature = find_section("", section.from_node, section.to_node)
+            if feature.isValid():
+                section.teksi_channel_id_1 = feature["obj_id"]
+
+
+def prepare_import(data, layers: dict, writer) -> ImportPlan:
+    plan = ImportPlan(
+        {
+            ImportPlan.MAINTENANCE: layers["maintenance"],
+            ImportPlan.DAMAGE: layers["damage"],
+            ImportPlan.FILE: layers["file"],
+            ImportPlan.JOIN: layers["join"],
+        },
+        layers["wastewater_structure"],
+    )
+    for project in data.projects.values():
+        for section in project.sections.values():
+            if section.teksi_channel_id_1 is None:
+                continue
+            reach = section_at_id(section.teksi_channel_id_1)
+            ws_obj_id = reach["ws_obj_id"]
+            for inspection in section.inspections.values():
+                maintenance = plan.new_feature(
+                    ImportPlan.MAINTENANCE, writer.new_obj_id(layers["maintenance"])
+                )
+                maintenance["maintenance_event_type"] = "examination"
+                maintenance["fk_reach_point"] = reach["rp_from_obj_id"]
+                plan.add_feature(ImportPlan.MAINTENANCE, maintenance)
+
+                observations = list(inspection.observations.values())
+                placements, _ = distribute_distances(
+                    [o.distance for o in observations], [reach["length_effective"]]
+                )
+                structure_condition = 4
+                for observation, (_, distance) in zip(observations, placements):
+                    damage = plan.new_feature(
+                        ImportPlan.DAMAGE, writer.new_obj_id(layers["damage"])
+                    )
+                    damage["damage_type"] = "channel"
+                    damage["single_damage_class"] = damage_level_to_vl(observation.rate) or 4561
+                    damage["channel_damage_code"] = damage_code_to_vl(observation.code)
+                    damage["distance"] = distance
+                    damage["fk_examination"] = maintenance["obj_id"]
+                    plan.add_feature(ImportPlan.DAMAGE, damage)
+                    for _kind, file_name in observation.mmfiles:
+                        media = plan.new_feature(ImportPlan.FILE, writer.new_obj_id(layers["file"]))
+                        media["object"] = damage["obj_id"]
+                        media["identifier"] = file_name
+                        plan.add_feature(ImportPlan.FILE, media)
+                    if observation.rate is not None:
+                        structure_condition = min(structure_condition, observation.rate)
+
+                join = plan.new_feature(ImportPlan.JOIN, writer.new_obj_id(layers["join"]))
+                join["fk_wastewater_structure"] = ws_obj_id
+                join["fk_maintenance_event"] = maintenance["obj_id"]
+                plan.add_feature(ImportPlan.JOIN, join)
+
+                request = QgsFeatureRequest().setFilterExpression(f"\"obj_id\" = '{ws_obj_id}'")
+                structure = get_feature(layers["wastewater_structure"], request, "benchmark")
+                if structure.isValid():
+                    old_level = structure_condition_2_damage_level(structure["structure_condition"])
+                    if old_level is None or old_level > f"Z{structure_condition}":
+                        plan.structure_conditions[ws_obj_id] = (
+                            structure.id(),
+                            damage_level_2_structure_condition(structure_condition),
+                        )
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=SIZES, default="small")
+    parser.add_argument("--backend", choices=("layers", "sqlite"), default="layers")
+    parser.add_argument(
+        "--stage", action="store_true", help="read a local, indexed copy of the WinCan database"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results with this JSON file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed time and memory increase (ratio)"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="do not trace memory, which slows down Python"
+    )
+    args = parser.parse_args()
+    size = SIZES[args.size]
+    trace_memory = not args.no_memory
+
+    app = start_qgis()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db3_path = generate_wincan_db3(
+            tmp_dir, sections=size["sections"], observations_per_inspection=size["observations"]
+        )
+        layers = create_teksi_gpkg(
+            os.path.join(tmp_dir, "teksi.gpkg"), size["reaches"], wincan=db3_path
+        )
+        setup_layers(layers)
+
+        with Measurement("read", trace_memory) as measurement:
+            data = read_data(db3_path, stage_locally=args.stage)
+        results["read"] = measurement.result
+
+        with Measurement("match", trace_memory) as measurement:
+            match_sections(data)
+        results["match"] = measurement.result
+
+        if args.backend == "sqlite":
+            writer = SqliteImportWriter(list(layers.values()))
+        else:
+            writer = BenchmarkLayerWriter(list(layers.values()))
+        with Measurement("import: prepare", trace_memory) as measurement:
+            plan = prepare_import(data, layers, writer)
+        results["import: prepare"] = measurement.result
+
+        with Measurement(f"import: write ({writer.name})", trace_memory) as measurement:
+            added_features = writer.write(plan)
+        results[f"import: write ({writer.name})"] = measurement.result
+        writer.close()
+
+        features = {
+            QgsProject.instance().mapLayer(layer_id).name(): {
+                "layer_id": layer_id,
+                "obj_ids": obj_ids,
+            }
+            for layer_id, obj_ids in added_features.items()
+        }
+        with Measurement("undo", trace_memory) as measurement:
+            delete_features(deletion_plan(features))
+        results["undo"] = measurement.result
+
+        QgsProject.instance().removeAllMapLayers()
+
+    print(f"size: {args.size} ({size})")
+    print_results(results)
+    if args.output:
+        save_results(args.output, results)
+
+    regressions = []
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if not regressions:
+            print("no regression compared to the baseline")
+
+    app.exitQgis()
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Compiles the .ui files of the plugin to Python modules (wincan2teksi/ui/ui_<name>.py).
+
+The generated modules are committed, so that the plugin imports its forms directly
+instead of parsing their XML with loadUiType each time QGIS starts. Run this script
+after editing a .ui file, it requires PyQt6:
+
+    python scripts/compile_ui.py
+    python scripts/compile_ui.py --check
+
+The code is generated with fully scoped enums, which PyQt5 accepts as well. Qt is
+imported from qgis.PyQt and the QGIS widgets from qgis.gui. Each module records the
+sha256 of its .ui file, so that --check (and the tests) can tell if it is outdated
+without PyQt.
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import os
+import re
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+UI_DIR = os.path.join(ROOT, "wincan2teksi", "ui")
+
+HEADER = """# Generated from {ui_file} by scripts/compile_ui.py, do not edit.
+# ui sha256: {digest}
+
+"""
+
+
+def ui_digest(ui_path: str) -> str:
+    # line endings are normalized, they depend on the git configuration on Windows
+    with open(ui_path, "rb") as f:
+        return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def module_path(ui_path: str) -> str:
+    name = os.path.splitext(os.path.basename(ui_path))[0]
+    return os.path.join(os.path.dirname(ui_path), f"ui_{name}.py")
+
+
+def recorded_digest(path: str) -> str:
+    """
+    Returns the sha256 of the .ui file recorded in a generated module, None if there is none
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("# ui sha256: "):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return None
+
+
+def compile_ui(ui_path: str) -> str:
+    """
+    Returns the code of the module of a .ui file
+    """
+    from PyQt6.uic import compileUi
+
+    buffer = io.StringIO()
+    compileUi(ui_path, buffer)
+    lines = buffer.getvalue().splitlines()
+    # the header of pyuic contains the path of the .ui file and the PyQt version
+    while lines and (not lines[0] or lines[0].startswith("#")):
+        lines.pop(0)
+    code = "\n".join(lines) + "\n"
+    code = code.replace(
+        "from PyQt6 import QtCore, QtGui, QtWidgets",
+        "from qgis.PyQt import QtCore, QtGui, QtWidgets",
+    )
+    # custom widgets declared with their C++ header (e.g. qgscolorbutton.h)
+    code = re.sub(r"^from qgs\w+ import (\w+)$", r"from qgis.gui import \1", code, flags=re.M)
+    header = HEADER.format(ui_file=os.path.basename(ui_path), digest=ui_digest(ui_path))
+    return header + code
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="only report the modules which are outdated"
+    )
+    args = parser.parse_args()
+
+    outdated = []
+    for ui_path in sorted(glob.glob(os.path.join(UI_DIR, "*.ui"))):
+        path = module_path(ui_path)
+        if recorded_digest(path) == ui_digest(ui_path):
+            continue
+        outdated.append(os.path.relpath(path, ROOT))
+        if not args.check:
+            with open(path, "w", encoding="utf-8", newline="\n") as f:
+                f.write(compile_ui(ui_path))
+
+    for path in outdated:
+        print(f"{'outdated' if args.check else 'compiled'}: {path}")
+    return 1 if args.check and outdated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Triage of WinCan VX deliveries from the command line, without QGIS
+
+    python -m wincan2teksi path/to/DB/inspection.db3 --known-codes codes.txt --timings
+
+Reads the database with read_data() and prints a JSON report: the counts of projects,
+sections, inspections and observations, the observation codes, the media files which
+are missing on disk and the matching of the sections with the pages of the PDF report.
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+from wincan2teksi.core import tracing
+from wincan2teksi.core.exceptions import InvalidProjectFile
+from wincan2teksi.core.objects.observation import CODE_PREMATCH
+from wincan2teksi.core.read_data import read_data
+
+# media type -> folder, as imported by the data browser
+MEDIA_FOLDERS = {"picture": "Picture", "video": "Video"}
+
+
+def read_known_codes(path: str) -> set:
+    """
+    Returns the codes of a text file, one per line (e.g. value_en of the damage code value list)
+    """
+    with open(path, encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip() and not line.startswith("#")}
+
+
+def triage(data, data_root: Path, known_codes: set = None) -> dict:
+    """
+    Returns the report of the loaded data, the media files being looked up below data_root
+    """
+    counts = Counter()
+    codes = Counter()
+    missing_media = []
+    unmatched_pdf_sections = []
+    projects = []
+    with tracing.span("triage"):
+        for project in data.projects.values():
+            project_counts = Counter(sections=len(project.sections))
+            for section in project.sections.values():
+                if data.pdf_file and section.pdf_page is None:
+                    unmatched_pdf_sections.append(section.name)
+                project_counts["inspections"] += len(section.inspections)
+                for inspection in section.inspections.values():
+                    project_counts["observations"] += len(inspection.observations)
+                    for observation in inspection.observations.values():
+                        codes[observation.code] += 1
+                        for kind, file_name in observation.mmfiles:
+                            project_counts["media"] += 1
+                            relative_path = Path(MEDIA_FOLDERS[kind], "Sec", file_name)
+                            if not (data_root / relative_path).exists():
+                                missing_media.append(relative_path.as_posix())
+            counts.update(project_counts)
+            projects.append(
+                {
+                    "name": project.name,
+                    "date": project.date.isoformat() if project.date else None,
+                    **project_counts,
+                }
+            )
+
+    unknown_codes = None
+    if known_codes is not None:
+        unknown_codes = {
+            code: count
+            for code, count in codes.items()
+            if CODE_PREMATCH.get(code, code) not in known_codes
+        }
+
+    return {
+        "file": data.file,
+        "meta_file": data.meta_file,
+        "counts": {
+            "projects": len(data.projects),
+            "sections": counts["sections"],
+            "inspections": counts["inspections"],
+            "observations": counts["observations"],
+            "media": counts["media"],
+        },
+        "projects": projects,
+        "codes": dict(codes.most_common()),
+        "unknown_codes": unknown_codes,
+        "missing_media": missing_media,
+        "pdf": {
+            "file": data.pdf_file,
+            "matched_sections": (
+                counts["sections"] - len(unmatched_pdf_sections) if data.pdf_file else 0
+            ),
+            "unmatched_sections": unmatched_pdf_sections,
+        },
+    }
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m wincan2teksi",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("db3", help="WinCan VX database (.db3)")
+    parser.add_argument(
+        "--data-root",
+        help="folder containing Picture and Video, by default the parent of the database folder",
+    )
+    parser.add_argument(
+        "--known-codes",
+        help="file of the known damage codes, one per line, to report the unknown codes",
+    )
+    parser.add_argument(
+        "--stage", action="store_true", help="copy the databases to a local temporary directory"
+    )
+    parser.add_argument("--timings", action="store_true", help="add the time of each stage")
+    parser.add_argument("--trace", help="write the stages to this file in Chrome trace format")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log the reader messages")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.ERROR,
+        format="%(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+    tracing.set_enabled(args.timings or args.trace)
+
+    known_codes = read_known_codes(args.known_codes) if args.known_codes else None
+    try:
+        data = read_data(args.db3, stage_locally=args.stage)
+    except (FileNotFoundError, InvalidProjectFile, sqlite3.DatabaseError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    data_root = Path(args.data_root) if args.data_root else Path(args.db3).resolve().parent.parent
+    report = triage(data, data_root, known_codes)
+    if args.timings:
+        report["timings"] = {
+            "load": data.load_time,
+            "stage": data.stage_time,
+            "stages": tracing.summary(),
+        }
+    if args.trace:
+        tracing.export_chrome_trace(args.trace)
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
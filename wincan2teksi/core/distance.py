@@ -0,0 +1,52 @@
+from bisect import bisect_left
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def distribute_distances(
+    distances: list, reach_lengths: list, tolerance: float = 0, forced: list = None
+) -> tuple:
+    """
+    Places distances measured along consecutive reaches on these reaches
+
+    A distance on the end of a reach stays on this reach. Distances further than the
+    last reach are kept on it if they are within the tolerance, forced distances always are.
+    Distances do not need to be sorted.
+
+    Returns a list with (reach index, distance on the reach) for each distance,
+    None for the distances out of range, and the positions of the distances out of range
+    """
+    if not reach_lengths:
+        raise ValueError("At least one reach is required to distribute distances")
+    if forced is None:
+        forced = [False] * len(distances)
+    lengths = [length or 0 for length in reach_lengths]
+    last = len(lengths) - 1
+
+    if np is not None and len(distances) > 0:
+        ends = np.cumsum(np.asarray(lengths, dtype=float))
+        starts = np.concatenate(([0.0], ends[:-1]))
+        values = np.asarray(distances, dtype=float)
+        indexes = np.minimum(np.searchsorted(ends, values, side="left"), last)
+        offsets = values - starts[indexes]
+        out_of_range = (values > ends[-1] + tolerance) & ~np.asarray(forced, dtype=bool)
+        out_of_range_positions = np.flatnonzero(out_of_range).tolist()
+        placements = list(zip(indexes.tolist(), offsets.tolist()))
+    else:
+        ends = list(accumulate(lengths))
+        starts = [0] + ends[:-1]
+        placements = []
+        out_of_range_positions = []
+        for position, distance in enumerate(distances):
+            index = min(bisect_left(ends, distance), last)
+            if distance > ends[-1] + tolerance and not forced[position]:
+                out_of_range_positions.append(position)
+            placements.append((index, distance - starts[index]))
+
+    for position in out_of_range_positions:
+        placements[position] = None
+    return placements, out_of_range_positions
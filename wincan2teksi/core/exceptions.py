@@ -8,3 +8,9 @@ class InvalidProjectFile(Exception):
     """Raised when the provided project file is invalid or corrupted."""
 
     pass
+
+
+class ImportWriteError(Exception):
+    """Raised when the features of an import could not be written."""
+
+    pass
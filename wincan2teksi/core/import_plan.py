@@ -0,0 +1,92 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from qgis.core import QgsFeature
+
+
+class ImportPlan:
+    """
+    Features to be written by an import, grouped by target layer
+
+    Features are created with their obj_id, so that the relations between
+    maintenance events, damages, files and joins are set before writing.
+    """
+
+    MAINTENANCE = "maintenance"
+    DAMAGE = "damage"
+    FILE = "file"
+    JOIN = "join"
+    # writing order: parents first
+    LAYER_KEYS = (MAINTENANCE, DAMAGE, FILE, JOIN)
+
+    def __init__(self, layers: dict, wastewater_structure_layer=None):
+        self.layers = layers
+        self.wastewater_structure_layer = wastewater_structure_layer
+        self.features = {key: [] for key in self.LAYER_KEYS}
+        # wastewater structure obj_id → (feature id, structure condition code)
+        self.structure_conditions = {}
+
+    def ordered_layers(self) -> list:
+        """
+        Returns the layers written by the import, parents first
+        """
+        layers = [self.layers[key] for key in self.LAYER_KEYS]
+        if self.wastewater_structure_layer is not None:
+            layers.append(self.wastewater_structure_layer)
+        return layers
+
+    def new_feature(self, key: str, obj_id) -> QgsFeature:
+        feature = QgsFeature(self.layers[key].fields())
+        feature["obj_id"] = obj_id
+        return feature
+
+    def add_feature(self, key: str, feature: QgsFeature):
+        self.features[key].append(feature)
+
+    def feature_count(self) -> int:
+        return sum(len(features) for features in self.features.values()) + len(
+            self.structure_conditions
+        )
+
+
+class ImportStatistics:
+    """
+    Timings and issues collected while preparing an import
+
+    In a dry run, distance issues, unresolved codes and missing media files are only
+    recorded instead of aborting or prompting the user, and nothing is written.
+    """
+
+    REACH_ASSIGNMENT = "reach assignment"
+    DISTANCE_DISTRIBUTION = "distance distribution"
+    CODE_TRANSLATION = "code translation"
+    MEDIA_RESOLUTION = "media resolution"
+    STRUCTURE_CONDITION = "structure condition"
+    STAGES = (
+        REACH_ASSIGNMENT,
+        DISTANCE_DISTRIBUTION,
+        CODE_TRANSLATION,
+        MEDIA_RESOLUTION,
+        STRUCTURE_CONDITION,
+    )
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.stage_times = {stage: 0.0 for stage in self.STAGES}
+        # (kind, value) → number of observations, kind being "level" or "code"
+        self.unresolved_codes = Counter()
+        self.missing_media = []
+        # DistanceIssue of the inspections with observations out of range
+        self.distance_issues = []
+
+    @contextmanager
+    def timed(self, stage: str):
+        """
+        Adds the time spent in the block to the given stage
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_times[stage] = self.stage_times.get(stage, 0.0) + time.perf_counter() - start
@@ -0,0 +1,137 @@
+"""
+Central access to the features of the layers
+
+All the feature requests of the plugin go through get_features() or get_feature(),
+which count the requests per layer and per call site, time them and log the requests
+slower than the configured threshold.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+
+from qgis.core import QgsFeature, QgsFeatureRequest
+
+from wincan2teksi.core import tracing
+from wincan2teksi.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_statistics = {}  # (layer name, site) -> {"count", "features", "total", "max"}
+_slow_query_threshold_ms = None  # read from the settings on first use
+
+
+def slow_query_threshold_ms() -> float:
+    global _slow_query_threshold_ms
+    if _slow_query_threshold_ms is None:
+        _slow_query_threshold_ms = Settings().slow_query_threshold_ms.value()
+    return _slow_query_threshold_ms
+
+
+def set_slow_query_threshold_ms(threshold: float):
+    """
+    Sets the duration above which requests are logged, 0 disables the log
+    """
+    global _slow_query_threshold_ms
+    _slow_query_threshold_ms = threshold
+
+
+def get_features(layer, request: QgsFeatureRequest = None, site: str = "") -> Iterator[QgsFeature]:
+    """
+    Yields the features of the request from the layer
+    Only the fetching of the features is timed, not the work of the caller between them,
+    and the request is recorded once the iteration is exhausted or closed
+    site names the caller in the statistics and the slow request log
+    """
+    if request is None:
+        request = QgsFeatureRequest()
+    start = time.perf_counter()
+    duration = 0.0
+    feature_count = 0
+    try:
+        iterator = iter(layer.getFeatures(request))
+        duration = time.perf_counter() - start
+        while True:
+            fetch_start = time.perf_counter()
+            feature = next(iterator, None)
+            duration += time.perf_counter() - fetch_start
+            if feature is None:
+                break
+            feature_count += 1
+            yield feature
+    finally:
+        tracing.add_span(
+            "layer request", start, duration, layer=layer.name(), site=site, features=feature_count
+        )
+        _record(layer, request, site, duration, feature_count)
+
+
+def get_feature(layer, request: QgsFeatureRequest, site: str = "") -> QgsFeature:
+    """
+    Returns the first feature of the request, or an invalid feature if there is none
+    The request of the caller is not modified
+    """
+    request = QgsFeatureRequest(request)
+    request.setLimit(1)
+    features = get_features(layer, request, site)
+    try:
+        return next(features, QgsFeature())
+    finally:
+        features.close()
+
+
+def _record(layer, request, site, duration, feature_count):
+    key = (layer.name(), site)
+    with _lock:
+        entry = _statistics.get(key)
+        if entry is None:
+            entry = _statistics[key] = {"count": 0, "features": 0, "total": 0.0, "max": 0.0}
+        entry["count"] += 1
+        entry["features"] += feature_count
+        entry["total"] += duration
+        entry["max"] = max(entry["max"], duration)
+
+    threshold = slow_query_threshold_ms()
+    if threshold and duration * 1000 > threshold:
+        expression = request.filterExpression()
+        logger.warning(
+            f"Slow request on {layer.name()} ({site or 'unknown site'}):"
+            f" {duration * 1000:.0f} ms for {feature_count} feature(s),"
+            f" provider: {layer.providerType()},"
+            f" filter: {expression.expression() if expression else 'none'}"
+        )
+
+
+def statistics() -> dict:
+    """
+    Returns a copy of the request statistics by (layer name, site)
+    """
+    with _lock:
+        return {key: dict(entry) for key, entry in _statistics.items()}
+
+
+def reset_statistics():
+    with _lock:
+        _statistics.clear()
+
+
+def log_statistics():
+    """
+    Logs the request statistics, the most expensive call sites first
+    """
+    entries = sorted(statistics().items(), key=lambda item: item[1]["total"], reverse=True)
+    if not entries:
+        logger.info("No layer request recorded")
+        return
+    total_count = sum(entry["count"] for _, entry in entries)
+    total_time = sum(entry["total"] for _, entry in entries)
+    logger.info(f"Layer requests: {total_count} request(s), {total_time:.3f} s")
+    for (layer_name, site), entry in entries:
+        logger.info(
+            f"  {layer_name} ({site or 'unknown site'}): {entry['count']} request(s),"
+            f" {entry['features']} feature(s), total {entry['total']:.3f} s,"
+            f" mean {entry['total'] / entry['count'] * 1000:.1f} ms,"
+            f" max {entry['max'] * 1000:.1f} ms"
+        )
@@ -26,27 +26,173 @@
 # ---------------------------------------------------------------------
 
 import logging
+import time
+from contextlib import contextmanager
 
-from qgis.core import QgsEditError
+from qgis.core import QgsEditError, QgsProject, QgsTransaction, QgsTransactionGroup
 
 logger = logging.getLogger(__name__)
 
 
-class edit(object):
+class EditStatistics:
+    """
+    Records per layer the edits made during edit sessions, the time spent in
+    startEditing and commitChanges and the commit errors
+
+    The edits are taken from the edit buffer just before committing. In transaction
+    mode, the edit buffer is bypassed and the edits are counted from the layer signals
+    instead. Edited features are counted once, whatever the number of changed values.
+    """
+
+    def __init__(self):
+        self.layers = {}  # layer id -> statistics of the layer
+        self._connections = {}  # layer id -> list of (signal, slot)
+        self._watch_counts = {}  # layer id -> number of edit sessions watching the layer
+
+    def _entry(self, layer) -> dict:
+        entry = self.layers.get(layer.id())
+        if entry is None:
+            entry = self.layers[layer.id()] = {
+                "layer": layer.name(),
+                "provider": layer.providerType(),
+                "added": 0,
+                "changed": 0,
+                "deleted": 0,
+                "start_editing": 0.0,
+                "commit": 0.0,
+                "errors": [],
+            }
+        return entry
+
+    @staticmethod
+    def _in_transaction(layer) -> bool:
+        provider = layer.dataProvider()
+        return provider is not None and provider.transaction() is not None
+
+    def watch(self, layer):
+        """
+        Starts counting the edits of the layer made in transaction mode
+        Nested edit sessions each watch the layer, the signals are only disconnected
+        once all of them have called unwatch()
+        """
+        count = self._watch_counts.get(layer.id(), 0)
+        self._watch_counts[layer.id()] = count + 1
+        if count > 0:
+            return
+        entry = self._entry(layer)
+        changed_fids = set()
+
+        # in buffered mode, the edits are taken from the edit buffer by record_edit_buffer
+        def added(fid):
+            if self._in_transaction(layer):
+                entry["added"] += 1
+
+        def changed(fid, *args):
+            if self._in_transaction(layer) and fid not in changed_fids:
+                changed_fids.add(fid)
+                entry["changed"] += 1
+
+        def deleted(fid):
+            if self._in_transaction(layer):
+                entry["deleted"] += 1
+
+        connections = [
+            (layer.featureAdded, added),
+            (layer.attributeValueChanged, changed),
+            (layer.geometryChanged, changed),
+            (layer.featureDeleted, deleted),
+        ]
+        for signal, slot in connections:
+            signal.connect(slot)
+        self._connections[layer.id()] = connections
+
+    def unwatch(self, layer):
+        count = self._watch_counts.get(layer.id(), 0) - 1
+        if count > 0:
+            self._watch_counts[layer.id()] = count
+            return
+        self._watch_counts.pop(layer.id(), None)
+        for signal, slot in self._connections.pop(layer.id(), []):
+            signal.disconnect(slot)
+
+    def record_edit_buffer(self, layer):
+        """
+        Adds the edits of the edit buffer of the layer, to be called before committing
+        Does nothing in transaction mode, where the edits are counted from the signals
+        """
+        buffer = layer.editBuffer()
+        if buffer is None or self._in_transaction(layer):
+            return
+        entry = self._entry(layer)
+        entry["added"] += len(buffer.addedFeatures())
+        entry["changed"] += len(
+            set(buffer.changedAttributeValues()) | set(buffer.changedGeometries())
+        )
+        entry["deleted"] += len(buffer.deletedFeatureIds())
+
+    @contextmanager
+    def timed(self, layer, key: str):
+        """
+        Adds the time spent in the block to the given key ("start_editing" or "commit")
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._entry(layer)[key] += time.perf_counter() - start
+
+    def add_errors(self, layer, errors):
+        self._entry(layer)["errors"].extend(errors)
+
+    def summary(self) -> list:
+        """
+        Returns the statistics of the layers as a list of dicts
+        """
+        return [dict(entry, errors=list(entry["errors"])) for entry in self.layers.values()]
+
+    def log_summary(self, title: str):
+        for entry in self.summary():
+            logger.info(
+                f"{title}: {entry['layer']} ({entry['provider']}):"
+                f" {entry['added']} added, {entry['changed']} changed, {entry['deleted']} deleted,"
+                f" start editing {entry['start_editing']:.3f} s, commit {entry['commit']:.3f} s"
+                + (f", {len(entry['errors'])} commit error(s)" if entry["errors"] else "")
+            )
+
+
+def _record_edit_buffer(statistics, layer):
+    if statistics is not None:
+        statistics.record_edit_buffer(layer)
+
+
+@contextmanager
+def _timed(statistics, layer, key):
+    if statistics is None:
+        yield
+    else:
+        with statistics.timed(layer, key):
+            yield
+
+
+class edit:
     """
     This is a modification of qgis.core.edit
     It can be used both in transaction and standard mode
     """
 
-    def __init__(self, layer):
+    def __init__(self, layer, statistics: EditStatistics = None):
         self.layer = layer
+        self.statistics = statistics
 
     def __enter__(self):
+        if self.statistics is not None:
+            self.statistics.watch(self.layer)
         # allow combination of nested `with edit(layer)`
         # startEditing returns false in case of transaction groups
         if not self.layer.isEditable():
             logger.debug("making {} editable".format(self.layer.id()))
-            assert self.layer.startEditing()
+            with _timed(self.statistics, self.layer, "start_editing"):
+                assert self.layer.startEditing()
         return self.layer
 
     def __exit__(self, ex_type, ex_value, traceback):
@@ -55,14 +201,178 @@ class edit(object):
                 self.layer.id(), self.layer.isEditable(), ex_type, ex_value
             )
         )
-        if ex_type is None:
-            # allow combination of nested `with edit(layer)`
-            # in case of transaction groups, commit might have been achieved before
-            if self.layer.isEditable():
-                logger.debug("committing changes")
-                if not self.layer.commitChanges():
-                    raise QgsEditError(self.layer.commitErrors())
-            return True
+        try:
+            if ex_type is None:
+                # allow combination of nested `with edit(layer)`
+                # in case of transaction groups, commit might have been achieved before
+                if self.layer.isEditable():
+                    logger.debug("committing changes")
+                    _record_edit_buffer(self.statistics, self.layer)
+                    with _timed(self.statistics, self.layer, "commit"):
+                        committed = self.layer.commitChanges()
+                    if not committed:
+                        errors = self.layer.commitErrors()
+                        if self.statistics is not None:
+                            self.statistics.add_errors(self.layer, errors)
+                        raise QgsEditError(errors)
+                return True
+            else:
+                self.layer.rollBack()
+                return False
+        finally:
+            if self.statistics is not None:
+                self.statistics.unwatch(self.layer)
+
+
+class ImportSession:
+    """
+    Edit session over all the layers written by an import
+
+    If the layers share a PostgreSQL connection, a single transaction is used for all
+    of them: the transaction group of the project if it has one, or a transaction
+    group created for the session. Editing is then started and committed only once.
+    Otherwise, the layers are made editable and committed one after the other in the
+    given order, which must therefore list parents before dependents.
+
+    If statistics are given, the edits and the time spent starting and committing
+    are recorded in them. In transaction mode, this time is accounted to the first layer.
+    """
+
+    def __init__(self, layers, statistics: EditStatistics = None):
+        self.layers = []
+        for layer in layers:
+            if layer is not None and layer not in self.layers:
+                self.layers.append(layer)
+        self.statistics = statistics
+        self.transaction_group = None
+        self._own_transaction_group = False
+
+    @property
+    def is_transaction(self):
+        return self.transaction_group is not None
+
+    def _shared_connection(self):
+        connections = {
+            (layer.providerType(), QgsTransaction.connectionString(layer.source()))
+            for layer in self.layers
+        }
+        if len(connections) != 1:
+            return None
+        provider_key, connection_string = connections.pop()
+        if provider_key != "postgres":
+            return None
+        return provider_key, connection_string
+
+    def _setup_transaction_group(self):
+        connection = self._shared_connection()
+        if connection is None:
+            return
+        provider_key, connection_string = connection
+
+        group = QgsProject.instance().transactionGroup(provider_key, connection_string)
+        if group is not None:
+            if all(layer in group.layers() for layer in self.layers):
+                self.transaction_group = group
+            return
+
+        group = QgsTransactionGroup()
+        for layer in self.layers:
+            if not group.addLayer(layer):
+                logger.debug(f"layer {layer.id()} does not support transactions")
+                group.deleteLater()
+                return
+        self.transaction_group = group
+        self._own_transaction_group = True
+
+    def __enter__(self):
+        if self.statistics is not None:
+            for layer in self.layers:
+                self.statistics.watch(layer)
+        if any(layer.isEditable() for layer in self.layers):
+            # some layers are already edited, do not mess with their edit buffer
+            logger.debug("layers already in edit mode, using ordered commits")
         else:
-            self.layer.rollBack()
-            return False
+            self._setup_transaction_group()
+
+        if self.is_transaction:
+            logger.debug(f"starting transaction for {len(self.layers)} layers")
+            with _timed(self.statistics, self.layers[0], "start_editing"):
+                started = self.layers[0].startEditing()
+            if not started:
+                self._unwatch()
+                raise QgsEditError([f"could not start transaction for {self.layers[0].id()}"])
+        else:
+            for layer in self.layers:
+                if not layer.isEditable():
+                    logger.debug("making {} editable".format(layer.id()))
+                    with _timed(self.statistics, layer, "start_editing"):
+                        started = layer.startEditing()
+                    if not started:
+                        self._rollback()
+                        self._unwatch()
+                        raise QgsEditError([f"could not start editing {layer.id()}"])
+        return self
+
+    def __exit__(self, ex_type, ex_value, traceback):
+        try:
+            if ex_type is not None:
+                logger.debug(f"rolling back import session: {ex_type}({ex_value})")
+                self._rollback()
+                return False
+            self._commit()
+            return True
+        finally:
+            self._unwatch()
+            if self._own_transaction_group:
+                self.transaction_group.deleteLater()
+            self.transaction_group = None
+            self._own_transaction_group = False
+
+    def _unwatch(self):
+        if self.statistics is not None:
+            for layer in self.layers:
+                self.statistics.unwatch(layer)
+
+    def _commit(self):
+        if self.is_transaction:
+            logger.debug("committing transaction")
+            # committing one layer of the group commits all of them
+            layer = self.layers[0]
+            if not layer.isEditable():
+                return
+            for group_layer in self.layers:
+                _record_edit_buffer(self.statistics, group_layer)
+            with _timed(self.statistics, layer, "commit"):
+                committed = layer.commitChanges()
+            if not committed:
+                errors = layer.commitErrors()
+                self._add_errors(layer, errors)
+                layer.rollBack()
+                raise QgsEditError(errors)
+            return
+        for index, layer in enumerate(self.layers):
+            if not layer.isEditable():
+                continue
+            logger.debug(f"committing changes for layer {layer.id()}")
+            _record_edit_buffer(self.statistics, layer)
+            with _timed(self.statistics, layer, "commit"):
+                committed = layer.commitChanges()
+            if not committed:
+                errors = layer.commitErrors()
+                self._add_errors(layer, errors)
+                if index > 0:
+                    logger.error(
+                        f"commit failed on {layer.name()}, changes on previous layers were "
+                        "already committed"
+                    )
+                self._rollback()
+                raise QgsEditError(errors)
+
+    def _add_errors(self, layer, errors):
+        if self.statistics is not None:
+            self.statistics.add_errors(layer, errors)
+
+    def _rollback(self):
+        for layer in self.layers:
+            if layer.isEditable():
+                layer.rollBack()
@@ -0,0 +1,15 @@
+from datetime import datetime
+
+
+def parse_datetime(value: str):
+    """
+    Returns the datetime of a WinCan date (yyyy-mm-dd hh:mm:ss with optional milliseconds),
+    or None if it is empty or invalid
+    """
+    if not value:
+        return None
+    try:
+        # WinCan may store more than the 6 fractional digits supported by Python
+        return datetime.fromisoformat(value[:23])
+    except ValueError:
+        return None
@@ -1,4 +1,6 @@
-from qgis.PyQt.QtCore import QDateTime
+from datetime import datetime
+
+from .dates import parse_datetime
 from .observation import Observation
 
 
@@ -12,7 +14,7 @@ class Inspection:
         direction: int = 1,
         inspection_length: float = None,
         highest_grade: int = None,
-        start_date: QDateTime = None,
+        start_date: datetime = None,
         method: str = None,
         operator: str = None,
         import_: bool = True,
@@ -40,7 +42,7 @@ class Inspection:
             direction=data["INS_InspectionDir"],
             inspection_length=data["INS_InspectedLength"],
             highest_grade=data["INS_HighestGrade"],
-            start_date=QDateTime.fromString(data["INS_StartDate"][:23], "yyyy-MM-dd HH:mm:ss.zzz"),
+            start_date=parse_datetime(data["INS_StartDate"]),
             method=data["INS_Method"],
             operator=data["INS_Operator_REF"],
         )
@@ -1,3 +1,9 @@
+# WinCan codes which are matched to another VSA damage code
+CODE_PREMATCH = {
+    "BAG": "BAGA",
+}
+
+
 def _format_obs_value(quantity, unit):
     parts = [str(v) for v in (quantity, unit) if v is not None]
     return " ".join(parts) if parts else None
@@ -1,26 +1,104 @@
+from datetime import datetime
+from itertools import accumulate
 from pathlib import Path
-from qgis.PyQt.QtCore import QDateTime
+
+from .dates import parse_datetime
 from .section import Section
 
 
 class Project:
-    def __init__(self, pk: str, name: str, date: QDateTime, root_path: Path = None):
+    def __init__(self, pk: str, name: str, date: datetime, root_path: Path = None):
         self.pk = pk
         self.name = name
         self.date = date
         self.root_path = root_path
         self.channel = None
         self.sections = {}
+        # section pk → position, and cumulated section lengths by position
+        self._section_positions = None
+        self._cumulative_lengths = None
 
     @classmethod
     def from_dict(cls, data: dict):
         return cls(
             pk=data["PRJ_PK"],
             name=data["PRJ_Key"],
-            date=QDateTime.fromString(data["PRJ_Date"], "yyyy-MM-dd HH:mm:ss"),
+            date=parse_datetime(data["PRJ_Date"]),
         )
 
     def add_section(self, section: "Section"):
         if section.project_pk != self.pk:
             raise ValueError(f"Section {section.pk} does not belong to project {self.pk}")
         self.sections[section.pk] = section
+        self._section_positions = None
+        self._cumulative_lengths = None
+
+    def _index_sections(self):
+        if self._section_positions is None:
+            self._section_positions = {pk: i for i, pk in enumerate(self.sections)}
+            self._cumulative_lengths = list(
+                accumulate((s.section_length or 0 for s in self.sections.values()), initial=0)
+            )
+
+    def section_position(self, section_pk: str) -> int:
+        """
+        Returns the position of the section in the project
+        """
+        self._index_sections()
+        return self._section_positions[section_pk]
+
+    def length_between(self, first_pk: str, last_pk: str) -> float:
+        """
+        Returns the length of the sections from the first one (included) to the last one (excluded)
+        """
+        self._index_sections()
+        return (
+            self._cumulative_lengths[self._section_positions[last_pk]]
+            - self._cumulative_lengths[self._section_positions[first_pk]]
+        )
+
+    def section_chain_heads(self) -> dict:
+        """
+        Returns the first section of the chain of each section,
+        following use_previous_section backwards.
+        A section is its own head if it does not use the previous section.
+        The head is None if the chain starts with the first section of the project.
+        """
+        heads = {}
+        head = None
+        for pk, section in self.sections.items():
+            if section.use_previous_section is not True:
+                head = pk
+            heads[pk] = head
+        return heads
+
+    def previous_section_offsets(self) -> dict:
+        """
+        Returns the distance offset of each section using the previous section,
+        i.e. minus the length of the previous sections in its chain
+        """
+        offsets = {}
+        for pk, head in self.section_chain_heads().items():
+            if head is not None and head != pk:
+                offsets[pk] = -self.length_between(head, pk)
+        return offsets
+
+    def invalid_section_chains(self) -> list:
+        """
+        Returns the sections to import which use the previous section
+        while their chain has no head with an imported inspection
+        or contains sections which are not imported
+        """
+        invalid = []
+        head_imported = False
+        for section in self.sections.values():
+            if section.use_previous_section is not True:
+                head_imported = section.import_ is True and any(
+                    inspection.import_ for inspection in section.inspections.values()
+                )
+            elif section.import_ is True and not head_imported:
+                invalid.append(section.pk)
+            elif section.import_ is not True:
+                # breaks the chain for the following sections
+                head_imported = False
+        return invalid
@@ -1,12 +1,18 @@
 #!/usr/bin/env python
 # coding: utf-8 -*-
 # ...existing code...
-from pathlib import Path
+from pathlib import Path, PurePath
+from urllib.parse import quote
+import os
 import re
+import shutil
 import sqlite3
+import tempfile
+import time
 
 from wincan2teksi.core.objects import Project, Section, Inspection, Observation
 from wincan2teksi.core.exceptions import InvalidProjectFile
+from wincan2teksi.core.tracing import traced
 
 import logging
 
@@ -22,7 +28,23 @@ class WinCanData:
         self.meta_file = None
         self.pdf_file = None
         self.projects = {}
-
+        # time spent reading the files, and copying them locally beforehand, in seconds
+        self.load_time = None
+        self.stage_time = None
+
+
+# page cache of the connections in KiB, and size of the memory mapped I/O in bytes
+CACHE_SIZE_KIB = 64 * 1024
+MMAP_SIZE = 256 * 1024 * 1024
+
+# columns by which the tables are filtered when reading, which should be indexed
+FILTER_COLUMNS = (
+    ("SECTION", "OBJ_Project_FK"),
+    ("NODE", "OBJ_PK"),
+    ("SECINSP", "INS_Section_FK"),
+    ("SECOBS", "OBS_Inspection_FK"),
+    ("SECOBSMM", "OMM_Observation_FK"),
+)
 
 ALLOWED_TABLES = frozenset(
     {"PROJECT", "SECTION", "NODE", "SECINSP", "SECOBS", "SECOBSMM", "OPERATOR"}
@@ -68,147 +90,291 @@ def __read_table(
     return [dict(zip(columns, row)) for row in rows]
 
 
-def read_data(file: str) -> WinCanData:
-    """Reads data from a Wincan SQLite database file and returns a dictionary of projects."""
+def _wal_path(path: Path) -> Path:
+    return path.with_name(path.name + "-wal")
+
+
+def _has_wal(path: Path) -> bool:
+    wal_path = _wal_path(path)
+    return wal_path.exists() and wal_path.stat().st_size > 0
+
+
+def _sqlite_uri(path: PurePath, immutable: bool) -> str:
+    """
+    Returns the read-only URI of a database file, given its absolute path
+
+    The path of the URI follows an empty authority and must start with a slash:
+    file:///tmp/x.db3, file:///C:/x.db3 for Windows drives and file:////server/share/x.db3
+    for UNC paths (SQLite rejects a file://server/... authority)
+    """
+    posix_path = path.as_posix()
+    if posix_path.startswith("//"):
+        # UNC path, kept with its two leading slashes after the empty authority
+        uri_path = posix_path
+    elif posix_path.startswith("/"):
+        uri_path = posix_path
+    else:
+        # Windows drive path
+        uri_path = "/" + posix_path
+    uri = f"file://{quote(uri_path, safe='/:')}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    return uri
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """
+    Opens a database read-only, with a larger page cache and memory mapped I/O
+    The database is opened as immutable (no locks nor change detection), unless it has a
+    write-ahead log, i.e. it is still open in WinCan or was not closed properly
+    """
+    immutable = not _has_wal(path)
+    if not immutable:
+        logger.warning(f"{path} has a write-ahead log, it may still be open in WinCan")
+    conn = sqlite3.connect(_sqlite_uri(Path(os.path.abspath(path)), immutable), uri=True)
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    return conn
+
+
+@traced("stage_db3")
+def _stage_copy(paths: tuple, stage_dir: str) -> tuple:
+    """
+    Copies the existing databases, with their write-ahead log, to the stage directory
+    Returns the paths of the copies
+    """
+    copies = []
+    for path in paths:
+        copy = Path(stage_dir) / path.name
+        if path.exists():
+            shutil.copyfile(path, copy)
+            if _has_wal(path):
+                shutil.copyfile(_wal_path(path), _wal_path(copy))
+        copies.append(copy)
+    return tuple(copies)
+
+
+def _scanned_filters(conn: sqlite3.Connection) -> list:
+    """
+    Returns the (table, column) of FILTER_COLUMNS for which the query plan
+    of the filtered read is a scan of the whole table
+    """
+    scans = []
+    for table, column in FILTER_COLUMNS:
+        try:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE {column} = ?", (None,)
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # missing table or column, reported when reading
+            continue
+        if any(row[3].startswith("SCAN") for row in plan):
+            scans.append((table, column))
+    return scans
+
+
+@traced("index_db3")
+def _index_staged_copy(path: Path):
+    """
+    Creates the indexes missing for the filtered reads on a staged copy of a database
+    The delivered files are never modified
+    """
+    start = time.perf_counter()
+    conn = sqlite3.connect(path)
+    try:
+        scans = _scanned_filters(conn)
+        for table, column in scans:
+            conn.execute(f'CREATE INDEX "w2t_{table}_{column}" ON {table} ({column})')
+        conn.commit()
+    except sqlite3.Error as e:
+        # the copy is still read, only slower
+        logger.warning(f"Could not index the local copy {path}: {e}")
+        return
+    finally:
+        conn.close()
+    if scans:
+        logger.info(
+            f"Created temporary indexes on {', '.join(f'{t} ({c})' for t, c in scans)}"
+            f" in {time.perf_counter() - start:.3f} s"
+        )
+
+
+@traced("read_data")
+def read_data(file: str, stage_locally: bool = False) -> WinCanData:
+    """Reads data from a Wincan SQLite database file and returns a dictionary of projects.
+
+    The databases are opened read-only. With stage_locally, they are first copied to a
+    local temporary directory, which is faster for files on network shares.
+    """
     if not Path(file).exists():
         raise FileNotFoundError(f"File {file} does not exist.")
 
     logger.info(f"Reading Wincan database: {file}")
+    start = time.perf_counter()
 
     data = WinCanData()
     data.file = file
 
     file_path = Path(file)
 
-    meta_path = file_path.with_name(file_path.stem + "_meta" + file_path.suffix)
-    operators = {}
-    if not meta_path.exists():
-        logger.warning(f"Meta file {meta_path} does not exist.")
-    else:
-        data.meta_file = str(meta_path)
-        with sqlite3.connect(meta_path) as meta_conn:
-            meta_cursor = meta_conn.cursor()
-            logger.info(f"Read meta file: {meta_path}")
-            operators = __read_table(meta_cursor, "OPERATOR")
-
-    conn = sqlite3.connect(file_path)
+    stage_dir = tempfile.TemporaryDirectory(prefix="wincan2teksi_") if stage_locally else None
     try:
-        cursor = conn.cursor()
-
-        pdf_path = file_path.parent.parent / "Misc" / "Docu" / (file_path.stem + ".pdf")
-        if not pdf_path.exists():
-            logger.warning(f"PDF file {pdf_path} does not exist.")
+        meta_path = file_path.with_name(file_path.stem + "_meta" + file_path.suffix)
+        operators = {}
+        if stage_dir is not None:
+            stage_start = time.perf_counter()
+            db_path, meta_db_path = _stage_copy((file_path, meta_path), stage_dir.name)
+            data.stage_time = time.perf_counter() - stage_start
+            logger.info(f"Copied {file} to {stage_dir.name} in {data.stage_time:.3f} s")
+            _index_staged_copy(db_path)
         else:
-            data.pdf_file = str(pdf_path)
-
+            db_path, meta_db_path = file_path, meta_path
+        if not meta_path.exists():
+            logger.warning(f"Meta file {meta_path} does not exist.")
+        else:
+            data.meta_file = str(meta_path)
+            meta_conn = _connect(meta_db_path)
+            try:
+                meta_cursor = meta_conn.cursor()
+                logger.info(f"Read meta file: {meta_path}")
+                operators = __read_table(meta_cursor, "OPERATOR")
+            finally:
+                meta_conn.close()
+
+        conn = _connect(db_path)
         try:
-            project_data = __read_table(cursor, "PROJECT", extra_condition="PRJ_Deleted IS NULL")
-        except sqlite3.OperationalError as e:
-            raise InvalidProjectFile(f"Invalid project file: {file_path}") from e
-
-        projects = [Project.from_dict(data) for data in project_data]
-
-        for project in projects:
-            logger.info(f"Processing project: {project.name} (PK: {project.pk})")
-            sections = __read_table(
-                cursor,
-                "SECTION",
-                conditions={"OBJ_Project_FK": project.pk},
-                extra_condition="OBJ_Deleted IS NULL",
-            )
-            for section_data in sections:
-                section = Section.from_dict(section_data)
-                from_nodes = __read_table(
-                    cursor,
-                    "NODE",
-                    conditions={"OBJ_PK": section.from_node},
-                    extra_condition="OBJ_Deleted IS NULL",
+            cursor = conn.cursor()
+            hint = "" if stage_dir is not None else " (staging the database locally indexes it)"
+            for table, column in _scanned_filters(conn):
+                logger.info(
+                    f"Reading {table} by {column} scans the whole table, as it is not indexed{hint}"
                 )
-                to_nodes = __read_table(
-                    cursor,
-                    "NODE",
-                    conditions={"OBJ_PK": section.to_node},
-                    extra_condition="OBJ_Deleted IS NULL",
-                )
-                if not from_nodes or not to_nodes:
-                    logger.warning(
-                        f"Missing node data for section {section.name} (PK: {section.pk}), skipping"
-                    )
-                    continue
-                section.from_node = from_nodes[0]["OBJ_Key"]
-                section.to_node = to_nodes[0]["OBJ_Key"]
-                section.original_from_node = section.from_node
-                section.original_to_node = section.to_node
 
-                logger.debug(
-                    f"Found section: {section.name} (PK: {section.pk}) in project {project.name}"
+            pdf_path = file_path.parent.parent / "Misc" / "Docu" / (file_path.stem + ".pdf")
+            if not pdf_path.exists():
+                logger.warning(f"PDF file {pdf_path} does not exist.")
+            else:
+                data.pdf_file = str(pdf_path)
+
+            try:
+                project_data = __read_table(
+                    cursor, "PROJECT", extra_condition="PRJ_Deleted IS NULL"
                 )
+            except sqlite3.OperationalError as e:
+                raise InvalidProjectFile(f"Invalid project file: {file_path}") from e
+
+            projects = [Project.from_dict(data) for data in project_data]
 
-                inspections = __read_table(
+            for project in projects:
+                logger.info(f"Processing project: {project.name} (PK: {project.pk})")
+                sections = __read_table(
                     cursor,
-                    "SECINSP",
-                    conditions={"INS_Section_FK": section.pk},
-                    extra_condition="INS_Deleted IS NULL",
+                    "SECTION",
+                    conditions={"OBJ_Project_FK": project.pk},
+                    extra_condition="OBJ_Deleted IS NULL",
                 )
-                if not inspections:
-                    logger.warning(
-                        f"No inspections found for section {section.name} (PK: {section.pk}) in project {project.name}"
+                for section_data in sections:
+                    section = Section.from_dict(section_data)
+                    from_nodes = __read_table(
+                        cursor,
+                        "NODE",
+                        conditions={"OBJ_PK": section.from_node},
+                        extra_condition="OBJ_Deleted IS NULL",
+                    )
+                    to_nodes = __read_table(
+                        cursor,
+                        "NODE",
+                        conditions={"OBJ_PK": section.to_node},
+                        extra_condition="OBJ_Deleted IS NULL",
                     )
-                    continue
-                for inspection_data in inspections:
-                    inspection = Inspection.from_dict(inspection_data)
+                    if not from_nodes or not to_nodes:
+                        logger.warning(
+                            f"Missing node data for section {section.name} (PK: {section.pk}), skipping"
+                        )
+                        continue
+                    section.from_node = from_nodes[0]["OBJ_Key"]
+                    section.to_node = to_nodes[0]["OBJ_Key"]
+                    section.original_from_node = section.from_node
+                    section.original_to_node = section.to_node
+
                     logger.debug(
-                        f"Found inspection: {inspection.name} (PK: {inspection.pk}) in section {section.name}"
+                        f"Found section: {section.name} (PK: {section.pk}) in project {project.name}"
                     )
-                    if operators:
-                        for operator in operators:
-                            if operator["OP_PK"] == inspection.operator:
-                                # using OP_Key as OP_Name1 seems to be wrongly filled in AITV data
-                                inspection.operator = operator["OP_Key"]
 
-                    observations = __read_table(
+                    inspections = __read_table(
                         cursor,
-                        "SECOBS",
-                        conditions={"OBS_Inspection_FK": inspection.pk},
-                        extra_condition="OBS_Deleted IS NULL",
+                        "SECINSP",
+                        conditions={"INS_Section_FK": section.pk},
+                        extra_condition="INS_Deleted IS NULL",
                     )
-                    if not observations:
+                    if not inspections:
                         logger.warning(
-                            f"No observations found for inspection {inspection.name} (PK: {inspection.pk}) in section {section.name}"
+                            f"No inspections found for section {section.name} (PK: {section.pk}) in project {project.name}"
                         )
                         continue
-                    for observation_data in observations:
-                        observation = Observation.from_dict(observation_data)
+                    for inspection_data in inspections:
+                        inspection = Inspection.from_dict(inspection_data)
                         logger.debug(
-                            f"Found observation in inspection {inspection.name} (PK: {inspection.pk})"
+                            f"Found inspection: {inspection.name} (PK: {inspection.pk}) in section {section.name}"
                         )
-                        mmfiles = __read_table(
+                        if operators:
+                            for operator in operators:
+                                if operator["OP_PK"] == inspection.operator:
+                                    # using OP_Key as OP_Name1 seems to be wrongly filled in AITV data
+                                    inspection.operator = operator["OP_Key"]
+
+                        observations = __read_table(
                             cursor,
-                            "SECOBSMM",
-                            conditions={"OMM_Observation_FK": observation.pk},
-                            extra_condition="OMM_Deleted IS NULL",
+                            "SECOBS",
+                            conditions={"OBS_Inspection_FK": inspection.pk},
+                            extra_condition="OBS_Deleted IS NULL",
                         )
-                        for mmfile in mmfiles:
-                            if mmfile["OMM_Type"] in ("PI1", "PI2"):
-                                observation.mmfiles.append(("picture", mmfile["OMM_FileName"]))
-                            else:
-                                observation.mmfiles.append(("video", mmfile["OMM_FileName"]))
-                        inspection.add_observation(observation)
-                    section.add_inspection(inspection)
-                project.add_section(section)
-            logger.info(f"Found {len(project.sections)} sections in project {project.name}")
-
-        data.projects = {project.pk: project for project in projects}
-        logger.info(f"Loaded {len(data.projects)} project(s) from {file}")
-
-        if data.pdf_file:
-            _parse_pdf_pages(data.pdf_file, data.projects)
-
-        return data
+                        if not observations:
+                            logger.warning(
+                                f"No observations found for inspection {inspection.name} (PK: {inspection.pk}) in section {section.name}"
+                            )
+                            continue
+                        for observation_data in observations:
+                            observation = Observation.from_dict(observation_data)
+                            logger.debug(
+                                f"Found observation in inspection {inspection.name} (PK: {inspection.pk})"
+                            )
+                            mmfiles = __read_table(
+                                cursor,
+                                "SECOBSMM",
+                                conditions={"OMM_Observation_FK": observation.pk},
+                                extra_condition="OMM_Deleted IS NULL",
+                            )
+                            for mmfile in mmfiles:
+                                if mmfile["OMM_Type"] in ("PI1", "PI2"):
+                                    observation.mmfiles.append(("picture", mmfile["OMM_FileName"]))
+                                else:
+                                    observation.mmfiles.append(("video", mmfile["OMM_FileName"]))
+                            inspection.add_observation(observation)
+                        section.add_inspection(inspection)
+                    project.add_section(section)
+                logger.info(f"Found {len(project.sections)} sections in project {project.name}")
+
+            data.projects = {project.pk: project for project in projects}
+            logger.info(f"Loaded {len(data.projects)} project(s) from {file}")
+
+            if data.pdf_file:
+                _parse_pdf_pages(data.pdf_file, data.projects)
+
+            data.load_time = time.perf_counter() - start
+            logger.info(
+                f"Read {file} in {data.load_time:.3f} s"
+                f" ({'from a local copy' if stage_dir is not None else 'in place'})"
+            )
+            return data
+        finally:
+            conn.close()
     finally:
-        conn.close()
+        if stage_dir is not None:
+            stage_dir.cleanup()
 
 
+@traced("parse_pdf_pages")
 def _parse_pdf_pages(pdf_path: str, projects: dict) -> None:
     """Parse the PDF report's table of contents to determine the starting
     page number for each section, and store it on the Section objects."""
@@ -23,11 +23,12 @@
 #
 # ---------------------------------------------------------------------
 
-from qgis.core import QgsProject, QgsFeature, QgsFeatureRequest
+from qgis.core import QgsExpression, QgsProject, QgsFeature, QgsFeatureRequest
 
 import logging
 
 from wincan2teksi.core.exceptions import W2TLayerNotFound
+from wincan2teksi.core.layer_access import get_feature, get_features
 from wincan2teksi.core.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ def find_section(channel, start_node, end_node):
         request_text = f"\"rp_from_identifier\" LIKE '{start_node}%' and \"rp_to_identifier\" LIKE '{end_node}%'"
 
     request = QgsFeatureRequest().setFilterExpression(request_text)
-    feature = next(layer.getFeatures(request), QgsFeature())
+    feature = get_feature(layer, request, "find_section")
     if feature.isValid():
         logger.debug(f"Found section: {feature.attribute('obj_id')} for {start_node} → {end_node}")
     else:
@@ -70,5 +71,30 @@ def section_at_id(obj_id):
                 f"Channel layer with ID {layer_id} not found in the current QGIS project."
             )
         request = QgsFeatureRequest().setFilterExpression("\"obj_id\" = '{}'".format(obj_id))
-        feature = next(layer.getFeatures(request), QgsFeature())
+        feature = get_feature(layer, request, "section_at_id")
     return feature
+
+
+def sections_at_ids(obj_ids, chunk_size: int = 1000) -> dict:
+    """
+    Returns the channel features of the given obj_ids by obj_id,
+    fetched with one "obj_id" IN (...) request per chunk
+    """
+    features = {}
+    obj_ids = list({obj_id for obj_id in obj_ids if obj_id is not None})
+    if not obj_ids:
+        return features
+    layer_id = Settings().channel_layer.value()
+    layer = QgsProject.instance().mapLayer(layer_id)
+    if layer is None:
+        raise W2TLayerNotFound(
+            f"Channel layer with ID {layer_id} not found in the current QGIS project."
+        )
+    for start in range(0, len(obj_ids), chunk_size):
+        chunk = obj_ids[start : start + chunk_size]
+        request = QgsFeatureRequest().setFilterExpression(
+            '"obj_id" IN ({})'.format(", ".join(QgsExpression.quotedValue(o) for o in chunk))
+        )
+        for feature in get_features(layer, request, "sections_at_ids"):
+            features[feature["obj_id"]] = feature
+    return features
@@ -98,7 +98,15 @@ class Settings:
 
             cls.import_log_dir = QgsSettingsEntryString("import_log_dir", settings_node, "")
 
+            cls.writer_backend = QgsSettingsEntryString("writer_backend", settings_node, "layers")
+            cls.stage_db3_locally = QgsSettingsEntryBool("stage_db3_locally", settings_node, False)
+
             cls.show_logs = QgsSettingsEntryBool("show_logs", settings_node, False)
+            cls.max_log_entries = QgsSettingsEntryInteger("max_log_entries", settings_node, 10000)
+            cls.tracing_enabled = QgsSettingsEntryBool("tracing_enabled", settings_node, False)
+            cls.slow_query_threshold_ms = QgsSettingsEntryDouble(
+                "slow_query_threshold_ms", settings_node, 500.0
+            )
 
             cls.highlight_color = QgsSettingsEntryColor(
                 "highlight_color", settings_node, QColor("#ffff00")
@@ -0,0 +1,181 @@
+"""
+Lightweight tracing of the plugin stages
+
+Spans are opened with the span() context manager or the traced() decorator
+and can be nested, or recorded afterwards with add_span(). They are only recorded when tracing is enabled, otherwise
+span() returns a shared no-op object and traced() calls the function directly.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+
+_enabled = False
+_spans = []  # finished spans
+_lock = threading.Lock()
+_local = threading.local()
+# reference for the timestamps of the Chrome trace
+_origin = time.perf_counter()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def clear():
+    with _lock:
+        _spans.clear()
+
+
+def spans() -> list:
+    """
+    Returns a copy of the finished spans
+    """
+    with _lock:
+        return list(_spans)
+
+
+class _NoOpSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+class _Span:
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.start = None
+        self.depth = 0
+        self.parent = None
+
+    def set(self, **args):
+        """
+        Adds arguments to the span, e.g. counts known once the work is done
+        """
+        self.args.update(args)
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.depth = len(stack)
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = time.perf_counter() - self.start
+        _local.stack.pop()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _append(self.name, self.parent, self.depth, self.start, duration, self.args)
+        return False
+
+
+def _append(name: str, parent: str, depth: int, start: float, duration: float, args: dict):
+    record = {
+        "name": name,
+        "parent": parent,
+        "depth": depth,
+        "start": start - _origin,
+        "duration": duration,
+        "thread": threading.get_ident(),
+        "args": args,
+    }
+    with _lock:
+        _spans.append(record)
+
+
+def span(name: str, **args):
+    """
+    Returns a context manager timing the enclosed block
+    """
+    if not _enabled:
+        return _NO_OP_SPAN
+    return _Span(name, args)
+
+
+def add_span(name: str, start: float, duration: float, **args):
+    """
+    Records a span timed by the caller, start being a time.perf_counter() value
+    For work interleaved with other work, such as the fetching of a lazy iteration
+    """
+    if not _enabled:
+        return
+    stack = getattr(_local, "stack", None) or []
+    _append(name, stack[-1].name if stack else None, len(stack), start, duration, args)
+
+
+def traced(name: str = None):
+    """
+    Decorator opening a span for each call of the function
+    """
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def summary() -> dict:
+    """
+    Returns the count, total and maximum duration of the spans by name
+    """
+    result = {}
+    for record in spans():
+        entry = result.setdefault(record["name"], {"count": 0, "total": 0.0, "max": 0.0})
+        entry["count"] += 1
+        entry["total"] += record["duration"]
+        entry["max"] = max(entry["max"], record["duration"])
+    return result
+
+
+def export_json(path: str):
+    with open(path, "w") as f:
+        json.dump({"summary": summary(), "spans": spans()}, f, indent=2, default=str)
+
+
+def export_chrome_trace(path: str):
+    """
+    Writes the spans in the Chrome trace event format (chrome://tracing, Perfetto)
+    """
+    events = [
+        {
+            "name": record["name"],
+            "ph": "X",
+            "ts": record["start"] * 1e6,
+            "dur": record["duration"] * 1e6,
+            "pid": os.getpid(),
+            "tid": record["thread"],
+            "args": record["args"],
+        }
+        for record in spans()
+    ]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
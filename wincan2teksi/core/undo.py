@@ -0,0 +1,243 @@
+import json
+import logging
+import os
+from datetime import datetime
+
+from qgis.core import (
+    QgsEditError,
+    QgsExpression,
+    QgsFeatureRequest,
+    QgsProject,
+    QgsTask,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import pyqtSignal
+
+from wincan2teksi.core import tracing
+from wincan2teksi.core.exceptions import W2TLayerNotFound
+from wincan2teksi.core.layer_access import get_features
+from wincan2teksi.core.layer_edit import EditStatistics, edit
+from wincan2teksi.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Deletion order: dependents first, then parents.
+# file_layer entries reference damage/maintenance via "object" field,
+# join_layer references maintenance, damage references maintenance.
+DELETION_ORDER = [
+    "file_layer",
+    "join_maintence_wastewaterstructure_layer",
+    "damage_layer",
+    "maintenance_layer",
+]
+
+# number of obj_ids resolved by a single "obj_id" IN (...) request
+DELETE_CHUNK_SIZE = 1000
+
+# status of an import log regarding undo
+UNDO_STATUS_PARTIAL = "partial"
+
+
+def deletion_plan(features: dict) -> list:
+    """
+    Returns the ordered list of (layer, obj_ids) to delete for the features of an import log
+    """
+    settings = Settings()
+
+    # Map setting key → layer id
+    setting_to_layer_id = {key: getattr(settings, key).value() for key in DELETION_ORDER}
+
+    # Build layer_id → list of obj_ids from the log
+    layer_id_to_obj_ids = {}
+    for layer_data in features.values():
+        layer_id = layer_data.get("layer_id")
+        obj_ids = layer_data.get("obj_ids", [])
+        if layer_id and obj_ids:
+            layer_id_to_obj_ids[layer_id] = obj_ids
+
+    plan = []
+    for setting_key in DELETION_ORDER:
+        layer_id = setting_to_layer_id.get(setting_key)
+        if layer_id and layer_id in layer_id_to_obj_ids:
+            layer = QgsProject.instance().mapLayer(layer_id)
+            if layer is None:
+                raise W2TLayerNotFound(f"Layer '{layer_id}' not found in project")
+            plan.append((layer, layer_id_to_obj_ids.pop(layer_id)))
+
+    # Any remaining layers not in the known order (shouldn't happen, but be safe)
+    for layer_id, obj_ids in layer_id_to_obj_ids.items():
+        layer = QgsProject.instance().mapLayer(layer_id)
+        if layer is not None:
+            plan.append((layer, obj_ids))
+
+    return plan
+
+
+def feature_ids_for_obj_ids(layer, obj_ids: list, chunk_size: int = DELETE_CHUNK_SIZE) -> list:
+    """
+    Resolves the feature ids of the given obj_ids with one "obj_id" IN (...) request per chunk
+    """
+    fids = []
+    for start in range(0, len(obj_ids), chunk_size):
+        chunk = obj_ids[start : start + chunk_size]
+        expression = '"obj_id" IN ({})'.format(
+            ", ".join(QgsExpression.quotedValue(o) for o in chunk)
+        )
+        request = QgsFeatureRequest().setFilterExpression(expression)
+        request.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+        request.setSubsetOfAttributes(["obj_id"], layer.fields())
+        fids.extend(
+            feature.id() for feature in get_features(layer, request, "feature_ids_for_obj_ids")
+        )
+    return fids
+
+
+def delete_obj_ids(
+    layer, obj_ids: list, chunk_size: int = DELETE_CHUNK_SIZE, statistics: EditStatistics = None
+) -> int:
+    """
+    Deletes the features of the given obj_ids from the layer in a single edit session
+    Returns the number of deleted features
+    """
+    with edit(layer, statistics):
+        fids = feature_ids_for_obj_ids(layer, obj_ids, chunk_size)
+        if len(fids) < len(obj_ids):
+            logger.warning(
+                f"{len(obj_ids) - len(fids)} feature(s) of {layer.name()} not found, "
+                "they might have been deleted already"
+            )
+        if fids and not layer.deleteFeatures(fids):
+            raise QgsEditError([f"Failed to delete {len(fids)} features from {layer.name()}"])
+    logger.debug(f"Deleted {len(fids)} features from {layer.name()}")
+    return len(fids)
+
+
+def delete_features(plan: list, progress_callback=None, statistics: EditStatistics = None) -> int:
+    """
+    Deletes the features of a deletion plan, layer by layer in the plan order
+    progress_callback is called after each layer with (layer_index, layer_count, layer, deleted)
+    Returns the total number of deleted features
+    """
+    total = 0
+    for index, (layer, obj_ids) in enumerate(plan):
+        deleted = delete_obj_ids(layer, obj_ids, statistics=statistics)
+        total += deleted
+        logger.info(f"Undo: deleted {deleted} features from {layer.name()}")
+        if progress_callback is not None:
+            progress_callback(index + 1, len(plan), layer, deleted)
+    return total
+
+
+def undo_checkpoint(data: dict) -> dict:
+    """
+    Returns the obj_ids already deleted by a previous undo of an import log, by layer id
+    """
+    return {
+        layer_id: list(obj_ids)
+        for layer_id, obj_ids in data.get("undo", {}).get("deleted", {}).items()
+    }
+
+
+def write_import_log(log_file: str, data: dict):
+    """
+    Writes an import log atomically, so that an interrupted write never corrupts it
+    """
+    tmp_file = f"{log_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+    os.replace(tmp_file, log_file)
+
+
+class UndoImportTask(QgsTask):
+    """
+    Deletes the features of an import log in the background
+
+    Each chunk is committed on its own and the deleted obj_ids are checkpointed
+    in the import log, so that a failed or cancelled undo can be resumed.
+    Layers are re-opened from their source in the task thread, the project layers
+    are only reloaded once the task is finished.
+    """
+
+    layerStarted = pyqtSignal(str)
+
+    def __init__(self, log_file: str, data: dict, plan: list):
+        super().__init__(f"Undo import {os.path.basename(log_file)}", QgsTask.Flag.CanCancel)
+        self.log_file = log_file
+        self.data = data
+        self.deleted = undo_checkpoint(data)
+        # only keep what can safely be used from another thread
+        self.plan = [
+            (layer.id(), layer.name(), layer.source(), layer.providerType(), obj_ids)
+            for layer, obj_ids in plan
+        ]
+        self.total = sum(len(obj_ids) for *_, obj_ids in self.plan)
+        self.deleted_count = 0
+        self.error = None
+        self.edit_statistics = EditStatistics()
+
+    def remaining_obj_ids(self, layer_id: str, obj_ids: list) -> list:
+        already_deleted = set(self.deleted.get(layer_id, []))
+        return [obj_id for obj_id in obj_ids if obj_id not in already_deleted]
+
+    def run(self):
+        try:
+            with tracing.span("undo", features=self.total):
+                return self._run()
+        finally:
+            self.edit_statistics.log_summary("Undo")
+
+    def _run(self):
+        processed = sum(len(obj_ids) for obj_ids in self.deleted.values())
+        try:
+            for layer_id, layer_name, source, provider, obj_ids in self.plan:
+                remaining = self.remaining_obj_ids(layer_id, obj_ids)
+                if not remaining:
+                    continue
+                self.layerStarted.emit(layer_name)
+                with tracing.span("undo layer", layer=layer_name, features=len(remaining)):
+                    layer = QgsVectorLayer(source, layer_name, provider)
+                    if not layer.isValid():
+                        raise W2TLayerNotFound(f"Layer '{layer_name}' could not be opened")
+                    for start in range(0, len(remaining), DELETE_CHUNK_SIZE):
+                        if self.isCanceled():
+                            logger.info("Undo cancelled by user")
+                            self._save_checkpoint()
+                            return False
+                        chunk = remaining[start : start + DELETE_CHUNK_SIZE]
+                        self.deleted_count += delete_obj_ids(
+                            layer, chunk, statistics=self.edit_statistics
+                        )
+                        self.deleted.setdefault(layer_id, []).extend(chunk)
+                        self._save_checkpoint()
+                        processed += len(chunk)
+                        self.setProgress(100 * processed / max(self.total, 1))
+                logger.info(f"Undo: deleted features from {layer_name}")
+        except (QgsEditError, W2TLayerNotFound, OSError) as e:
+            logger.error(f"Undo failed: {e}")
+            self.error = e
+            self._save_checkpoint()
+            return False
+        return True
+
+    def _save_checkpoint(self):
+        if not self.deleted:
+            return
+        self.data["undo"] = {
+            "status": UNDO_STATUS_PARTIAL,
+            "timestamp": datetime.now().isoformat(),
+            "deleted": self.deleted,
+        }
+        write_import_log(self.log_file, self.data)
+
+    def finished(self, result):
+        for layer_id, *_ in self.plan:
+            layer = QgsProject.instance().mapLayer(layer_id)
+            if layer is not None:
+                layer.dataProvider().reloadData()
+                layer.triggerRepaint()
+        if result:
+            # Remove log file after successful deletion
+            try:
+                os.remove(self.log_file)
+            except OSError:
+                pass
@@ -13,14 +13,185 @@
  ***************************************************************************/
 """
 
-from qgis.PyQt.QtCore import QObject, pyqtSignal
+import configparser
+import os
+import queue
+import threading
 import logging
 from logging import LogRecord
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from qgis.PyQt.QtCore import QObject, QStandardPaths, pyqtSignal
+
+from wincan2teksi.core.settings import Settings
 
 PLUGIN_LOGGER_NAME = "wincan2teksi"
 
+LOG_FILE_NAME = "wincan2teksi.log"
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+LOG_FILE_LEVEL = logging.INFO
+
+_queue_handler = None
+_queue_listener = None
+_fan_out_handler = None
+
+
+def import_log_dir() -> str:
+    """
+    Returns the directory of the import logs, from the settings or the default one
+    """
+    path = Settings().import_log_dir.value()
+    if not path:
+        path = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation),
+            "wincan2teksi",
+            "import_logs",
+        )
+    return path
+
+
+def plugin_version() -> str:
+    """
+    Returns the version of the plugin from its metadata
+    """
+    metadata = configparser.ConfigParser(interpolation=None)
+    metadata.read(os.path.join(os.path.dirname(__file__), "..", "metadata.txt"))
+    return metadata.get("general", "version", fallback="")
+
+
+class _FanOutHandler(logging.Handler):
+    """
+    Dispatches the records of the queue listener to handlers which can be added and removed
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handlers = []
+        self._handlers_lock = threading.Lock()
+
+    def add_handler(self, handler):
+        with self._handlers_lock:
+            if handler not in self._handlers:
+                self._handlers.append(handler)
+
+    def remove_handler(self, handler):
+        with self._handlers_lock:
+            if handler in self._handlers:
+                self._handlers.remove(handler)
+
+    def handler_levels(self) -> list:
+        with self._handlers_lock:
+            return [handler.level for handler in self._handlers]
+
+    def emit(self, record):
+        with self._handlers_lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def start_logging():
+    """
+    Sets up the plugin logger to only enqueue records, a listener thread
+    writes them to a rotating file in the import log directory and to the
+    handlers added with add_log_handler()
+    Does nothing if already started
+    """
+    global _queue_handler, _queue_listener, _fan_out_handler
+    if _queue_listener is not None:
+        return
+
+    _fan_out_handler = _FanOutHandler()
+    handlers = [_fan_out_handler]
+    log_dir = import_log_dir()
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            os.path.join(log_dir, LOG_FILE_NAME),
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setLevel(LOG_FILE_LEVEL)
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
+        )
+        handlers.append(file_handler)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Cannot write the log file in {log_dir}: {e}")
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    plugin_logger = logging.getLogger(PLUGIN_LOGGER_NAME)
+    plugin_logger.addHandler(_queue_handler)
+    _update_logger_level()
+
+
+def _update_logger_level():
+    """
+    Sets the plugin logger to the lowest level of the log file and of the handlers
+    added with add_log_handler(), so that debug records are only created while
+    a handler (the visible logs panel) accepts them
+    """
+    levels = [LOG_FILE_LEVEL]
+    if _fan_out_handler is not None:
+        levels.extend(max(level, logging.DEBUG) for level in _fan_out_handler.handler_levels())
+    logging.getLogger(PLUGIN_LOGGER_NAME).setLevel(min(levels))
+
+
+def stop_logging():
+    """
+    Flushes the pending records and restores the plugin logger
+    """
+    global _queue_handler, _queue_listener, _fan_out_handler
+    if _queue_listener is None:
+        return
+    plugin_logger = logging.getLogger(PLUGIN_LOGGER_NAME)
+    plugin_logger.removeHandler(_queue_handler)
+    plugin_logger.setLevel(logging.NOTSET)
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_handler = None
+    _queue_listener = None
+    _fan_out_handler = None
+
+
+def add_log_handler(handler: logging.Handler):
+    """
+    Adds a handler consuming the records of the plugin logger from the queue listener thread
+    """
+    start_logging()
+    _fan_out_handler.add_handler(handler)
+    _update_logger_level()
+
+
+def set_log_handler_level(handler: logging.Handler, level: int):
+    """
+    Changes the level of a handler added with add_log_handler() and the plugin logger accordingly
+    """
+    handler.setLevel(level)
+    _update_logger_level()
+
+
+def remove_log_handler(handler: logging.Handler):
+    if _fan_out_handler is not None:
+        _fan_out_handler.remove_handler(handler)
+        _update_logger_level()
+
 
 class LoggingBridge(logging.Handler, QObject):
+    """
+    Forwards the records to the GUI with a Qt signal
+    Records are emitted from the queue listener thread,
+    the signal is delivered in the thread of the receiver
+    """
+
     loggedLine = pyqtSignal(LogRecord, str)
 
     def __init__(self, level=logging.NOTSET, excluded_modules=None):
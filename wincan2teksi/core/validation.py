@@ -0,0 +1,95 @@
+import logging
+
+from wincan2teksi.core.distance import distribute_distances
+from wincan2teksi.core.section import sections_at_ids
+
+logger = logging.getLogger(__name__)
+
+
+class DistanceIssue:
+    """
+    Observations of an inspection further than the length of the assigned reaches
+    """
+
+    def __init__(self, project_id, section, inspection_id, distances: list, reach_length: float):
+        self.project_id = project_id
+        self.section_id = section.pk
+        self.inspection_id = inspection_id
+        self.counter = section.counter
+        self.from_node = section.from_node
+        self.to_node = section.to_node
+        self.observation_count = len(distances)
+        self.max_distance = max(distances)
+        self.reach_length = reach_length
+
+    @property
+    def overshoot(self) -> float:
+        return self.max_distance - self.reach_length
+
+
+def validate_observation_distances(projects: dict, tolerance: float) -> list:
+    """
+    Checks the distances of the observations of all inspections to import
+    against the length of their assigned reaches, in one batch
+    Returns the list of DistanceIssue
+    Sections without valid assigned reaches are skipped, the import reports them
+    """
+    channel_ids = [
+        channel_id
+        for project in projects.values()
+        for section in project.sections.values()
+        if section.import_ is True
+        for channel_id in (
+            section.teksi_channel_id_1,
+            section.teksi_channel_id_2,
+            section.teksi_channel_id_3,
+        )
+    ]
+    reaches = sections_at_ids(channel_ids)
+
+    issues = []
+    for p_id, project in projects.items():
+        heads = project.section_chain_heads()
+        offsets = project.previous_section_offsets()
+        for s_id, section in project.sections.items():
+            if section.import_ is not True or heads[s_id] is None:
+                continue
+            head = project.sections[heads[s_id]]
+            reach_lengths = []
+            for channel_id in (
+                head.teksi_channel_id_1,
+                head.teksi_channel_id_2,
+                head.teksi_channel_id_3,
+            ):
+                if channel_id is None:
+                    break
+                if channel_id not in reaches:
+                    reach_lengths = []
+                    break
+                reach_lengths.append(reaches[channel_id]["length_effective"] or 0)
+            if not reach_lengths:
+                continue
+
+            for i_id, inspection in section.inspections.items():
+                if not inspection.import_:
+                    continue
+                observations = [o for o in inspection.observations.values() if o.import_]
+                distances = [o.distance + offsets.get(s_id, 0) for o in observations]
+                _, out_of_range = distribute_distances(
+                    distances,
+                    reach_lengths,
+                    tolerance,
+                    [o.force_import for o in observations],
+                )
+                if out_of_range:
+                    issues.append(
+                        DistanceIssue(
+                            p_id,
+                            section,
+                            i_id,
+                            [distances[position] for position in out_of_range],
+                            sum(reach_lengths),
+                        )
+                    )
+    logger.info(f"Observation distance validation: {len(issues)} inspection(s) out of range")
+    return issues
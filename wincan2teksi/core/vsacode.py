@@ -27,10 +27,8 @@ from qgis.core import QgsProject, QgsFeature, QgsFeatureRequest, NULL
 
 from wincan2teksi.core.settings import Settings
 from wincan2teksi.core.exceptions import W2TLayerNotFound
-
-CODE_PREMATCH = {
-    "BAG": "BAGA",
-}
+from wincan2teksi.core.layer_access import get_feature
+from wincan2teksi.core.objects.observation import CODE_PREMATCH
 
 
 def damage_code_to_vl(code: str) -> str:
@@ -48,7 +46,7 @@ def damage_code_to_vl(code: str) -> str:
     code = CODE_PREMATCH.get(code, code)
     request_text = "\"value_en\" = '{}'".format(code)
     request = QgsFeatureRequest().setFilterExpression(request_text)
-    feature = next(layer.getFeatures(request), QgsFeature())
+    feature = get_feature(layer, request, "damage_code_to_vl")
 
     if feature.isValid():
         return feature["code"]
@@ -70,7 +68,7 @@ def damage_level_to_vl(code):
         )
     request_text = "\"value_en\" = 'EZ{}'".format(code)
     request = QgsFeatureRequest().setFilterExpression(request_text)
-    feature = next(layer.getFeatures(request), QgsFeature())
+    feature = get_feature(layer, request, "damage_level_to_vl")
 
     if feature.isValid():
         return feature["code"]
@@ -91,7 +89,7 @@ def damage_level_2_structure_condition(level):
         )
     request_text = "\"value_en\" = 'Z{}'".format(level)
     request = QgsFeatureRequest().setFilterExpression(request_text)
-    feature = next(layer.getFeatures(request), QgsFeature())
+    feature = get_feature(layer, request, "damage_level_2_structure_condition")
 
     if feature.isValid():
         return feature["code"]
@@ -116,7 +114,7 @@ def structure_condition_2_damage_level(code):
 
     request_text = "\"code\" = '{}'".format(code)
     request = QgsFeatureRequest().setFilterExpression(request_text)
-    feature = next(layer.getFeatures(request), QgsFeature())
+    feature = get_feature(layer, request, "structure_condition_2_damage_level")
     # print(request_text, feature.isValid())
 
     if feature.isValid():
@@ -0,0 +1,389 @@
+import logging
+import sqlite3
+import time
+import uuid
+from collections import defaultdict, deque
+from datetime import date, datetime
+
+from qgis.PyQt.QtCore import QDate, QDateTime, QVariant
+from qgis.core import QgsDataSourceUri, QgsFeedback, QgsProviderRegistry
+
+from wincan2teksi.core import tracing
+from wincan2teksi.core.exceptions import ImportWriteError
+from wincan2teksi.core.import_plan import ImportPlan
+from wincan2teksi.core.layer_edit import EditStatistics, ImportSession
+
+logger = logging.getLogger(__name__)
+
+# number of rows written by a single INSERT statement
+INSERT_CHUNK_SIZE = 500
+# number of obj_ids fetched at once from the database default value
+OBJ_ID_BATCH_SIZE = 500
+
+
+def _sql_value(value):
+    """
+    Converts a QGIS attribute value to a value which can be sent to a database driver
+    """
+    if isinstance(value, QVariant):
+        if value.isNull():
+            return None
+        value = value.value()
+    if isinstance(value, QDateTime):
+        return value.toPyDateTime() if value.isValid() else None
+    if isinstance(value, QDate):
+        return value.toPyDate() if value.isValid() else None
+    return value
+
+
+def _feature_details(layer, feature) -> str:
+    return "".join(
+        f"{name}: {value}\n" for name, value in zip(layer.fields().names(), feature.attributes())
+    )
+
+
+class ImportWriter:
+    """
+    Base class of the backends writing an import plan
+    """
+
+    name = None
+
+    def __init__(self, layers: list):
+        self.layers = [layer for layer in layers if layer is not None]
+        # edit session statistics, for the backends writing through edit buffers
+        self.edit_statistics = None
+        # time spent writing the features of each layer and updating the structure conditions
+        self.layer_write_times = {}
+        self.structure_condition_time = 0.0
+
+    def new_obj_id(self, layer):
+        raise NotImplementedError
+
+    def write(self, plan: ImportPlan, feedback: QgsFeedback = None) -> dict:
+        """
+        Writes the features of the plan and updates the structure conditions
+        Returns the obj_ids of the added features by layer id
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _report_progress(feedback, done, total):
+        if feedback is None:
+            return
+        if feedback.isCanceled():
+            raise InterruptedError("Import cancelled by user")
+        feedback.setProgress(100 * done / max(total, 1))
+
+
+class LayerImportWriter(ImportWriter):
+    """
+    Writes through the edit buffers of the QGIS vector layers
+    """
+
+    name = "layers"
+
+    def new_obj_id(self, layer):
+        return layer.dataProvider().defaultValue(layer.fields().indexFromName("obj_id"))
+
+    def write(self, plan: ImportPlan, feedback: QgsFeedback = None) -> dict:
+        added_features = defaultdict(list)
+        total = plan.feature_count()
+        done = 0
+        self.edit_statistics = EditStatistics()
+        with ImportSession(plan.ordered_layers(), self.edit_statistics):
+            for key in ImportPlan.LAYER_KEYS:
+                layer = plan.layers[key]
+                start = time.perf_counter()
+                with tracing.span(
+                    "write layer", layer=layer.name(), features=len(plan.features[key])
+                ):
+                    for feature in plan.features[key]:
+                        if not layer.addFeature(feature):
+                            raise ImportWriteError(
+                                f"error adding feature to {layer.name()} "
+                                f"(fid: {feature['obj_id']}): "
+                                f"error. {_feature_details(layer, feature)}"
+                            )
+                        added_features[layer.id()].append(feature["obj_id"])
+                        done += 1
+                        if done % 100 == 0:
+                            self._report_progress(feedback, done, total)
+                self.layer_write_times[layer.id()] = time.perf_counter() - start
+                logger.debug(f"added {len(plan.features[key])} features to {layer.name()}")
+
+            wsl = plan.wastewater_structure_layer
+            if wsl is not None:
+                start = time.perf_counter()
+                field_index = wsl.fields().indexFromName("structure_condition")
+                for fid, structure_condition in plan.structure_conditions.values():
+                    wsl.changeAttributeValue(fid, field_index, structure_condition)
+                    done += 1
+                self.structure_condition_time = time.perf_counter() - start
+                self._report_progress(feedback, done, total)
+        return dict(added_features)
+
+
+class SqlImportWriter(ImportWriter):
+    """
+    Base class of the backends writing directly to the database of the layers
+    with multi-row INSERT statements in a single transaction
+    """
+
+    placeholder = None
+
+    def __init__(self, layers: list):
+        super().__init__(layers)
+        for layer in self.layers:
+            if layer.isEditable():
+                raise ImportWriteError(
+                    f"Layer {layer.name()} is in edit mode, save or discard its changes first"
+                )
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = self._connect()
+        return self._connection
+
+    def _connect(self):
+        raise NotImplementedError
+
+    def _table(self, layer) -> str:
+        raise NotImplementedError
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"{}"'.format(identifier.replace('"', '""'))
+
+    def _insert(self, cursor, table: str, columns: list, rows: list) -> list:
+        """
+        Inserts the rows with a multi-row INSERT and returns the inserted obj_ids
+        """
+        raise NotImplementedError
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def _columns(layer, features) -> list:
+        # only write provider fields which have a value, others get their default
+        return [
+            name
+            for name in layer.dataProvider().fields().names()
+            if any(_sql_value(feature[name]) is not None for feature in features)
+        ]
+
+    def write(self, plan: ImportPlan, feedback: QgsFeedback = None) -> dict:
+        added_features = defaultdict(list)
+        total = plan.feature_count()
+        done = 0
+        try:
+            with self.connection:
+                cursor = self.connection.cursor()
+                for key in ImportPlan.LAYER_KEYS:
+                    layer = plan.layers[key]
+                    features = plan.features[key]
+                    if not features:
+                        continue
+                    columns = self._columns(layer, features)
+                    table = self._table(layer)
+                    start = time.perf_counter()
+                    with tracing.span("write layer", layer=layer.name(), features=len(features)):
+                        for offset in range(0, len(features), INSERT_CHUNK_SIZE):
+                            chunk = features[offset : offset + INSERT_CHUNK_SIZE]
+                            rows = [
+                                [self._value(_sql_value(feature[name])) for name in columns]
+                                for feature in chunk
+                            ]
+                            added_features[layer.id()].extend(
+                                self._insert(cursor, table, columns, rows)
+                            )
+                            done += len(chunk)
+                            self._report_progress(feedback, done, total)
+                    self.layer_write_times[layer.id()] = time.perf_counter() - start
+                    logger.debug(f"inserted {len(features)} rows into {table}")
+
+                wsl = plan.wastewater_structure_layer
+                if wsl is not None and plan.structure_conditions:
+                    start = time.perf_counter()
+                    query = "UPDATE {} SET {} = {p} WHERE {} = {p}".format(
+                        self._table(wsl),
+                        self._quote("structure_condition"),
+                        self._quote("obj_id"),
+                        p=self.placeholder,
+                    )
+                    updates = [
+                        (code, ws_obj_id)
+                        for ws_obj_id, (_fid, code) in plan.structure_conditions.items()
+                    ]
+                    cursor.executemany(query, updates)
+                    self.structure_condition_time = time.perf_counter() - start
+                    done += len(plan.structure_conditions)
+                    self._report_progress(feedback, done, total)
+        except (InterruptedError, ImportWriteError):
+            raise
+        except Exception as e:
+            raise ImportWriteError(f"error writing the import with {self.name}: {e}") from e
+
+        for layer in plan.ordered_layers():
+            layer.dataProvider().reloadData()
+            layer.triggerRepaint()
+        return dict(added_features)
+
+    @staticmethod
+    def _value(value):
+        return value
+
+
+class PostgresImportWriter(SqlImportWriter):
+    """
+    Writes directly to the PostgreSQL database of the layers using psycopg2
+    """
+
+    name = "postgresql"
+    placeholder = "%s"
+
+    def __init__(self, layers: list):
+        super().__init__(layers)
+        connection_infos = set()
+        for layer in self.layers:
+            if layer.providerType() != "postgres":
+                raise ImportWriteError(f"Layer {layer.name()} is not a PostgreSQL layer")
+            connection_infos.add(QgsDataSourceUri(layer.source()).connectionInfo(False))
+        if len(connection_infos) != 1:
+            raise ImportWriteError("All layers must be stored in the same PostgreSQL database")
+        self._obj_ids = defaultdict(deque)
+
+    def _connect(self):
+        try:
+            import psycopg2
+        except ImportError:
+            raise ImportWriteError(
+                "psycopg2 is not installed, it is required by the PostgreSQL writer backend"
+            )
+        uri = QgsDataSourceUri(self.layers[0].source())
+        return psycopg2.connect(uri.connectionInfo(True))
+
+    def _table(self, layer) -> str:
+        uri = QgsDataSourceUri(layer.source())
+        return f"{self._quote(uri.schema())}.{self._quote(uri.table())}"
+
+    def new_obj_id(self, layer):
+        obj_ids = self._obj_ids[layer.id()]
+        if not obj_ids:
+            provider = layer.dataProvider()
+            clause = provider.defaultValueClause(provider.fields().indexFromName("obj_id"))
+            if not clause:
+                raise ImportWriteError(f"Layer {layer.name()} has no default value for obj_id")
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"SELECT {clause} FROM generate_series(1, %s)", (OBJ_ID_BATCH_SIZE,))
+                obj_ids.extend(row[0] for row in cursor.fetchall())
+            # obj_ids come from a sequence, do not keep the connection in a transaction
+            self.connection.commit()
+        return obj_ids.popleft()
+
+    def _insert(self, cursor, table: str, columns: list, rows: list) -> list:
+        from psycopg2.extras import execute_values
+
+        query = "INSERT INTO {} ({}) VALUES %s RETURNING {}".format(
+            table, ", ".join(self._quote(c) for c in columns), self._quote("obj_id")
+        )
+        returned = execute_values(cursor, query, rows, page_size=len(rows), fetch=True)
+        return [row[0] for row in returned]
+
+
+class SqliteImportWriter(SqlImportWriter):
+    """
+    Writes directly to the SQLite/GeoPackage file of the layers, mostly used for local testing
+    """
+
+    name = "sqlite"
+    placeholder = "?"
+
+    def __init__(self, layers: list):
+        super().__init__(layers)
+        self._tables = {}
+        paths = set()
+        for layer in self.layers:
+            parts = QgsProviderRegistry.instance().decodeUri(layer.providerType(), layer.source())
+            if layer.providerType() not in ("ogr", "spatialite") or not parts.get("path"):
+                raise ImportWriteError(f"Layer {layer.name()} is not a SQLite/GeoPackage layer")
+            paths.add(parts["path"])
+            self._tables[layer.id()] = parts.get("layerName") or parts.get("table")
+        if len(paths) != 1:
+            raise ImportWriteError("All layers must be stored in the same SQLite/GeoPackage file")
+        self._path = paths.pop()
+
+    def _connect(self):
+        return sqlite3.connect(self._path)
+
+    def _table(self, layer) -> str:
+        return self._quote(self._tables[layer.id()])
+
+    def new_obj_id(self, layer):
+        return uuid.uuid4().hex[:16]
+
+    @staticmethod
+    def _value(value):
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        return value
+
+    def _insert(self, cursor, table: str, columns: list, rows: list) -> list:
+        column_list = ", ".join(self._quote(c) for c in columns)
+        row_placeholders = "({})".format(", ".join("?" * len(columns)))
+        obj_id_index = columns.index("obj_id")
+        # keep below the default limit of host parameters
+        rows_per_statement = max(1, 999 // max(len(columns), 1))
+        obj_ids = []
+        for start in range(0, len(rows), rows_per_statement):
+            chunk = rows[start : start + rows_per_statement]
+            query = "INSERT INTO {} ({}) VALUES {}".format(
+                table, column_list, ", ".join([row_placeholders] * len(chunk))
+            )
+            cursor.execute(query, [value for row in chunk for value in row])
+            obj_ids.extend(row[obj_id_index] for row in chunk)
+        return obj_ids
+
+
+class DryRunImportWriter(ImportWriter):
+    """
+    Does not write anything, used to plan an import and report what would be written
+    """
+
+    name = "dry run"
+
+    def __init__(self, layers: list):
+        super().__init__(layers)
+        self._count = 0
+
+    def new_obj_id(self, layer):
+        # placeholder, the real obj_ids are only known when writing
+        self._count += 1
+        return f"dryrun{self._count:010d}"
+
+    def write(self, plan: ImportPlan, feedback: QgsFeedback = None) -> dict:
+        return {}
+
+
+WRITER_BACKENDS = {
+    LayerImportWriter.name: LayerImportWriter,
+    PostgresImportWriter.name: PostgresImportWriter,
+    SqliteImportWriter.name: SqliteImportWriter,
+}
+
+
+def create_import_writer(backend: str, layers: list) -> ImportWriter:
+    """
+    Creates the writer for the given backend name
+    """
+    if backend not in WRITER_BACKENDS:
+        raise ImportWriteError(f"Unknown writer backend: {backend}")
+    return WRITER_BACKENDS[backend](layers)
@@ -28,19 +28,35 @@
 import json
 import re
 import os
-from collections import defaultdict
+import time
 from datetime import datetime
 
-from qgis.PyQt.QtCore import pyqtSlot, QCoreApplication, QUrl, QStandardPaths
+from qgis.PyQt.QtCore import pyqtSlot, QCoreApplication, QDateTime, QUrl
 from qgis.PyQt.QtGui import QAction, QDesktopServices
-from qgis.PyQt.QtWidgets import QDialog, QGroupBox, QMenuBar, QMessageBox, QVBoxLayout
-from qgis.PyQt.uic import loadUiType
+from qgis.PyQt.QtWidgets import (
+    QDialog,
+    QFileDialog,
+    QGroupBox,
+    QMenuBar,
+    QMessageBox,
+    QVBoxLayout,
+)
 
-from qgis.core import Qgis, QgsExpressionContextUtils, QgsProject, QgsFeature, QgsFeatureRequest
+from qgis.core import (
+    Qgis,
+    QgsEditError,
+    QgsExpressionContextUtils,
+    QgsFeedback,
+    QgsProject,
+    QgsFeature,
+    QgsFeatureRequest,
+)
 from qgis.gui import QgsGui, QgsAttributeEditorContext, QgisInterface, QgsMessageBar
 
+from wincan2teksi.core import layer_access, tracing
 from wincan2teksi.core.settings import Settings
-from wincan2teksi.core.exceptions import W2TLayerNotFound
+from wincan2teksi.core.exceptions import ImportWriteError, W2TLayerNotFound
+from wincan2teksi.core.distance import distribute_distances
 from wincan2teksi.core.section import find_section, section_at_id
 from wincan2teksi.core.vsacode import (
     damage_code_to_vl,
@@ -48,20 +64,22 @@ from wincan2teksi.core.vsacode import (
     damage_level_2_structure_condition,
     structure_condition_2_damage_level,
 )
-from wincan2teksi.core.layer_edit import edit
+from wincan2teksi.core.import_plan import ImportPlan, ImportStatistics
+from wincan2teksi.core.layer_access import get_feature
+from wincan2teksi.core.validation import validate_observation_distances
+from wincan2teksi.core.writers import DryRunImportWriter, create_import_writer
 from wincan2teksi.core.read_data import WinCanData
+from wincan2teksi.core.utils import import_log_dir, plugin_version
 from wincan2teksi.gui.logs_widget import LogsWidget
 from wincan2teksi.gui.settings_dialog import SettingsDialog
 from wincan2teksi.gui.undoimportdialog import UndoImportDialog
+from wincan2teksi.gui.validationreportdialog import ValidationReportDialog
+from wincan2teksi.ui.ui_databrowserdialog import Ui_DataBrowserDialog
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-Ui_DataBrowserDialog, _ = loadUiType(
-    os.path.join(os.path.dirname(__file__), "..", "ui", "databrowserdialog.ui")
-)
-
 
 class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
     def __init__(self, iface: QgisInterface, data: WinCanData, data_path=""):
@@ -71,6 +89,9 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         self.settings = Settings()
         self.projects = data.projects
         self.current_project_id = None
+        # times of the load and of the last channel search, stored in the import logs
+        self.load_time = data.load_time
+        self.search_time = None
         self.channelNameEdit.setFocus()
         self.cancel = False
 
@@ -115,6 +136,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         self.cancelButton.hide()
 
         self.relationWidgetWrapper = None
+        self._validation_report = None
         maintenance_layer = QgsProject.instance().mapLayer(self.settings.maintenance_layer.value())
         if maintenance_layer is not None:
             organisation_layer_id = self.settings.organisation_layer.value()
@@ -153,8 +175,26 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         menu_bar.setNativeMenuBar(False)
         tools_menu = menu_bar.addMenu(self.tr("Tools"))
         tools_menu.addAction(self.tr("Settings..."), self._open_settings)
+        tools_menu.addAction(
+            self.tr("Validate observation distances..."), self._open_validation_report
+        )
+        tools_menu.addAction(self.tr("Dry run import..."), self._dry_run_import)
         tools_menu.addAction(self.tr("Undo import..."), self._open_undo_import)
         tools_menu.addAction(self.tr("Open import logs folder"), self._open_import_logs_folder)
+        tracing_menu = tools_menu.addMenu(self.tr("Tracing"))
+        self._tracing_action = QAction(self.tr("Enable tracing"), self)
+        self._tracing_action.setCheckable(True)
+        self._tracing_action.setChecked(tracing.is_enabled())
+        self._tracing_action.triggered.connect(self._toggle_tracing)
+        tracing_menu.addAction(self._tracing_action)
+        tracing_menu.addAction(self.tr("Export trace as JSON..."), self._export_trace_json)
+        tracing_menu.addAction(self.tr("Export Chrome trace..."), self._export_chrome_trace)
+        tracing_menu.addAction(self.tr("Clear trace"), tracing.clear)
+        tracing_menu.addSeparator()
+        tracing_menu.addAction(self.tr("Log layer request statistics"), layer_access.log_statistics)
+        tracing_menu.addAction(
+            self.tr("Reset layer request statistics"), layer_access.reset_statistics
+        )
 
         view_menu = menu_bar.addMenu(self.tr("View"))
         self._toggle_logs_action = QAction(self.tr("Show Logs"), self)
@@ -184,6 +224,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         self.cancel = True
 
     @pyqtSlot()
+    @tracing.traced("channel search")
     def on_searchButton_clicked(self):
         if self.current_project_id is None:
             return
@@ -235,6 +276,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         i = 0
 
         logger.info(f"Starting channel search (channel='{channel}', {c} sections)")
+        search_start = time.perf_counter()
 
         # find sections
         for project in self.projects.values():
@@ -263,7 +305,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                     self.cancelButton.hide()
                     self.importButton.show()
                     self.sectionWidget.setEnabled(True)
-                    self.sectionWidget.set_project_id(self.current_project_id)
+                    self.sectionWidget.update_status()
                     return
                 for section in project.sections.values():
                     section.teksi_channel_id_1 = None
@@ -304,24 +346,38 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
             if s.teksi_channel_id_1 is not None
         )
         total = sum(len(p.sections) for p in self.projects.values())
-        logger.info(f"Channel search completed: {matched}/{total} sections matched")
+        self.search_time = time.perf_counter() - search_start
+        logger.info(
+            f"Channel search completed: {matched}/{total} sections matched"
+            f" in {self.search_time:.1f} s"
+        )
 
         self.progressBar.hide()
         self.cancelButton.hide()
         self.importButton.show()
 
         self.sectionWidget.setEnabled(True)
-        self.sectionWidget.set_project_id(self.current_project_id)
+        # only signals the sections whose match status changed
+        self.sectionWidget.update_status()
 
     @pyqtSlot()
     def on_importButton_clicked(self):
+        self._run_import(dry_run=False)
+
+    def _dry_run_import(self):
+        self._run_import(dry_run=True)
+
+    def _run_import(self, dry_run: bool):
+        """
+        Prepares the import and writes it, or only reports what would be written in a dry run
+        """
         self.message_bar.clearWidgets()
 
         # Warn if some sections are unchecked
         unchecked = sum(
             1 for p in self.projects.values() for s in p.sections.values() if not s.import_
         )
-        if unchecked:
+        if unchecked and not dry_run:
             reply = QMessageBox.warning(
                 self,
                 self.tr("Unchecked sections"),
@@ -334,6 +390,90 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
+        # check all the observation distances at once, so that they can be fixed before importing
+        issues = self._validate_distances(show_report=False)
+        if issues is None:
+            return
+        if issues and not dry_run:
+            self.message_bar.pushMessage(
+                self.tr("Error"),
+                self.tr(
+                    "{n} inspection(s) have observations further than the length"
+                    " of the assigned channels, see the validation report."
+                ).format(n=len(issues)),
+                Qgis.MessageLevel.Critical,
+            )
+            return
+
+        # initialize layers
+        maintenance_layer_id = self.settings.maintenance_layer.value()
+        maintenance_layer = QgsProject.instance().mapLayer(maintenance_layer_id)
+        damage_layer_id = self.settings.damage_layer.value()
+        damage_layer = QgsProject.instance().mapLayer(damage_layer_id)
+        join_layer_id = self.settings.join_maintence_wastewaterstructure_layer.value()
+        join_layer = QgsProject.instance().mapLayer(join_layer_id)
+        if join_layer is None:
+            self.message_bar.pushMessage(
+                self.tr("Error"),
+                self.tr("The join layer '{layer_id}' is missing in the project.").format(
+                    layer_id=join_layer_id
+                ),
+                Qgis.MessageLevel.Critical,
+            )
+            self.hide_progress()
+            return
+        file_layer_id = self.settings.file_layer.value()
+        file_layer = QgsProject.instance().mapLayer(file_layer_id)
+        wsl_layer_id = self.settings.wastewater_structure_layer.value()
+        wsl = QgsProject.instance().mapLayer(wsl_layer_id)
+        layers = {
+            ImportPlan.MAINTENANCE: maintenance_layer,
+            ImportPlan.DAMAGE: damage_layer,
+            ImportPlan.FILE: file_layer,
+            ImportPlan.JOIN: join_layer,
+        }
+
+        try:
+            if dry_run:
+                writer = DryRunImportWriter(list(layers.values()) + [wsl])
+            else:
+                writer = create_import_writer(
+                    self.settings.writer_backend.value(), list(layers.values()) + [wsl]
+                )
+        except ImportWriteError as e:
+            logger.error(str(e))
+            self.message_bar.pushMessage(self.tr("Error"), str(e), Qgis.MessageLevel.Critical)
+            return
+
+        statistics = ImportStatistics(dry_run)
+        # a dry run reports the issues and prepares the other observations
+        statistics.distance_issues = issues
+        start = time.perf_counter()
+        try:
+            with tracing.span("import", dry_run=dry_run, backend=writer.name):
+                features = self._prepare_import(maintenance_layer, damage_layer, writer, statistics)
+                if features is None:
+                    return
+                plan = self._build_import_plan(
+                    features, ImportPlan(layers, wsl), writer, statistics
+                )
+                if plan is None:
+                    return
+                if dry_run:
+                    self.hide_progress()
+                    self._report_dry_run(plan, statistics, time.perf_counter() - start)
+                else:
+                    self._write_import(plan, writer, statistics, time.perf_counter() - start)
+        finally:
+            writer.close()
+
+    @tracing.traced("import: preparation")
+    def _prepare_import(self, maintenance_layer, damage_layer, writer, statistics):
+        """
+        Assigns the observations of the inspections to import to the TEKSI reaches
+        and creates the maintenance events and damages by wastewater structure
+        Returns None if the import is aborted
+        """
         always_skip_invalid_codes = False
 
         # init progress bar
@@ -352,34 +492,43 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         i = 0
 
         logger.info(f"Starting import of {c} sections")
-
-        # initialize maintenance and damage layers and features
-        maintenance_layer_id = self.settings.maintenance_layer.value()
-        maintenance_layer = QgsProject.instance().mapLayer(maintenance_layer_id)
-        damage_layer_id = self.settings.damage_layer.value()
-        damage_layer = QgsProject.instance().mapLayer(damage_layer_id)
-        join_layer_id = self.settings.join_maintence_wastewaterstructure_layer.value()
-        join_layer = QgsProject.instance().mapLayer(join_layer_id)
-        if join_layer is None:
-            self.message_bar.pushMessage(
-                self.tr("Error"),
-                self.tr("The join layer '{layer_id}' is missing in the project."),
-                Qgis.MessageLevel.Critical,
-            )
-            self.hide_progress()
-            return
         features = {}  # dictionnary with waste water structure id (reach) as key, and as values: a dict with maintenance event and damages
 
         for p_id in self.projects.keys():
-            previous_section_imported = True
+            # sections using the previous section are validated for the whole project at once
+            invalid_chains = self.projects[p_id].invalid_section_chains()
+            if invalid_chains:
+                for invalid_s_id in invalid_chains:
+                    section = self.projects[p_id].sections[invalid_s_id]
+                    logger.error(
+                        f"Section {section.counter} from manhole {section.from_node}"
+                        f" to {section.to_node} uses previous channel, but it is not defined."
+                    )
+                section = self.projects[p_id].sections[invalid_chains[0]]
+                self.message_bar.pushMessage(
+                    self.tr("Error"),
+                    self.tr(
+                        "Inspection {i} from manhole {c1} to {c2}"
+                        " uses previous channel, but it is not defined."
+                    ).format(
+                        i=section.counter,
+                        c1=section.from_node,
+                        c2=section.to_node,
+                    ),
+                    Qgis.MessageLevel.Critical,
+                )
+                self.sectionWidget.select_section(invalid_chains[0])
+                self.hide_progress()
+                return None
+            distance_offsets = self.projects[p_id].previous_section_offsets()
+
             for s_id, section in self.projects[p_id].sections.items():
                 QCoreApplication.processEvents()
                 if self.cancel:
                     self.hide_progress()
-                    return
+                    return None
 
                 if section.import_ is not True:
-                    previous_section_imported = False
                     continue
 
                 for i_id, inspection in self.projects[p_id].sections[s_id].inspections.items():
@@ -389,7 +538,6 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                         distance_offset = 0
 
                         if section.use_previous_section is not True:
-                            previous_section_imported = True
                             # get corresponding reaches in teksi project
                             reach_features = []
 
@@ -400,7 +548,8 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                             ]:
                                 if fid is None:
                                     break
-                                f = section_at_id(fid)
+                                with statistics.timed(ImportStatistics.REACH_ASSIGNMENT):
+                                    f = section_at_id(fid)
                                 if f.isValid() is False:
                                     self.message_bar.pushMessage(
                                         self.tr("Error"),
@@ -416,7 +565,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                                     )
                                     self.sectionWidget.select_section(s_id)
                                     self.hide_progress()
-                                    return
+                                    return None
                                 reach_features.append(QgsFeature(f))
 
                             if len(reach_features) == 0:
@@ -434,7 +583,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                                 )
                                 self.sectionWidget.select_section(s_id)
                                 self.hide_progress()
-                                return
+                                return None
 
                             # create maintenance/examination event (one per teksi reach feature)
                             for rf in reach_features:
@@ -444,14 +593,16 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                                 init_fields = maintenance_layer.fields()
                                 mf.setFields(init_fields)
                                 mf.initAttributes(init_fields.size())
-                                mf["obj_id"] = maintenance_layer.dataProvider().defaultValue(
-                                    maintenance_layer.fields().indexFromName("obj_id")
-                                )
+                                mf["obj_id"] = writer.new_obj_id(maintenance_layer)
                                 # mf['identifier'] = i_id  # use custom id to retrieve feature
                                 mf["maintenance_event_type"] = "examination"
                                 mf["kind"] = 4564  # vl_maintenance_event_kind: inspection
                                 mf["operator"] = inspection.operator
-                                mf["time_point"] = inspection.start_date
+                                mf["time_point"] = (
+                                    QDateTime(inspection.start_date)
+                                    if inspection.start_date
+                                    else None
+                                )
                                 mf["remark"] = ""
                                 mf["status"] = 2550  # vl_maintenance_event: accomplished
                                 mf["inspected_length"] = section.section_length
@@ -477,469 +628,298 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
                         else:
                             # in case several sections in inspection data correspond to a single section in teksi data
                             # substract length from previous sections in inspection data
-                            if not previous_section_imported:
-                                self.message_bar.pushMessage(
-                                    self.tr("Error"),
-                                    self.tr(
-                                        "Inspection {i} from manhole {c1} to {c2}"
-                                        " uses previous channel, but it is not defined."
-                                    ).format(
-                                        i=section.counter,
-                                        c1=section.from_node,
-                                        c2=section.to_node,
-                                    ),
-                                    Qgis.MessageLevel.Critical,
-                                )
-                                self.sectionWidget.select_section(s_id)
-                                self.hide_progress()
-                                return
-                            distance_offset = 0
-                            offset_section_id = s_id
-                            while (
-                                self.projects[p_id].sections[offset_section_id].use_previous_section
-                                is True
-                            ):
-                                # get previous section id
-                                offset_section_id_index = list(self.projects[p_id].sections).index(
-                                    offset_section_id
-                                )
-                                assert offset_section_id_index > 0
-                                offset_section_id = list(self.projects[p_id].sections)[
-                                    offset_section_id_index - 1
-                                ]
-                                # accumulate offset
-                                distance_offset -= (
-                                    self.projects[p_id].sections[offset_section_id].section_length
-                                )
-                                logger.debug(
-                                    "using previous section: {} with distance offset {}".format(
-                                        offset_section_id, distance_offset
-                                    )
-                                )
+                            distance_offset = distance_offsets[s_id]
+                            logger.debug(
+                                f"using previous sections with distance offset {distance_offset}"
+                            )
 
-                                # add corresponding damages
-                        reach_index = 0
+                            # add corresponding damages
                         structure_condition = 4  # = ok
-                        for observation in (
-                            self.projects[p_id]
+                        observations = [
+                            observation
+                            for observation in self.projects[p_id]
                             .sections[s_id]
                             .inspections[i_id]
                             .observations.values()
-                        ):
-                            if observation.import_:
-                                distance = observation.distance + distance_offset
-                                if not observation.force_import:
-                                    while (
-                                        distance > reach_features[reach_index]["length_effective"]
-                                    ):
-                                        if reach_index < len(reach_features) - 1:
-                                            distance -= reach_features[reach_index][
-                                                "length_effective"
-                                            ]
-                                            reach_index += 1
-                                        else:
-                                            if (
-                                                distance
-                                                <= reach_features[reach_index]["length_effective"]
-                                                + self.settings.tolerance_channel_length.value()
-                                            ):  # add 50cm tolerance
-                                                break
-                                            else:
-                                                self.message_bar.pushMessage(
-                                                    self.tr("Error"),
-                                                    self.tr(
-                                                        "Inspection {i} from manhole {c1} to {c2}"
-                                                        " has observations further than the length"
-                                                        " of the assigned channels."
-                                                    ).format(
-                                                        i=section.counter,
-                                                        c1=section.from_node,
-                                                        c2=section.to_node,
-                                                    ),
-                                                    Qgis.MessageLevel.Critical,
-                                                )
-                                                self.sectionWidget.select_section(s_id)
-                                                self.hide_progress()
-                                                return
-
-                                # create maintenance/examination event
+                            if observation.import_
+                        ]
+                        with statistics.timed(ImportStatistics.DISTANCE_DISTRIBUTION):
+                            placements, out_of_range = distribute_distances(
+                                [o.distance + distance_offset for o in observations],
+                                [rf["length_effective"] for rf in reach_features],
+                                self.settings.tolerance_channel_length.value(),
+                                [o.force_import for o in observations],
+                            )
+                        if out_of_range and statistics.dry_run:
+                            # reported with the distance issues, the others are still prepared
+                            observations = [
+                                o
+                                for o, placement in zip(observations, placements)
+                                if placement is not None
+                            ]
+                            placements = [p for p in placements if p is not None]
+                        elif out_of_range:
+                            for position in out_of_range:
+                                logger.error(
+                                    f"Inspection {section.counter} from manhole {section.from_node}"
+                                    f" to {section.to_node}: observation {observations[position].code}"
+                                    f" at {observations[position].distance} m is further than"
+                                    " the length of the assigned channels."
+                                )
+                            self.message_bar.pushMessage(
+                                self.tr("Error"),
+                                self.tr(
+                                    "Inspection {i} from manhole {c1} to {c2}"
+                                    " has {n} observation(s) further than the length"
+                                    " of the assigned channels."
+                                ).format(
+                                    i=section.counter,
+                                    c1=section.from_node,
+                                    c2=section.to_node,
+                                    n=len(out_of_range),
+                                ),
+                                Qgis.MessageLevel.Critical,
+                            )
+                            self.sectionWidget.select_section(s_id)
+                            self.hide_progress()
+                            return None
+
+                        for observation, (reach_index, distance) in zip(observations, placements):
+                            # create maintenance/examination event
+                            with statistics.timed(ImportStatistics.CODE_TRANSLATION):
                                 single_damage_class = damage_level_to_vl(observation.rate)
                                 channel_damage_code = damage_code_to_vl(observation.code)
-                                if channel_damage_code is not None:
-                                    channel_damage_code = int(channel_damage_code)
-
-                                if single_damage_class is None or channel_damage_code is None:
-                                    if always_skip_invalid_codes:
-                                        observation.import_ = False
-                                        continue
-                                    message = ""
-                                    if single_damage_class is None:
-                                        message = self.tr("Invalid damage level: '{level}'").format(
-                                            level=observation.rate
-                                        )
-                                    if channel_damage_code is None:
-                                        message += self.tr("Invalid damage code: '{code}'").format(
-                                            code=observation.code
-                                        )
-                                    reply = QMessageBox.question(
-                                        self,
-                                        self.tr("Invalid damage data"),
-                                        self.tr(
-                                            "Inspection {i} from manhole {c1} to {c2} has invalid damage code or level.\n"
-                                            "{message}\n"
-                                            "Insert without value?"
-                                        ).format(
-                                            i=section.counter,
-                                            c1=section.from_node,
-                                            c2=section.to_node,
-                                            message=message,
-                                        ),
-                                        QMessageBox.Yes | QMessageBox.YesToAll | QMessageBox.No,
+                            if channel_damage_code is not None:
+                                channel_damage_code = int(channel_damage_code)
+
+                            if single_damage_class is None:
+                                statistics.unresolved_codes["level", observation.rate] += 1
+                            if channel_damage_code is None:
+                                statistics.unresolved_codes["code", observation.code] += 1
+
+                            if statistics.dry_run:
+                                # report invalid codes instead of asking
+                                if single_damage_class is None:
+                                    single_damage_class = 4561
+                            elif single_damage_class is None or channel_damage_code is None:
+                                if always_skip_invalid_codes:
+                                    observation.import_ = False
+                                    continue
+                                message = ""
+                                if single_damage_class is None:
+                                    message = self.tr("Invalid damage level: '{level}'").format(
+                                        level=observation.rate
+                                    )
+                                if channel_damage_code is None:
+                                    message += self.tr("Invalid damage code: '{code}'").format(
+                                        code=observation.code
                                     )
-                                    if reply == QMessageBox.No:
-                                        self.hide_progress()
-                                        return
-                                    elif reply == QMessageBox.YesToAll:
-                                        always_skip_invalid_codes = True
-
-                                    if single_damage_class is None:
-                                        # set to unknown
-                                        single_damage_class = 4561
-
-                                df = QgsFeature()
-                                init_fields = damage_layer.fields()
-                                df.setFields(init_fields)
-                                df.initAttributes(init_fields.size())
-                                df["obj_id"] = damage_layer.dataProvider().defaultValue(
-                                    damage_layer.fields().indexFromName("obj_id")
+                                reply = QMessageBox.question(
+                                    self,
+                                    self.tr("Invalid damage data"),
+                                    self.tr(
+                                        "Inspection {i} from manhole {c1} to {c2} has invalid damage code or level.\n"
+                                        "{message}\n"
+                                        "Insert without value?"
+                                    ).format(
+                                        i=section.counter,
+                                        c1=section.from_node,
+                                        c2=section.to_node,
+                                        message=message,
+                                    ),
+                                    QMessageBox.Yes | QMessageBox.YesToAll | QMessageBox.No,
                                 )
-                                df["damage_type"] = "channel"
-                                df["comments"] = observation.text
-                                df["single_damage_class"] = single_damage_class
-                                df["channel_damage_code"] = channel_damage_code
-                                df["distance"] = distance
-                                df["video_counter"] = observation.mpeg_position
-                                # media files
-                                mms = observation.mmfiles
-                                # get wastewater structure id
-                                ws_obj_id = reach_features[reach_index]["ws_obj_id"]
-                                features[ws_obj_id]["damages"].append(df)
-                                features[ws_obj_id]["media"].append(mms)
-                                if observation.rate is not None:
-                                    structure_condition = min(structure_condition, observation.rate)
-                                features[ws_obj_id]["structure_condition"] = structure_condition
+                                if reply == QMessageBox.No:
+                                    self.hide_progress()
+                                    return None
+                                elif reply == QMessageBox.YesToAll:
+                                    always_skip_invalid_codes = True
+
+                                if single_damage_class is None:
+                                    # set to unknown
+                                    single_damage_class = 4561
+
+                            df = QgsFeature()
+                            init_fields = damage_layer.fields()
+                            df.setFields(init_fields)
+                            df.initAttributes(init_fields.size())
+                            df["obj_id"] = writer.new_obj_id(damage_layer)
+                            df["damage_type"] = "channel"
+                            df["comments"] = observation.text
+                            df["single_damage_class"] = single_damage_class
+                            df["channel_damage_code"] = channel_damage_code
+                            df["distance"] = distance
+                            df["video_counter"] = observation.mpeg_position
+                            # media files
+                            mms = observation.mmfiles
+                            # get wastewater structure id
+                            ws_obj_id = reach_features[reach_index]["ws_obj_id"]
+                            features[ws_obj_id]["damages"].append(df)
+                            features[ws_obj_id]["media"].append(mms)
+                            if observation.rate is not None:
+                                structure_condition = min(structure_condition, observation.rate)
+                            features[ws_obj_id]["structure_condition"] = structure_condition
                 self.progressBar.setValue(i)
                 i += 1
 
+        return features
+
+    @tracing.traced("import: plan")
+    def _build_import_plan(self, features, plan, writer, statistics):
+        """
+        Creates all the features to write, including media files and joins,
+        and determines the structure condition updates
+        Returns None if the import is aborted
+        """
         self.progressBar.setMaximum(len(features))
         self.progressBar.setMinimum(0)
         self.progressBar.setValue(0)
-        self.progressBar.setFormat(self.tr("Importing %v/%m"))
-        self.progressBar.show()
-        self.cancelButton.show()
-        self.importButton.hide()
+        self.progressBar.setFormat(self.tr("Preparing %v/%m"))
         self.cancel = False
 
-        file_layer_id = Settings().file_layer.value()
-        file_layer = QgsProject.instance().mapLayer(file_layer_id)
-
-        wsl_layer_id = Settings().wastewater_structure_layer.value()
-        wsl = QgsProject.instance().mapLayer(wsl_layer_id)
-
+        file_layer = plan.layers[ImportPlan.FILE]
+        wsl = plan.wastewater_structure_layer
         skip_missing_files = False
-        added_features = defaultdict(list)
+
+        def file_feature(object_obj_id, file_class, kind, identifier, folder):
+            nonlocal skip_missing_files
+            of = plan.new_feature(ImportPlan.FILE, writer.new_obj_id(file_layer))
+            of["class"] = file_class
+            of["kind"] = kind
+            of["object"] = object_obj_id
+            of["identifier"] = identifier
+            sep = os.path.sep
+            of["path_relative"] = self.data_path_line_edit.filePath() + f"{sep}{folder}{sep}Sec"
+            # Check if file exists
+            full_path = os.path.join(of["path_relative"], identifier)
+            with statistics.timed(ImportStatistics.MEDIA_RESOLUTION):
+                exists = os.path.exists(full_path)
+            if not exists:
+                statistics.missing_media.append(full_path)
+                if not statistics.dry_run:
+                    continue_import, skip_missing_files = self.check_media_file_exists(
+                        full_path, skip_missing_files
+                    )
+                    if not continue_import:
+                        raise InterruptedError("Import cancelled by user")
+            return of
 
         try:
-            with edit(join_layer):
-                with edit(file_layer):
-                    with edit(damage_layer):
-                        with edit(maintenance_layer):
-                            i = 0
-                            for ws_obj_id, elements in features.items():
-                                QCoreApplication.processEvents()
-                                if self.cancel:
-                                    raise InterruptedError("Import cancelled by user")
-
-                                maintenance = elements["maintenance"]
-                                damages = elements["damages"]
-                                media = elements["media"]
-                                structure_condition = elements["structure_condition"]
-
-                                if len(damages) == 0:
-                                    continue
+            for i, (ws_obj_id, elements) in enumerate(features.items()):
+                QCoreApplication.processEvents()
+                if self.cancel:
+                    raise InterruptedError("Import cancelled by user")
 
-                                # write video for maintenance event
-                                videos = []
-                                for k, _ in enumerate(damages):
-                                    for mf in media[k]:
-                                        if mf[1] in videos:
-                                            continue
-                                        if mf[0] == "video":
-                                            maintenance["videonumber"] = mf[1]
-
-                                            of = QgsFeature()
-                                            init_fields = file_layer.fields()
-                                            of.setFields(init_fields)
-                                            of.initAttributes(init_fields.size())
-                                            of["obj_id"] = file_layer.dataProvider().defaultValue(
-                                                file_layer.fields().indexFromName("obj_id")
-                                            )
-                                            of["class"] = 3825  # i.e. maintenance event
-                                            of["kind"] = 3775  # i.e. video
-                                            of["object"] = maintenance["obj_id"]
-                                            of["identifier"] = mf[1]
-                                            sep = os.path.sep
-                                            of["path_relative"] = of["path_relative"] = (
-                                                self.data_path_line_edit.filePath()
-                                                + f"{sep}Video{sep}Sec"
-                                            )
-                                            # Check if file exists
-                                            full_path = os.path.join(of["path_relative"], mf[1])
-                                            continue_import, skip_missing_files = (
-                                                self.check_media_file_exists(
-                                                    full_path, skip_missing_files
-                                                )
-                                            )
-                                            if not continue_import:
-                                                raise InterruptedError("Import cancelled by user")
-                                            ok = file_layer.addFeature(of)
-                                            if ok:
-                                                added_features[file_layer.id()].append(of["obj_id"])
-                                                logger.debug(
-                                                    f"adding feature to file layer (fid: {of['obj_id']}): ok"
-                                                )
-                                                videos.append(mf[1])
-                                            else:
-                                                _fields = ""
-                                                for name, value in zip(
-                                                    file_layer.fields().names(), of.attributes()
-                                                ):
-                                                    _fields += f"{name}: {value}\n"
-                                                message = (
-                                                    self.tr(
-                                                        "error adding feature to file layer (fid: {fid}): error. "
-                                                    ).format(fid=of["obj_id"])
-                                                    + f"{_fields}"
-                                                )
-                                                logger.error(message)
-                                                self.message_bar.pushMessage(
-                                                    self.tr("Error"),
-                                                    message,
-                                                    Qgis.MessageLevel.Critical,
-                                                )
-                                                raise InterruptedError("Import failed")
-
-                                # write maintenance feature
-                                ok = maintenance_layer.addFeature(maintenance)
-                                if ok:
-                                    added_features[maintenance_layer.id()].append(
-                                        maintenance["obj_id"]
-                                    )
-                                    logger.debug(
-                                        "adding feature to maintenance layer (fid: {}): ok".format(
-                                            maintenance["obj_id"]
-                                        )
-                                    )
-                                else:
-                                    _fields = ""
-                                    for name, value in zip(
-                                        maintenance_layer.fields().names(), maintenance.attributes()
-                                    ):
-                                        _fields += f"{name}: {value}\n"
-                                    message = (
-                                        self.tr(
-                                            "error adding feature to maintenance layer (fid: {fid}): error. "
-                                        ).format(fid=maintenance["obj_id"])
-                                        + f"{_fields}"
-                                    )
-                                    self.message_bar.pushMessage(
-                                        self.tr("Error"),
-                                        message,
-                                        Qgis.MessageLevel.Critical,
-                                    )
-                                    raise InterruptedError("Import failed")
-
-                                # set fkey maintenance event id to all damages
-                                for k, _ in enumerate(damages):
-                                    damages[k]["fk_examination"] = maintenance["obj_id"]
-
-                                # write damages
-                                for k, damage in enumerate(damages):
-                                    ok = damage_layer.addFeature(damage)
-                                    if ok:
-                                        added_features[damage_layer.id()].append(damage["obj_id"])
-                                        logger.debug(
-                                            f"adding feature to damage layer (fid: {damage['obj_id']}): ok"
-                                        )
-                                    else:
-                                        _fields = ""
-                                        for name, value in zip(
-                                            damage_layer.fields().names(), damage.attributes()
-                                        ):
-                                            _fields += f"{name}: {value}\n"
-                                        message = (
-                                            self.tr(
-                                                "error adding feature to damage layer (fid: {fid}): error. "
-                                            ).format(fid=damage["obj_id"])
-                                            + f"{_fields}"
-                                        )
-                                        logger.error(message)
-                                        self.message_bar.pushMessage(
-                                            self.tr("Error"),
-                                            message,
-                                            Qgis.MessageLevel.Critical,
-                                        )
-                                        raise InterruptedError("Import failed")
-
-                                    # add media files to od_file with reference to damage
-                                    for mf in media[k]:
-                                        of = QgsFeature()
-                                        init_fields = file_layer.fields()
-                                        of.setFields(init_fields)
-                                        of.initAttributes(init_fields.size())
-                                        of["obj_id"] = file_layer.dataProvider().defaultValue(
-                                            file_layer.fields().indexFromName("obj_id")
-                                        )
-                                        of["class"] = 3871  # i.e. damage
-                                        of["kind"] = (
-                                            3772 if mf[0] == "picture" else 3775
-                                        )  # i.e. video
-                                        of["object"] = damage["obj_id"]
-                                        of["identifier"] = mf[1]
-                                        sep = os.path.sep
-                                        if mf[0] == "picture":
-                                            of["path_relative"] = (
-                                                self.data_path_line_edit.filePath()
-                                                + f"{sep}Picture{sep}Sec"
-                                            )
-                                            # Check if file exists
-                                            full_path = os.path.join(of["path_relative"], mf[1])
-                                            continue_import, skip_missing_files = (
-                                                self.check_media_file_exists(
-                                                    full_path, skip_missing_files
-                                                )
-                                            )
-                                            if not continue_import:
-                                                raise InterruptedError("Import cancelled by user")
-                                        elif mf[0] == "video":
-                                            of["path_relative"] = (
-                                                self.data_path_line_edit.filePath()
-                                                + f"{sep}Video{sep}Sec"
-                                            )
-                                            # Check if file exists
-                                            full_path = os.path.join(of["path_relative"], mf[1])
-                                            continue_import, skip_missing_files = (
-                                                self.check_media_file_exists(
-                                                    full_path, skip_missing_files
-                                                )
-                                            )
-                                            if not continue_import:
-                                                raise InterruptedError("Import cancelled by user")
-                                        else:
-                                            logger.error(
-                                                f"unknown media type {mf[0]} for file {mf[1]}"
-                                            )
-                                            continue
-                                        ok = file_layer.addFeature(of)
-
-                                        if ok:
-                                            added_features[file_layer.id()].append(of["obj_id"])
-                                            logger.debug(
-                                                "adding media to file layer (fid: {}): ok".format(
-                                                    of["obj_id"]
-                                                )
-                                            )
-                                        else:
-                                            _fields = ""
-                                            for name, value in zip(
-                                                file_layer.fields().names(), of.attributes()
-                                            ):
-                                                _fields += f"{name}: {value}\n"
-                                            message = (
-                                                self.tr(
-                                                    "error adding media to file layer (fid: {fid}): error. "
-                                                ).format(fid=of["obj_id"])
-                                                + f"{_fields}"
-                                            )
-                                            logger.error(message)
-                                            self.message_bar.pushMessage(
-                                                self.tr("Error"),
-                                                message,
-                                                Qgis.MessageLevel.Critical,
-                                            )
-                                            raise InterruptedError("Import failed")
-
-                                # write in relation table (wastewater structure - maintenance events)
-                                jf = QgsFeature()
-                                init_fields = join_layer.fields()
-                                jf.setFields(init_fields)
-                                jf.initAttributes(init_fields.size())
-                                jf["obj_id"] = join_layer.dataProvider().defaultValue(
-                                    join_layer.fields().indexFromName("obj_id")
-                                )
-                                jf["fk_wastewater_structure"] = ws_obj_id
-                                jf["fk_maintenance_event"] = maintenance["obj_id"]
-                                ok = join_layer.addFeature(jf)
-                                if ok:
-                                    added_features[join_layer.id()].append(jf["obj_id"])
-                                    logger.debug(
-                                        "adding feature to join layer (fid: {}): ok".format(
-                                            jf["obj_id"]
-                                        )
-                                    )
-                                else:
-                                    _fields = ""
-                                    for name, value in zip(
-                                        join_layer.fields().names(), jf.attributes()
-                                    ):
-                                        _fields += f"{name}: {value}\n"
-                                    message = (
-                                        self.tr(
-                                            "error adding feature to join layer (fid: {fid}): error. "
-                                        ).format(fid=jf["obj_id"])
-                                        + f"{_fields}"
-                                    )
-                                    logger.error(message)
-                                    self.message_bar.pushMessage(
-                                        self.tr("Error"),
-                                        message,
-                                        Qgis.MessageLevel.Critical,
-                                    )
-                                    raise InterruptedError("Import failed")
+                maintenance = elements["maintenance"]
+                damages = elements["damages"]
+                media = elements["media"]
+                structure_condition = elements["structure_condition"]
 
-                                # get current reach
-                                if wsl is not None:
-                                    request = QgsFeatureRequest().setFilterExpression(
-                                        "\"obj_id\" = '{}'".format(ws_obj_id)
-                                    )
-                                    rf = next(wsl.getFeatures(request), QgsFeature())
-                                    if rf.isValid():
-                                        # update structure condition if worse
-                                        old_level = structure_condition_2_damage_level(
-                                            rf["structure_condition"]
-                                        )
-                                        if old_level is None or old_level > "Z{}".format(
-                                            structure_condition
-                                        ):
-                                            rf["structure_condition"] = (
-                                                damage_level_2_structure_condition(
-                                                    structure_condition
-                                                )
-                                            )
-                                            with edit(wsl):
-                                                wsl.updateFeature(rf)
-
-                                i += 1
-                                self.progressBar.setValue(i)
-                                QCoreApplication.processEvents()
+                if len(damages) == 0:
+                    continue
+
+                # video for maintenance event
+                videos = []
+                for k, _ in enumerate(damages):
+                    for mf in media[k]:
+                        if mf[1] in videos:
+                            continue
+                        if mf[0] == "video":
+                            maintenance["videonumber"] = mf[1]
+                            of = file_feature(
+                                maintenance["obj_id"], 3825, 3775, mf[1], "Video"
+                            )  # i.e. maintenance event, video
+                            plan.add_feature(ImportPlan.FILE, of)
+                            videos.append(mf[1])
+
+                plan.add_feature(ImportPlan.MAINTENANCE, maintenance)
+
+                for k, damage in enumerate(damages):
+                    # set fkey maintenance event id to all damages
+                    damage["fk_examination"] = maintenance["obj_id"]
+                    plan.add_feature(ImportPlan.DAMAGE, damage)
+
+                    # add media files to od_file with reference to damage
+                    for mf in media[k]:
+                        if mf[0] == "picture":
+                            of = file_feature(damage["obj_id"], 3871, 3772, mf[1], "Picture")
+                        elif mf[0] == "video":
+                            of = file_feature(damage["obj_id"], 3871, 3775, mf[1], "Video")
+                        else:
+                            logger.error(f"unknown media type {mf[0]} for file {mf[1]}")
+                            continue
+                        plan.add_feature(ImportPlan.FILE, of)
+
+                # relation table (wastewater structure - maintenance events)
+                jf = plan.new_feature(
+                    ImportPlan.JOIN, writer.new_obj_id(plan.layers[ImportPlan.JOIN])
+                )
+                jf["fk_wastewater_structure"] = ws_obj_id
+                jf["fk_maintenance_event"] = maintenance["obj_id"]
+                plan.add_feature(ImportPlan.JOIN, jf)
+
+                # get current reach
+                if wsl is not None:
+                    request = QgsFeatureRequest().setFilterExpression(
+                        "\"obj_id\" = '{}'".format(ws_obj_id)
+                    )
+                    with statistics.timed(ImportStatistics.STRUCTURE_CONDITION):
+                        rf = get_feature(wsl, request, "structure condition")
+                    if rf.isValid():
+                        # update structure condition if worse
+                        old_level = structure_condition_2_damage_level(rf["structure_condition"])
+                        if old_level is None or old_level > "Z{}".format(structure_condition):
+                            plan.structure_conditions[ws_obj_id] = (
+                                rf.id(),
+                                damage_level_2_structure_condition(structure_condition),
+                            )
+
+                self.progressBar.setValue(i + 1)
+        except InterruptedError:
+            self.hide_progress()
+            return None
+
+        return plan
 
+    @tracing.traced("import: write")
+    def _write_import(self, plan, writer, statistics, prepare_time):
+        logger.info(f"Writing {plan.feature_count()} features with the {writer.name} backend")
+
+        self.progressBar.setMaximum(100)
+        self.progressBar.setValue(0)
+        self.progressBar.setFormat(self.tr("Importing %p%"))
+        self.cancel = False
+
+        feedback = QgsFeedback()
+        feedback.progressChanged.connect(self._on_write_progress)
+        self.cancelButton.clicked.connect(feedback.cancel)
+
+        write_start = time.perf_counter()
+        try:
+            added_features = writer.write(plan, feedback)
         except InterruptedError:
-            self.progressBar.hide()
-            self.cancelButton.hide()
-            self.importButton.show()
+            self.hide_progress()
+            return
+        except ImportWriteError as e:
+            logger.error(str(e))
+            self.message_bar.pushMessage(self.tr("Error"), str(e), Qgis.MessageLevel.Critical)
+            self.hide_progress()
             return
+        except QgsEditError as e:
+            message = self.tr("error committing the import: {errors}").format(
+                errors="\n".join(e.args[0]) if e.args else ""
+            )
+            logger.error(message)
+            self.message_bar.pushMessage(self.tr("Error"), message, Qgis.MessageLevel.Critical)
+            self.hide_progress()
+            return
+        finally:
+            self.cancelButton.clicked.disconnect(feedback.cancel)
+            if writer.edit_statistics is not None:
+                writer.edit_statistics.log_summary("Import")
 
-        self.added_features = dict(added_features)
+        write_time = time.perf_counter() - write_start
+        self.added_features = added_features
         total_features = 0
         summary_parts = []
         for layer_id, obj_ids in self.added_features.items():
@@ -948,11 +928,12 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
             total_features += len(obj_ids)
             summary_parts.append(f"{len(obj_ids)} {layer_name}")
 
-        self._save_import_log(self.added_features)
+        self._save_import_log(
+            self.added_features,
+            self._import_metrics(plan, writer, statistics, prepare_time, write_time),
+        )
 
-        self.progressBar.hide()
-        self.cancelButton.hide()
-        self.importButton.show()
+        self.hide_progress()
 
         self.message_bar.pushMessage(
             self.tr("Success"),
@@ -961,6 +942,104 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
             15,
         )
 
+    def _report_dry_run(self, plan, statistics, elapsed):
+        lines = [self.tr("Features to write:")]
+        for key in ImportPlan.LAYER_KEYS:
+            lines.append(f"  {plan.layers[key].name()}: {len(plan.features[key])}")
+        lines.append(
+            self.tr("  structure condition updates: {n}").format(n=len(plan.structure_conditions))
+        )
+
+        if statistics.distance_issues:
+            lines.append(
+                self.tr("Inspections with observations out of range: {n}").format(
+                    n=len(statistics.distance_issues)
+                )
+            )
+            for issue in statistics.distance_issues[:10]:
+                lines.append(
+                    self.tr(
+                        "  {i} from manhole {c1} to {c2}: {distance:.2f} m on {length:.2f} m"
+                    ).format(
+                        i=issue.counter,
+                        c1=issue.from_node,
+                        c2=issue.to_node,
+                        distance=issue.max_distance,
+                        length=issue.reach_length,
+                    )
+                )
+            if len(statistics.distance_issues) > 10:
+                lines.append(
+                    self.tr("  ... and {n} more").format(n=len(statistics.distance_issues) - 10)
+                )
+
+        if statistics.unresolved_codes:
+            lines.append(self.tr("Unresolved codes:"))
+            for (kind, value), count in statistics.unresolved_codes.most_common():
+                lines.append(f"  {kind} '{value}': {count}")
+
+        if statistics.missing_media:
+            lines.append(
+                self.tr("Missing media files: {n}").format(n=len(statistics.missing_media))
+            )
+            lines.extend(f"  {path}" for path in statistics.missing_media[:10])
+            if len(statistics.missing_media) > 10:
+                lines.append(
+                    self.tr("  ... and {n} more").format(n=len(statistics.missing_media) - 10)
+                )
+
+        lines.append(self.tr("Timings:"))
+        for stage, seconds in statistics.stage_times.items():
+            lines.append(f"  {stage}: {seconds:.2f} s")
+        lines.append(self.tr("  total: {seconds:.2f} s").format(seconds=elapsed))
+
+        report = "\n".join(lines)
+        logger.info(f"Dry run completed\n{report}")
+        QMessageBox.information(self, self.tr("Dry run"), report)
+
+    def _on_write_progress(self, progress):
+        self.progressBar.setValue(int(progress))
+        QCoreApplication.processEvents()
+
+    @tracing.traced("distance validation")
+    def _validate_distances(self, show_report=True):
+        """
+        Validates the observation distances of all the inspections to import
+        and shows the report if there are issues or if requested
+        Returns the list of issues, None if the validation failed
+        """
+        tolerance = self.settings.tolerance_channel_length.value()
+        try:
+            issues = validate_observation_distances(self.projects, tolerance)
+        except W2TLayerNotFound as e:
+            self.message_bar.pushMessage(
+                self.tr("Error"),
+                self.tr("The channel layer is missing in the project: {error}").format(
+                    error=str(e)
+                ),
+                Qgis.MessageLevel.Critical,
+            )
+            return None
+
+        if issues or show_report:
+            if self._validation_report is None:
+                self._validation_report = ValidationReportDialog(self)
+                self._validation_report.sectionRequested.connect(self._select_section)
+                self._validation_report.revalidateRequested.connect(self._open_validation_report)
+            self._validation_report.set_issues(issues, tolerance)
+            self._validation_report.show()
+            self._validation_report.raise_()
+        return issues
+
+    def _open_validation_report(self):
+        self._validate_distances(show_report=True)
+
+    def _select_section(self, project_id, section_id):
+        idx = self.projectCombo.findData(project_id)
+        if idx >= 0 and idx != self.projectCombo.currentIndex():
+            self.projectCombo.setCurrentIndex(idx)
+        self.sectionWidget.select_section(section_id)
+
     def check_media_file_exists(self, file_path, skip_missing_files):
         """Check if media file exists, prompt user if not.
 
@@ -990,20 +1069,53 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         else:  # Yes
             return True, skip_missing_files
 
-    def _get_import_log_dir(self):
-        path = self.settings.import_log_dir.value()
-        if not path:
-            path = os.path.join(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.GenericDataLocation
+    def _import_metrics(self, plan, writer, statistics, prepare_time, write_time):
+        """
+        Returns the stage times and the throughput of an import, stored in its log
+        """
+        commit_times = {}
+        if writer.edit_statistics is not None:
+            commit_times = {
+                layer_id: entry["commit"]
+                for layer_id, entry in writer.edit_statistics.layers.items()
+            }
+        layers = {}
+        for key in ImportPlan.LAYER_KEYS:
+            layer = plan.layers[key]
+            feature_count = len(plan.features[key])
+            layer_time = writer.layer_write_times.get(layer.id(), 0.0)
+            commit_time = commit_times.get(layer.id(), 0.0)
+            layers[layer.name()] = {
+                "layer_id": layer.id(),
+                "provider": layer.providerType(),
+                "features": feature_count,
+                "write_time": layer_time,
+                "commit_time": commit_time,
+                "features_per_second": (
+                    feature_count / (layer_time + commit_time) if layer_time + commit_time else None
                 ),
-                "wincan2teksi",
-                "import_logs",
-            )
-        return path
+            }
+        return {
+            "plugin_version": plugin_version(),
+            "qgis_version": Qgis.version(),
+            "backend": writer.name,
+            "stages": {
+                "load": self.load_time,
+                "match": self.search_time,
+                "prepare": prepare_time,
+                "write": write_time,
+                "structure condition update": writer.structure_condition_time,
+            },
+            "preparation": dict(statistics.stage_times),
+            "structure_conditions": len(plan.structure_conditions),
+            "layers": layers,
+            "edit_sessions": (
+                writer.edit_statistics.summary() if writer.edit_statistics is not None else []
+            ),
+        }
 
-    def _save_import_log(self, added_features):
-        log_dir = self._get_import_log_dir()
+    def _save_import_log(self, added_features, metrics=None):
+        log_dir = import_log_dir()
         os.makedirs(log_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         log_file = os.path.join(log_dir, f"import_{timestamp}.json")
@@ -1016,6 +1128,8 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
             "user": QgsExpressionContextUtils.globalScope().variable("user_full_name") or "",
             "features": {},
         }
+        if metrics is not None:
+            data["metrics"] = metrics
         for layer_id, obj_ids in added_features.items():
             layer = QgsProject.instance().mapLayer(layer_id)
             layer_name = layer.name() if layer else layer_id
@@ -1024,8 +1138,42 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
             json.dump(data, f, indent=2, default=str)
         logger.info(f"Import log saved to {log_file}")
 
+    def _toggle_tracing(self, checked):
+        self.settings.tracing_enabled.setValue(checked)
+        tracing.set_enabled(checked)
+
+    def _export_trace_json(self):
+        self._export_trace(tracing.export_json, self.tr("JSON (*.json)"))
+
+    def _export_chrome_trace(self):
+        self._export_trace(tracing.export_chrome_trace, self.tr("Chrome trace (*.json)"))
+
+    def _export_trace(self, export, file_filter):
+        if not tracing.spans():
+            self.message_bar.pushMessage(
+                self.tr("Tracing"),
+                self.tr("No trace recorded, enable tracing in the Tools menu first."),
+                Qgis.MessageLevel.Info,
+            )
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            self.tr("Export trace"),
+            # not in the import log directory, which only holds undoable import logs
+            os.path.join(os.path.expanduser("~"), "wincan2teksi_trace.json"),
+            file_filter,
+        )
+        if not file_path:
+            return
+        try:
+            export(file_path)
+        except OSError as e:
+            self.message_bar.pushMessage(self.tr("Error"), str(e), Qgis.MessageLevel.Critical)
+            return
+        logger.info(f"Trace exported to {file_path}")
+
     def _open_import_logs_folder(self):
-        log_dir = self._get_import_log_dir()
+        log_dir = import_log_dir()
         os.makedirs(log_dir, exist_ok=True)
         QDesktopServices.openUrl(QUrl.fromLocalFile(log_dir))
 
@@ -1033,7 +1181,7 @@ class DataBrowserDialog(QDialog, Ui_DataBrowserDialog):
         SettingsDialog(self).exec()
 
     def _open_undo_import(self):
-        log_dir = self._get_import_log_dir()
+        log_dir = import_log_dir()
         UndoImportDialog(log_dir, self).exec()
 
     def _toggle_logs(self, checked):
@@ -26,16 +26,11 @@
 #
 # ---------------------------------------------------------------------
 
-import os
 from qgis.PyQt.QtCore import pyqtSlot, pyqtSignal
 from qgis.PyQt.QtWidgets import QWidget
-from qgis.PyQt.uic import loadUiType
 
 from wincan2teksi.core.settings import Settings
-
-Ui_InspectionWidget, _ = loadUiType(
-    os.path.join(os.path.dirname(__file__), "../ui/inspectionwidget.ui")
-)
+from wincan2teksi.ui.ui_inspectionwidget import Ui_InspectionWidget
 
 
 class InspectionWidget(QWidget, Ui_InspectionWidget):
@@ -50,6 +45,14 @@ class InspectionWidget(QWidget, Ui_InspectionWidget):
         self.sectionId = None
         self.inspectionId = None
 
+        self.rateFilterCombo.addItem(self.tr("All rates"), None)
+        for rate in range(5):
+            self.rateFilterCombo.addItem(self.tr("Rate {rate} or worse").format(rate=rate), rate)
+        self.codeFilterEdit.textChanged.connect(self.observationTable.proxy_model.set_code_filter)
+        self.rateFilterCombo.currentIndexChanged.connect(self._update_rate_filter)
+        self.minDistanceSpinBox.valueChanged.connect(self._update_distance_filter)
+        self.maxDistanceSpinBox.valueChanged.connect(self._update_distance_filter)
+
     def finish_init(self, data):
         self.data = data
         self.observationTable.finish_init(data)
@@ -61,8 +64,9 @@ class InspectionWidget(QWidget, Ui_InspectionWidget):
         for i_id, inspection in (
             self.data[self.projectId].sections[self.sectionId].inspections.items()
         ):
+            start_date = inspection.start_date
             self.inspectionCombo.addItem(
-                inspection.start_date.toString("dd.MM.yyyy HH:mm:ss"), i_id
+                start_date.strftime("%d.%m.%Y %H:%M:%S") if start_date else "", i_id
             )
             # self.observationTable.clear()
 
@@ -101,3 +105,12 @@ class InspectionWidget(QWidget, Ui_InspectionWidget):
             self.inspectionId
         ].import_ = toImport
         self.importChanged.emit()
+
+    def _update_rate_filter(self, idx):
+        self.observationTable.proxy_model.set_max_rate(self.rateFilterCombo.itemData(idx))
+
+    def _update_distance_filter(self):
+        # the minimum of the spin boxes means no limit
+        min_distance = self.minDistanceSpinBox.value() or None
+        max_distance = self.maxDistanceSpinBox.value() or None
+        self.observationTable.proxy_model.set_distance_range(min_distance, max_distance)
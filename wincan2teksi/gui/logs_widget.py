@@ -1,13 +1,12 @@
 import logging
-import os
 from datetime import datetime
 
 from qgis.PyQt.QtCore import (
     QAbstractItemModel,
-    QCoreApplication,
     QModelIndex,
     QSortFilterProxyModel,
     Qt,
+    QTimer,
 )
 from qgis.PyQt.QtGui import QAction, QKeySequence, QShortcut
 from qgis.PyQt.QtWidgets import (
@@ -17,23 +16,54 @@ from qgis.PyQt.QtWidgets import (
     QStyle,
     QWidget,
 )
-from qgis.PyQt.uic import loadUiType
 
-from wincan2teksi.core.utils import PLUGIN_LOGGER_NAME, LoggingBridge
-
-Ui_LogsWidget, _ = loadUiType(os.path.join(os.path.dirname(__file__), "..", "ui", "logs_widget.ui"))
+from wincan2teksi.core.settings import Settings
+from wincan2teksi.core.utils import (
+    LoggingBridge,
+    add_log_handler,
+    remove_log_handler,
+    set_log_handler_level,
+)
+from wincan2teksi.ui.ui_logs_widget import Ui_Form as Ui_LogsWidget
 
 COLUMNS = ["Timestamp", "Level", "Module", "Message"]
 
+# interval at which buffered log records are added to the model
+FLUSH_INTERVAL_MS = 100
+# delay after the last keystroke before the text filter is applied
+FILTER_DELAY_MS = 250
+
 
 class LogModel(QAbstractItemModel):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_entries=None):
         QAbstractItemModel.__init__(self, parent)
+        # the oldest entries are dropped once max_entries is reached
+        # a list, as the entries are read by row, and it is trimmed with a single slice
+        self.max_entries = max_entries
         self.logs = []
 
     def add_log(self, log):
-        self.beginInsertRows(QModelIndex(), len(self.logs), len(self.logs))
-        self.logs.append(log)
+        self.add_logs([log])
+
+    def entry(self, row):
+        return self.logs[row]
+
+    def add_logs(self, logs):
+        """
+        Adds a batch of entries with a single row insertion
+        """
+        if self.max_entries is not None and len(logs) > self.max_entries:
+            logs = logs[-self.max_entries :]
+        if not logs:
+            return
+        if self.max_entries is not None:
+            overflow = len(self.logs) + len(logs) - self.max_entries
+            if overflow > 0:
+                self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+                del self.logs[:overflow]
+                self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), len(self.logs), len(self.logs) + len(logs) - 1)
+        self.logs.extend(logs)
         self.endInsertRows()
 
     def headerData(self, section, orientation, role=None):
@@ -97,39 +127,31 @@ class LogFilterProxyModel(QSortFilterProxyModel):
         super().__init__(parent)
         self.level_filter = None
         self.text_filter = ""
+        self._level_rank = logging.NOTSET
 
     def setLevelFilter(self, level):
         self.level_filter = level
+        if level and level != "ALL":
+            self._level_rank = logging.getLevelName(level)
+        else:
+            self._level_rank = logging.NOTSET
         self.invalidateFilter()
 
     def setTextFilter(self, text):
+        text = text.lower()
+        if text == self.text_filter:
+            return
         self.text_filter = text
         self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        index_level = model.index(source_row, 1, source_parent)
-        index_message = model.index(source_row, 3, source_parent)
-        index_module = model.index(source_row, 2, source_parent)
-
-        if self.level_filter and self.level_filter != "ALL":
-            level = model.data(index_level, Qt.ItemDataRole.DisplayRole)
-            try:
-                filter_idx = self.LEVELS.index(self.level_filter)
-                level_idx = self.LEVELS.index(level)
-                if level_idx < filter_idx:
-                    return False
-            except ValueError:
-                return False
-
-        if self.text_filter:
-            msg = model.data(index_message, Qt.ItemDataRole.DisplayRole) or ""
-            mod = model.data(index_module, Qt.ItemDataRole.DisplayRole) or ""
-            text = self.text_filter.lower()
-            if text not in msg.lower() and text not in mod.lower():
-                return False
-
-        return True
+        entry = self.sourceModel().entry(source_row)
+
+        if entry["level_rank"] < self._level_rank:
+            return False
+
+        # the search key is the lower case text of the entry, computed once when it is added
+        return not self.text_filter or self.text_filter in entry["search_key"]
 
 
 class LogsWidget(QWidget, Ui_LogsWidget):
@@ -137,10 +159,18 @@ class LogsWidget(QWidget, Ui_LogsWidget):
         QWidget.__init__(self, parent)
         self.setupUi(self)
 
+        # debug records are only requested while the panel is visible
         self.loggingBridge = LoggingBridge(
-            level=logging.NOTSET, excluded_modules=["urllib3.connectionpool"]
+            level=logging.INFO, excluded_modules=["urllib3.connectionpool"]
         )
-        self.logs_model = LogModel(self)
+        self.logs_model = LogModel(self, Settings().max_log_entries.value())
+
+        # records are buffered and added to the model in batches
+        self._pending_logs = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.__flush_logs)
 
         self.proxy_model = LogFilterProxyModel(self)
         self.proxy_model.setSourceModel(self.logs_model)
@@ -163,9 +193,7 @@ class LogsWidget(QWidget, Ui_LogsWidget):
         self.logs_treeView.setUniformRowHeights(False)
 
         self.loggingBridge.loggedLine.connect(self.__logged_line)
-        plugin_logger = logging.getLogger(PLUGIN_LOGGER_NAME)
-        plugin_logger.setLevel(logging.DEBUG)
-        plugin_logger.addHandler(self.loggingBridge)
+        add_log_handler(self.loggingBridge)
 
         self.logs_level_comboBox.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
         self.logs_level_comboBox.currentTextChanged.connect(self.proxy_model.setLevelFilter)
@@ -181,7 +209,12 @@ class LogsWidget(QWidget, Ui_LogsWidget):
         )
         self.logs_copy_all_toolButton.clicked.connect(self.__copyAllLogs)
 
-        self.logs_filter_LineEdit.textChanged.connect(self.proxy_model.setTextFilter)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.__apply_text_filter)
+        # restart the delay on each keystroke
+        self.logs_filter_LineEdit.textChanged.connect(lambda _text: self._filter_timer.start())
 
         self.copy_shortcut = QShortcut(QKeySequence.StandardKey.Copy, self.logs_treeView)
         self.copy_shortcut.activated.connect(self.__copySelectedRows)
@@ -189,27 +222,54 @@ class LogsWidget(QWidget, Ui_LogsWidget):
         self.logs_treeView.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.logs_treeView.customContextMenuRequested.connect(self.__showContextMenu)
 
+    def showEvent(self, event):
+        set_log_handler_level(self.loggingBridge, logging.DEBUG)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        set_log_handler_level(self.loggingBridge, logging.INFO)
+        super().hideEvent(event)
+
     def close(self):
-        logging.getLogger(PLUGIN_LOGGER_NAME).removeHandler(self.loggingBridge)
+        remove_log_handler(self.loggingBridge)
+        self._flush_timer.stop()
+        self._filter_timer.stop()
 
     def __logged_line(self, record, line):
         timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
 
+        message = record.getMessage()
         log_entry = {
             "Timestamp": timestamp,
             "Level": record.levelname,
             "Module": record.name,
-            "Message": record.getMessage(),
+            "Message": message,
+            # precomputed for the filter proxy model
+            "level_rank": record.levelno,
+            "search_key": f"{message}\x00{record.name}".lower(),
         }
 
-        self.logs_model.add_log(log_entry)
+        self._pending_logs.append(log_entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def __flush_logs(self):
+        if not self._pending_logs:
+            return
+        logs, self._pending_logs = self._pending_logs, []
 
         scroll_bar = self.logs_treeView.verticalScrollBar()
-        scroll_bar.setValue(scroll_bar.maximum())
+        follow = scroll_bar.value() == scroll_bar.maximum()
+        self.logs_model.add_logs(logs)
+        # only follow new entries if the view was already scrolled to the bottom
+        if follow:
+            self.logs_treeView.scrollToBottom()
 
-        QCoreApplication.processEvents()
+    def __apply_text_filter(self):
+        self.proxy_model.setTextFilter(self.logs_filter_LineEdit.text())
 
     def __logsClearClicked(self):
+        self._pending_logs = []
         self.logs_model.clear()
 
     def __showContextMenu(self, position):
@@ -0,0 +1,186 @@
+from qgis.PyQt.QtCore import QAbstractTableModel, QSortFilterProxyModel, Qt
+from qgis.PyQt.QtGui import QFont
+
+Column = {
+    "Distance": 0,
+    "Code": 1,
+    "Description": 2,
+    "Mpeg": 3,
+    "Photo": 4,
+    "Rate": 5,
+    "Force": 6,
+}
+
+# raw value of the observation, used for sorting and filtering
+SortRole = Qt.ItemDataRole.UserRole + 1
+
+
+class ObservationTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._observations = []  # list of (observation_id, observation) tuples
+        self.column_headers = [
+            self.tr("distance"),
+            self.tr("code"),
+            self.tr("description"),
+            self.tr("mpeg"),
+            self.tr("photo"),
+            self.tr("rate"),
+            self.tr("force"),
+        ]
+        self._font = QFont()
+        self._font.setPointSize(self._font.pointSize() - 2)
+
+    def set_inspection(self, inspection):
+        self.beginResetModel()
+        if inspection is not None:
+            self._observations = list(inspection.observations.items())
+        else:
+            self._observations = []
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._observations)
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.column_headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.column_headers[section]
+            if role == Qt.ItemDataRole.FontRole:
+                return self._font
+        return super().headerData(section, orientation, role)
+
+    def observation(self, row):
+        if 0 <= row < len(self._observations):
+            return self._observations[row][1]
+        return None
+
+    @staticmethod
+    def _value(observation, col):
+        if col == Column["Distance"]:
+            return observation.distance
+        elif col == Column["Code"]:
+            return observation.code
+        elif col == Column["Description"]:
+            return observation.text
+        elif col == Column["Mpeg"]:
+            return observation.time
+        elif col == Column["Photo"]:
+            return observation.mmfiles
+        elif col == Column["Rate"]:
+            return observation.rate
+        elif col == Column["Force"]:
+            return observation.force_import
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        o_id, observation = self._observations[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == Column["Force"]:
+                return None
+            return str(self._value(observation, col))
+
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if col == Column["Distance"]:
+                checked = observation.import_
+            elif col == Column["Force"]:
+                checked = observation.force_import
+            else:
+                return None
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+
+        elif role == Qt.ItemDataRole.FontRole:
+            return self._font
+
+        elif role == Qt.ItemDataRole.UserRole:
+            return o_id
+
+        elif role == SortRole:
+            return self._value(observation, col)
+
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in (Column["Distance"], Column["Force"]):
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        _, observation = self._observations[index.row()]
+        checked = value == Qt.CheckState.Checked
+        if index.column() == Column["Distance"]:
+            observation.import_ = checked
+        elif index.column() == Column["Force"]:
+            observation.force_import = checked
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+class ObservationFilterProxyModel(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._code = ""
+        self._max_rate = None
+        self._min_distance = None
+        self._max_distance = None
+        self.setSortRole(SortRole)
+
+    def set_code_filter(self, code):
+        self._code = (code or "").strip().upper()
+        self.invalidateFilter()
+
+    def set_max_rate(self, rate):
+        """
+        Only shows observations with a rate lower or equal to the given one (i.e. worse or equal)
+        """
+        self._max_rate = rate
+        self.invalidateFilter()
+
+    def set_distance_range(self, min_distance, max_distance):
+        self._min_distance = min_distance
+        self._max_distance = max_distance
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        observation = self.sourceModel().observation(source_row)
+        if observation is None:
+            return False
+        if self._code and not (observation.code or "").upper().startswith(self._code):
+            return False
+        if self._max_rate is not None and (
+            observation.rate is None or observation.rate > self._max_rate
+        ):
+            return False
+        if self._min_distance is not None and (observation.distance or 0) < self._min_distance:
+            return False
+        if self._max_distance is not None and (observation.distance or 0) > self._max_distance:
+            return False
+        return True
+
+    def lessThan(self, left, right):
+        left_value = left.data(SortRole)
+        right_value = right.data(SortRole)
+        # undefined values first
+        if left_value is None or right_value is None:
+            return left_value is None and right_value is not None
+        try:
+            return left_value < right_value
+        except TypeError:
+            return str(left_value) < str(right_value)
@@ -27,128 +27,58 @@
 # ---------------------------------------------------------------------
 
 from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtWidgets import QTableWidget, QTableWidgetItem, QAbstractItemView
+from qgis.PyQt.QtWidgets import QAbstractItemView, QTableView
 
-IMPORT = 0
-FORCE_IMPORT = 1
+from wincan2teksi.gui.observationmodel import ObservationFilterProxyModel, ObservationTableModel
 
 
-class ObservationTable(QTableWidget):
+class ObservationTable(QTableView):
     def __init__(self, parent):
-        QTableWidget.__init__(self, parent)
+        QTableView.__init__(self, parent)
         self.data = None
         self.projectId = None
         self.sectionId = None
         self.inspectionId = None
+        # columns are sized to the contents of the first inspection only
+        self._columns_resized = False
+
+        self._observation_model = ObservationTableModel(self)
+        self._proxy_model = ObservationFilterProxyModel(self)
+        self._proxy_model.setSourceModel(self._observation_model)
+        self.setModel(self._proxy_model)
+        # keep the file order until the user sorts a column
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.setSortingEnabled(True)
 
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.setColumnCount(0)
-        self.setRowCount(0)
         self.horizontalHeader().setVisible(True)
         self.horizontalHeader().setMinimumSectionSize(15)
+        # only measure the first rows when resizing columns to contents
+        self.horizontalHeader().setResizeContentsPrecision(100)
         self.verticalHeader().setVisible(True)
         self.verticalHeader().setDefaultSectionSize(25)
 
-        self.itemClicked.connect(self.import_checkbox_clicked)
-
-        self.column_headers = [
-            self.tr("distance"),
-            self.tr("code"),
-            self.tr("description"),
-            self.tr("mpeg"),
-            self.tr("photo"),
-            self.tr("rate"),
-            self.tr("force"),
-        ]
+    @property
+    def proxy_model(self):
+        return self._proxy_model
 
     def finish_init(self, data):
         self.data = data
-        for c, col in enumerate(self.column_headers):
-            self.insertColumn(c)
-            item = QTableWidgetItem(col)
-            font = item.font()
-            font.setPointSize(font.pointSize() - 2)
-            item.setFont(font)
-            self.setHorizontalHeaderItem(c, item)
         self.adjustSize()
 
     def set_inspection(self, projectId, sectionId, inspectionId):
-        self.clearContents()
-
         self.projectId = projectId
         self.sectionId = sectionId
         self.inspectionId = inspectionId
 
-        for r in range(self.rowCount() - 1, -1, -1):
-            self.removeRow(r)
-
         if self.projectId is None or self.sectionId is None or self.inspectionId is None:
+            self._observation_model.set_inspection(None)
             return
 
-        for o_id, obs in (
-            self.data[self.projectId]
-            .sections[self.sectionId]
-            .inspections[self.inspectionId]
-            .observations.items()
-        ):
-            r = self.rowCount()
-            self.insertRow(r)
-
-            for c, data in enumerate(
-                (
-                    obs.distance,
-                    obs.code,
-                    obs.text,
-                    obs.time,
-                    obs.mmfiles,
-                    obs.rate,
-                    obs.force_import,
-                )
-            ):
-                item = QTableWidgetItem(str(data) if c != 6 else None)
-                if c in (0, 6):
-                    item.setFlags(
-                        Qt.ItemFlag.ItemIsEnabled
-                        | Qt.ItemFlag.ItemIsSelectable
-                        | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    if c == 0:
-                        item.setCheckState(
-                            Qt.CheckState.Checked if obs.import_ else Qt.CheckState.Unchecked
-                        )
-                        item.setData(Qt.ItemDataRole.UserRole + 1, IMPORT)
-
-                    else:
-                        item.setCheckState(
-                            Qt.CheckState.Checked if obs.force_import else Qt.CheckState.Unchecked
-                        )
-                        item.setData(Qt.ItemDataRole.UserRole + 1, FORCE_IMPORT)
-                    item.setData(Qt.ItemDataRole.UserRole, o_id)
-                else:
-                    item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                font = item.font()
-                font.setPointSize(font.pointSize() - 2)
-                item.setFont(font)
-                self.setItem(r, c, item)
-
-        self.resizeColumnsToContents()
-
-    def import_checkbox_clicked(self, item):
-        if item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-            o_id = item.data(Qt.ItemDataRole.UserRole)
-            data_column = item.data(Qt.ItemDataRole.UserRole + 1)
-            if data_column == IMPORT:
-                self.data[self.projectId].sections[self.sectionId].inspections[
-                    self.inspectionId
-                ].observations[o_id].import_ = (
-                    True if item.checkState() == Qt.CheckState.Checked else False
-                )
-            elif data_column == FORCE_IMPORT:
-                self.data[self.projectId].sections[self.sectionId].inspections[
-                    self.inspectionId
-                ].observations[o_id].force_import = (
-                    True if item.checkState() == Qt.CheckState.Checked else False
-                )
-            else:
-                raise ValueError(f"Unknown data column: {data_column}")
+        self._observation_model.set_inspection(
+            self.data[self.projectId].sections[self.sectionId].inspections[self.inspectionId]
+        )
+        if not self._columns_resized and self._observation_model.rowCount() > 0:
+            self.resizeColumnsToContents()
+            self._columns_resized = True
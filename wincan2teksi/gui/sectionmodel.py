@@ -1,7 +1,6 @@
-from qgis.PyQt.QtCore import QAbstractTableModel, QModelIndex, Qt, QSortFilterProxyModel
+from qgis.PyQt.QtCore import QAbstractTableModel, QSortFilterProxyModel, Qt
 from qgis.PyQt.QtGui import QColor, QFont
 
-
 Column = {"Number": 0, "FromNode": 1, "ToNode": 2}
 
 COLUMN_HEADERS = ["#", "From node", "To node"]
@@ -11,9 +10,19 @@ class SectionTableModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._sections = []  # list of (section_id, section) tuples
+        self._row_by_id = {}  # section_id → row
+        self._matched = []  # match status by row, as last signaled to the views
         self._project_id = None
         self._projects = {}
 
+    @staticmethod
+    def _is_matched(section):
+        return section.teksi_channel_id_1 is not None or section.use_previous_section is True
+
+    def _index_sections(self):
+        self._row_by_id = {s_id: row for row, (s_id, _) in enumerate(self._sections)}
+        self._matched = [self._is_matched(section) for _, section in self._sections]
+
     def set_data(self, projects, project_id):
         self.beginResetModel()
         self._projects = projects
@@ -22,21 +31,23 @@ class SectionTableModel(QAbstractTableModel):
             self._sections = list(projects[project_id].sections.items())
         else:
             self._sections = []
+        self._index_sections()
         self.endResetModel()
 
     def clear(self):
         self.beginResetModel()
         self._sections = []
+        self._index_sections()
         self._project_id = None
         self.endResetModel()
 
-    def rowCount(self, parent=QModelIndex()):
-        if parent.isValid():
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
             return 0
         return len(self._sections)
 
-    def columnCount(self, parent=QModelIndex()):
-        if parent.isValid():
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
             return 0
         return len(COLUMN_HEADERS)
 
@@ -64,8 +75,7 @@ class SectionTableModel(QAbstractTableModel):
             return Qt.CheckState.Checked if section.import_ else Qt.CheckState.Unchecked
 
         elif role == Qt.ItemDataRole.BackgroundRole:
-            ok = section.teksi_channel_id_1 is not None or section.use_previous_section is True
-            if ok:
+            if self._is_matched(section):
                 return QColor(Qt.GlobalColor.white)
             else:
                 return QColor(255, 190, 190)
@@ -144,10 +154,12 @@ class SectionTableModel(QAbstractTableModel):
             self.dataChanged.emit(index, index)
 
     def row_for_section_id(self, section_id):
-        for row, (s_id, _) in enumerate(self._sections):
-            if s_id == section_id:
-                return row
-        return -1
+        return self._row_by_id.get(section_id, -1)
+
+    def is_matched(self, row):
+        if 0 <= row < len(self._sections):
+            return self._is_matched(self._sections[row][1])
+        return False
 
     def is_first_section(self, section_id):
         if self._sections:
@@ -155,16 +167,53 @@ class SectionTableModel(QAbstractTableModel):
         return True
 
     def refresh(self):
-        if self.rowCount() > 0:
+        """
+        Signals the rows whose match status changed since the last refresh
+        """
+        changed_rows = []
+        for row, (_, section) in enumerate(self._sections):
+            matched = self._is_matched(section)
+            if matched != self._matched[row]:
+                self._matched[row] = matched
+                changed_rows.append(row)
+        self._emit_rows_changed(changed_rows, 0, self.columnCount() - 1)
+
+    def _emit_rows_changed(self, rows, first_column, last_column, roles=None):
+        # one signal per contiguous range of rows
+        rows = sorted(rows)
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                top_left = self.index(rows[start], first_column)
+                bottom_right = self.index(rows[i - 1], last_column)
+                if roles is None:
+                    self.dataChanged.emit(top_left, bottom_right)
+                else:
+                    self.dataChanged.emit(top_left, bottom_right, roles)
+                start = i
+
+    def set_check_state(self, rows, state):
+        """
+        Sets the import check state of the given rows and signals the change once
+        """
+        checked = state == Qt.CheckState.Checked
+        changed_rows = []
+        for row in rows:
+            section = self._sections[row][1]
+            if section.import_ != checked:
+                section.import_ = checked
+                changed_rows.append(row)
+        if changed_rows:
+            # a single range covering all changed rows
+            column = Column["Number"]
             self.dataChanged.emit(
-                self.index(0, 0),
-                self.index(self.rowCount() - 1, self.columnCount() - 1),
+                self.index(min(changed_rows), column),
+                self.index(max(changed_rows), column),
+                [Qt.ItemDataRole.CheckStateRole],
             )
 
     def set_all_check_state(self, state):
-        for row in range(self.rowCount()):
-            idx = self.index(row, Column["Number"])
-            self.setData(idx, state, Qt.ItemDataRole.CheckStateRole)
+        self.set_check_state(range(self.rowCount()), state)
 
 
 class SectionFilterProxyModel(QSortFilterProxyModel):
@@ -179,7 +228,4 @@ class SectionFilterProxyModel(QSortFilterProxyModel):
     def filterAcceptsRow(self, source_row, source_parent):
         if not self._filter_unmatched:
             return True
-        model = self.sourceModel()
-        s_id, section = model._sections[source_row]
-        is_matched = section.teksi_channel_id_1 is not None or section.use_previous_section is True
-        return not is_matched
+        return not self.sourceModel().is_matched(source_row)
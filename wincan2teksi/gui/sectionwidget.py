@@ -28,7 +28,6 @@ import re
 from qgis.PyQt.QtCore import pyqtSlot, Qt
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QWidget, QHeaderView, QMenu, QMessageBox
-from qgis.PyQt.uic import loadUiType
 
 from qgis.core import QgsProject
 
@@ -38,11 +37,10 @@ from wincan2teksi.core.settings import Settings
 from wincan2teksi.core.section import find_section, section_at_id
 from wincan2teksi.gui.featureselectorwidget import CanvasExtent
 from wincan2teksi.gui.sectionmodel import SectionTableModel, SectionFilterProxyModel
+from wincan2teksi.ui.ui_sectionwidget import Ui_SectionWidget
 
 logger = logging.getLogger(__name__)
 
-Ui_SectionWidget, _ = loadUiType(os.path.join(os.path.dirname(__file__), "../ui/sectionwidget.ui"))
-
 _search_icon = QIcon(os.path.join(os.path.dirname(__file__), "..", "icons", "magnifier13.svg"))
 
 
@@ -295,13 +293,11 @@ class SectionWidget(QWidget, Ui_SectionWidget):
         self._set_visible_check_state(Qt.CheckState.Unchecked)
 
     def _set_visible_check_state(self, state):
-        from wincan2teksi.gui.sectionmodel import Column
-
-        for row in range(self._proxy_model.rowCount()):
-            source_index = self._proxy_model.mapToSource(
-                self._proxy_model.index(row, Column["Number"])
-            )
-            self._section_model.setData(source_index, state, Qt.ItemDataRole.CheckStateRole)
+        rows = [
+            self._proxy_model.mapToSource(self._proxy_model.index(row, 0)).row()
+            for row in range(self._proxy_model.rowCount())
+        ]
+        self._section_model.set_check_state(rows, state)
 
 
 """
@@ -17,16 +17,15 @@
  ***************************************************************************/
 """
 
-import os
-from qgis.PyQt.QtCore import QStandardPaths
 from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt.uic import loadUiType
 from qgis.core import QgsMapLayerModel
 from qgis.gui import QgsFileWidget
 
+from wincan2teksi.core import layer_access
 from wincan2teksi.core.settings import Settings
-
-DialogUi, _ = loadUiType(os.path.join(os.path.dirname(__file__), "../ui/settings.ui"))
+from wincan2teksi.core.utils import import_log_dir
+from wincan2teksi.core.writers import WRITER_BACKENDS
+from wincan2teksi.ui.ui_settings import Ui_WincanSettings as DialogUi
 
 SETTINGS = (
     "wastewater_structure_layer",
@@ -58,16 +57,26 @@ class SettingsDialog(QDialog, DialogUi):
 
         # Import log directory
         self.import_log_dir_widget.setStorageMode(QgsFileWidget.StorageMode.GetDirectory)
-        log_dir = self.settings.import_log_dir.value()
-        if not log_dir:
-            log_dir = os.path.join(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.GenericDataLocation
-                ),
-                "wincan2teksi",
-                "import_logs",
+        self.import_log_dir_widget.setFilePath(import_log_dir())
+
+        # Import settings
+        writer_backend_labels = {
+            "layers": self.tr("QGIS layers (edit buffers)"),
+            "postgresql": self.tr("PostgreSQL (direct bulk insert)"),
+            "sqlite": self.tr("SQLite / GeoPackage (direct bulk insert)"),
+        }
+        for backend in WRITER_BACKENDS:
+            self.writer_backend_combobox.addItem(
+                writer_backend_labels.get(backend, backend), backend
             )
-        self.import_log_dir_widget.setFilePath(log_dir)
+        self.writer_backend_combobox.setCurrentIndex(
+            max(0, self.writer_backend_combobox.findData(self.settings.writer_backend.value()))
+        )
+        self.stage_db3_locally_checkbox.setChecked(self.settings.stage_db3_locally.value())
+
+        # Logs settings
+        self.max_log_entries_spinbox.setValue(self.settings.max_log_entries.value())
+        self.slow_query_threshold_spinbox.setValue(self.settings.slow_query_threshold_ms.value())
 
         # Highlight settings
         self.highlight_color_button.setColor(self.settings.highlight_color.value())
@@ -83,6 +92,11 @@ class SettingsDialog(QDialog, DialogUi):
                 widget.itemData(widget.currentIndex(), QgsMapLayerModel.CustomRole.LayerId)
             )
         self.settings.import_log_dir.setValue(self.import_log_dir_widget.filePath())
+        self.settings.writer_backend.setValue(self.writer_backend_combobox.currentData())
+        self.settings.stage_db3_locally.setValue(self.stage_db3_locally_checkbox.isChecked())
+        self.settings.max_log_entries.setValue(self.max_log_entries_spinbox.value())
+        self.settings.slow_query_threshold_ms.setValue(self.slow_query_threshold_spinbox.value())
+        layer_access.set_slow_query_threshold_ms(self.slow_query_threshold_spinbox.value())
 
         # Highlight settings
         self.settings.highlight_color.setValue(self.highlight_color_button.color())
@@ -30,33 +30,27 @@ import os
 
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import (
-    QApplication,
     QDialog,
     QDialogButtonBox,
+    QLabel,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
+    QProgressBar,
     QVBoxLayout,
 )
 
-from qgis.core import QgsFeatureRequest, QgsProject
+from qgis.core import QgsApplication
 
 import logging
 
-from wincan2teksi.core.layer_edit import edit
-from wincan2teksi.core.settings import Settings
+from wincan2teksi.core.exceptions import W2TLayerNotFound
+from wincan2teksi.core.undo import UndoImportTask, deletion_plan, undo_checkpoint
 
 logger = logging.getLogger(__name__)
 
-# Deletion order: dependents first, then parents.
-# file_layer entries reference damage/maintenance via "object" field,
-# join_layer references maintenance, damage references maintenance.
-DELETION_ORDER = [
-    "file_layer",
-    "join_maintence_wastewaterstructure_layer",
-    "damage_layer",
-    "maintenance_layer",
-]
+# role of the list items holding the metrics of the import
+MetricsRole = Qt.ItemDataRole.UserRole + 1
 
 
 class UndoImportDialog(QDialog):
@@ -65,16 +59,32 @@ class UndoImportDialog(QDialog):
         self.setWindowTitle(self.tr("Undo Import"))
         self.resize(500, 350)
         self.log_dir = log_dir
+        self._task = None
 
         layout = QVBoxLayout(self)
         self.list_widget = QListWidget()
         layout.addWidget(self.list_widget)
 
+        self.metrics_label = QLabel()
+        self.metrics_label.setWordWrap(True)
+        self.metrics_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(self.metrics_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
         button_box = QDialogButtonBox()
         self.delete_button = button_box.addButton(
             self.tr("Delete selected import"), QDialogButtonBox.ButtonRole.DestructiveRole
         )
         self.delete_button.setEnabled(False)
+        self.cancel_button = button_box.addButton(
+            self.tr("Cancel undo"), QDialogButtonBox.ButtonRole.ActionRole
+        )
+        self.cancel_button.hide()
+        self.cancel_button.clicked.connect(self._on_cancel)
         button_box.addButton(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
         self.delete_button.clicked.connect(self._on_delete)
@@ -89,7 +99,11 @@ class UndoImportDialog(QDialog):
         if not os.path.isdir(self.log_dir):
             return
         files = sorted(
-            (f for f in os.listdir(self.log_dir) if f.endswith(".json")),
+            (
+                f
+                for f in os.listdir(self.log_dir)
+                if f.startswith("import_") and f.endswith(".json")
+            ),
             reverse=True,
         )
         for filename in files:
@@ -99,6 +113,9 @@ class UndoImportDialog(QDialog):
                     data = json.load(f)
             except (json.JSONDecodeError, OSError):
                 continue
+            if not isinstance(data, dict) or "features" not in data:
+                # not an import log
+                continue
 
             project = data.get("project", "")
             timestamp = data.get("timestamp", "?")
@@ -112,6 +129,11 @@ class UndoImportDialog(QDialog):
             if user:
                 label += f" — {user}"
             label += f" ({total} features)"
+            deleted = sum(len(obj_ids) for obj_ids in undo_checkpoint(data).values())
+            if deleted:
+                label += self.tr(" — partially undone ({deleted}/{total})").format(
+                    deleted=deleted, total=total
+                )
 
             # Build tooltip with per-layer counts
             tooltip_lines = []
@@ -122,11 +144,41 @@ class UndoImportDialog(QDialog):
 
             item = QListWidgetItem(label)
             item.setData(Qt.ItemDataRole.UserRole, filepath)
+            item.setData(MetricsRole, data.get("metrics"))
             item.setToolTip(tooltip)
             self.list_widget.addItem(item)
 
     def _on_selection_changed(self, current, _previous):
-        self.delete_button.setEnabled(current is not None)
+        self.delete_button.setEnabled(current is not None and self._task is None)
+        metrics = current.data(MetricsRole) if current is not None else None
+        self.metrics_label.setText(self._metrics_text(metrics) if metrics else "")
+
+    def _metrics_text(self, metrics: dict) -> str:
+        lines = [
+            self.tr("Plugin {plugin}, QGIS {qgis}, {backend} backend").format(
+                plugin=metrics.get("plugin_version") or "?",
+                qgis=metrics.get("qgis_version") or "?",
+                backend=metrics.get("backend") or "?",
+            )
+        ]
+        stages = ", ".join(
+            f"{stage} {duration:.1f} s"
+            for stage, duration in metrics.get("stages", {}).items()
+            if duration is not None
+        )
+        if stages:
+            lines.append(self.tr("Stages: {stages}").format(stages=stages))
+        for layer_name, layer_metrics in metrics.get("layers", {}).items():
+            rate = layer_metrics.get("features_per_second")
+            lines.append(
+                self.tr("{layer} ({provider}): {n} features, {rate} features/s").format(
+                    layer=layer_name,
+                    provider=layer_metrics.get("provider", "?"),
+                    n=layer_metrics.get("features", 0),
+                    rate=f"{rate:.0f}" if rate else "-",
+                )
+            )
+        return "\n".join(lines)
 
     def _on_delete(self):
         item = self.list_widget.currentItem()
@@ -143,104 +195,102 @@ class UndoImportDialog(QDialog):
 
         features = data.get("features", {})
         total = sum(len(v.get("obj_ids", [])) for v in features.values())
-
+        already_deleted = sum(len(obj_ids) for obj_ids in undo_checkpoint(data).values())
+
+        message = self.tr(
+            "This will permanently delete {n} features from the database.\n\nAre you sure?"
+        ).format(n=total - already_deleted)
+        if already_deleted:
+            message = (
+                self.tr(
+                    "This import has already been partially undone ({deleted}/{total} features). "
+                    "The undo will be resumed.\n\n"
+                ).format(deleted=already_deleted, total=total)
+                + message
+            )
         reply = QMessageBox.warning(
             self,
             self.tr("Confirm deletion"),
-            self.tr(
-                "This will permanently delete {n} features from the database.\n\nAre you sure?"
-            ).format(n=total),
+            message,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        logger.info(f"Starting undo: deleting {total} features")
-
         try:
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-            self._delete_features(features)
-        except Exception as e:
+            plan = deletion_plan(features)
+        except W2TLayerNotFound as e:
             QMessageBox.critical(
                 self, self.tr("Deletion failed"), self.tr("Error during deletion:\n{e}").format(e=e)
             )
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
-        # Remove log file after successful deletion
-        try:
-            os.remove(filepath)
-        except OSError:
-            pass
+        logger.info(f"Starting undo: deleting {total - already_deleted} features")
 
-        logger.info(f"Undo completed: deleted {total} features")
+        self._task = UndoImportTask(filepath, data, plan)
+        self._task.progressChanged.connect(self._on_task_progress)
+        self._task.layerStarted.connect(self._on_task_layer_started)
+        self._task.taskCompleted.connect(self._on_task_completed)
+        self._task.taskTerminated.connect(self._on_task_terminated)
 
+        self.delete_button.setEnabled(False)
+        self.list_widget.setEnabled(False)
+        self.cancel_button.show()
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
+        self.progress_bar.show()
+        QgsApplication.taskManager().addTask(self._task)
+
+    def _on_task_progress(self, progress):
+        self.progress_bar.setValue(int(progress))
+
+    def _on_task_layer_started(self, layer_name):
+        self.progress_bar.setFormat(self.tr("{layer}: %p%").format(layer=layer_name))
+
+    def _on_task_completed(self):
+        task = self._task
+        self._task_done()
+        logger.info(f"Undo completed: deleted {task.deleted_count} features")
         QMessageBox.information(
             self,
             self.tr("Import undone"),
-            self.tr("Successfully deleted {n} features.").format(n=total),
+            self.tr("Successfully deleted {n} features.").format(n=task.deleted_count),
+        )
+
+    def _on_task_terminated(self):
+        task = self._task
+        self._task_done()
+        if task.error is not None:
+            message = self.tr("Error during deletion:\n{e}").format(e=task.error)
+        elif task.isCanceled():
+            message = self.tr("Deletion cancelled.")
+        else:
+            message = self.tr("Unexpected error during deletion, see the QGIS message log.")
+        QMessageBox.critical(
+            self,
+            self.tr("Deletion failed"),
+            message
+            + "\n\n"
+            + self.tr(
+                "{n} features have been deleted. "
+                "The import is marked as partially undone and the undo can be resumed."
+            ).format(n=task.deleted_count),
         )
+
+    def _task_done(self):
+        self._task = None
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.list_widget.setEnabled(True)
         self._load_logs()
 
-    def _delete_features(self, features):
-        settings = Settings()
-
-        # Map setting key → layer id
-        setting_to_layer_id = {
-            "file_layer": settings.file_layer.value(),
-            "join_maintence_wastewaterstructure_layer": settings.join_maintence_wastewaterstructure_layer.value(),
-            "damage_layer": settings.damage_layer.value(),
-            "maintenance_layer": settings.maintenance_layer.value(),
-        }
-
-        # Build layer_id → list of obj_ids from the log
-        layer_id_to_obj_ids = {}
-        for _layer_name, layer_data in features.items():
-            layer_id = layer_data.get("layer_id")
-            obj_ids = layer_data.get("obj_ids", [])
-            if layer_id and obj_ids:
-                layer_id_to_obj_ids[layer_id] = obj_ids
-
-        # Determine ordered list of (layer, obj_ids) for deletion
-        deletion_plan = []
-        for setting_key in DELETION_ORDER:
-            layer_id = setting_to_layer_id.get(setting_key)
-            if layer_id and layer_id in layer_id_to_obj_ids:
-                layer = QgsProject.instance().mapLayer(layer_id)
-                if layer is None:
-                    raise RuntimeError(
-                        self.tr("Layer '{layer_id}' not found in project").format(layer_id=layer_id)
-                    )
-                deletion_plan.append((layer, layer_id_to_obj_ids.pop(layer_id)))
-
-        # Any remaining layers not in the known order (shouldn't happen, but be safe)
-        for layer_id, obj_ids in layer_id_to_obj_ids.items():
-            layer = QgsProject.instance().mapLayer(layer_id)
-            if layer is not None:
-                deletion_plan.append((layer, obj_ids))
-
-        # Execute deletion within nested edit sessions
-        # We need all layers in edit mode simultaneously so we nest them
-        self._delete_nested(deletion_plan, 0)
-
-    def _delete_nested(self, plan, index):
-        if index >= len(plan):
-            return
-        layer, obj_ids = plan[index]
-        with edit(layer):
-            # Delete features from this layer first (dependents before parents)
-            for obj_id in obj_ids:
-                request = QgsFeatureRequest().setFilterExpression(
-                    "\"obj_id\" = '{}'".format(obj_id.replace("'", "''"))
-                )
-                for feature in layer.getFeatures(request):
-                    if not layer.deleteFeature(feature.id()):
-                        raise RuntimeError(
-                            self.tr("Failed to delete feature {obj_id} from {layer}").format(
-                                obj_id=obj_id, layer=layer.name()
-                            )
-                        )
-                    logger.debug(f"Deleted feature {obj_id} from {layer.name()}")
-            # Then open remaining layers (parents deleted after dependents)
-            self._delete_nested(plan, index + 1)
+    def _on_cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    def reject(self):
+        if self._task is not None:
+            # the task keeps running in the background
+            logger.info("Undo dialog closed, the undo continues in the background")
+        super().reject()
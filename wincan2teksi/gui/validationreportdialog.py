@@ -0,0 +1,153 @@
+from qgis.PyQt.QtCore import (
+    QAbstractTableModel,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSignal,
+)
+from qgis.PyQt.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QHeaderView,
+    QLabel,
+    QTableView,
+    QVBoxLayout,
+)
+
+# raw value of the issue, used for sorting
+SortRole = Qt.ItemDataRole.UserRole + 1
+
+
+class DistanceIssueTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._issues = []
+        self.column_headers = [
+            self.tr("#"),
+            self.tr("From node"),
+            self.tr("To node"),
+            self.tr("Observations"),
+            self.tr("Max distance"),
+            self.tr("Reach length"),
+            self.tr("Overshoot"),
+        ]
+
+    def set_issues(self, issues):
+        self.beginResetModel()
+        self._issues = list(issues)
+        self.endResetModel()
+
+    def issue(self, row):
+        if 0 <= row < len(self._issues):
+            return self._issues[row]
+        return None
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._issues)
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.column_headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.column_headers[section]
+        return None
+
+    @staticmethod
+    def _value(issue, col):
+        return (
+            issue.counter,
+            issue.from_node,
+            issue.to_node,
+            issue.observation_count,
+            issue.max_distance,
+            issue.reach_length,
+            issue.overshoot,
+        )[col]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        issue = self._issues[index.row()]
+        value = self._value(issue, index.column())
+        if role == Qt.ItemDataRole.DisplayRole:
+            if isinstance(value, float):
+                return f"{value:.2f}"
+            return "" if value is None else str(value)
+        elif role == Qt.ItemDataRole.TextAlignmentRole and isinstance(value, (int, float)):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        elif role == SortRole:
+            return value
+        return None
+
+
+class ValidationReportDialog(QDialog):
+    """
+    Lists the inspections with observations further than their assigned reaches
+    Double-clicking a row selects the section in the data browser
+    """
+
+    sectionRequested = pyqtSignal(object, object)  # project id, section id
+    revalidateRequested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Observation distance validation"))
+        self.resize(650, 400)
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        self._model = DistanceIssueTableModel(self)
+        self._proxy_model = QSortFilterProxyModel(self)
+        self._proxy_model.setSourceModel(self._model)
+        self._proxy_model.setSortRole(SortRole)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self._proxy_model)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(6, Qt.SortOrder.DescendingOrder)
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_view.verticalHeader().hide()
+        self.table_view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+        self.table_view.doubleClicked.connect(self._on_double_clicked)
+        layout.addWidget(self.table_view)
+
+        button_box = QDialogButtonBox()
+        revalidate_button = button_box.addButton(
+            self.tr("Validate again"), QDialogButtonBox.ButtonRole.ActionRole
+        )
+        revalidate_button.clicked.connect(self.revalidateRequested)
+        button_box.addButton(QDialogButtonBox.StandardButton.Close)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def set_issues(self, issues, tolerance):
+        self._model.set_issues(issues)
+        if issues:
+            self.summary_label.setText(
+                self.tr(
+                    "{n} inspection(s) have observations further than the length of the"
+                    " assigned channels (tolerance: {tolerance} m)."
+                    " Double-click a row to select the section."
+                ).format(n=len(issues), tolerance=tolerance)
+            )
+        else:
+            self.summary_label.setText(
+                self.tr("All observation distances are within the assigned channels.")
+            )
+
+    def _on_double_clicked(self, index):
+        issue = self._model.issue(self._proxy_model.mapToSource(index).row())
+        if issue is not None:
+            self.sectionRequested.emit(issue.project_id, issue.section_id)
@@ -0,0 +1,60 @@
+import unittest
+
+from qgis.core import QgsFeature, QgsFeatureRequest, QgsVectorLayer
+from qgis.testing import start_app
+
+from wincan2teksi.core import layer_access
+
+start_app()
+
+
+def memory_layer(feature_count: int) -> QgsVectorLayer:
+    layer = QgsVectorLayer("None?field=obj_id:string(16)", "reach", "memory")
+    features = []
+    for i in range(feature_count):
+        feature = QgsFeature(layer.fields())
+        feature["obj_id"] = f"obj{i}"
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    return layer
+
+
+class TestLayerAccess(unittest.TestCase):
+    def setUp(self):
+        layer_access.set_slow_query_threshold_ms(0)
+        layer_access.reset_statistics()
+
+    def test_get_features_is_lazy(self):
+        layer = memory_layer(5)
+        features = layer_access.get_features(layer, site="test")
+        self.assertNotIsInstance(features, list)
+        self.assertEqual(layer_access.statistics(), {})
+
+        self.assertEqual([feature["obj_id"] for feature in features], [f"obj{i}" for i in range(5)])
+        entry = layer_access.statistics()["reach", "test"]
+        self.assertEqual(entry["count"], 1)
+        self.assertEqual(entry["features"], 5)
+
+    def test_get_features_closed_early(self):
+        layer = memory_layer(5)
+        features = layer_access.get_features(layer, site="test")
+        next(features)
+        next(features)
+        features.close()
+        self.assertEqual(layer_access.statistics()["reach", "test"]["features"], 2)
+
+    def test_get_feature_keeps_request(self):
+        layer = memory_layer(5)
+        request = QgsFeatureRequest().setFilterExpression("\"obj_id\" = 'obj3'")
+        feature = layer_access.get_feature(layer, request, "test")
+        self.assertEqual(feature["obj_id"], "obj3")
+        self.assertEqual(request.limit(), -1)
+        self.assertEqual(layer_access.statistics()["reach", "test"]["features"], 1)
+
+    def test_get_feature_without_result(self):
+        layer = memory_layer(0)
+        self.assertFalse(layer_access.get_feature(layer, QgsFeatureRequest(), "test").isValid())
+
+
+if __name__ == "__main__":
+    unittest.main()
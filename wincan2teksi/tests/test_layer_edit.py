@@ -0,0 +1,93 @@
+import unittest
+
+from qgis.core import QgsFeature, QgsVectorLayer
+from qgis.testing import start_app
+
+from wincan2teksi.core.layer_edit import EditStatistics, ImportSession, edit
+
+start_app()
+
+
+def memory_layer(name: str = "damage") -> QgsVectorLayer:
+    return QgsVectorLayer("None?field=obj_id:string(16)&field=remark:string", name, "memory")
+
+
+def new_feature(layer, obj_id: str) -> QgsFeature:
+    feature = QgsFeature(layer.fields())
+    feature["obj_id"] = obj_id
+    return feature
+
+
+class TestEditStatistics(unittest.TestCase):
+    def test_added_after_commit(self):
+        layer = memory_layer()
+        statistics = EditStatistics()
+        with edit(layer, statistics):
+            for i in range(10):
+                self.assertTrue(layer.addFeature(new_feature(layer, f"obj{i}")))
+
+        self.assertEqual(layer.featureCount(), 10)
+        entry = statistics.summary()[0]
+        self.assertEqual(entry["added"], 10)
+        self.assertEqual(entry["changed"], 0)
+        self.assertEqual(entry["deleted"], 0)
+        self.assertEqual(entry["errors"], [])
+
+    def test_changed_and_deleted_features(self):
+        layer = memory_layer()
+        layer.dataProvider().addFeatures([new_feature(layer, f"obj{i}") for i in range(5)])
+        fids = [feature.id() for feature in layer.getFeatures()]
+        remark_index = layer.fields().indexFromName("remark")
+
+        statistics = EditStatistics()
+        with edit(layer, statistics):
+            # several values of the same feature count as one changed feature
+            layer.changeAttributeValue(fids[0], remark_index, "a")
+            layer.changeAttributeValue(fids[0], remark_index, "b")
+            layer.changeAttributeValue(fids[1], remark_index, "c")
+            layer.deleteFeatures(fids[2:4])
+
+        entry = statistics.summary()[0]
+        self.assertEqual(entry["added"], 0)
+        self.assertEqual(entry["changed"], 2)
+        self.assertEqual(entry["deleted"], 2)
+
+    def test_import_session(self):
+        maintenance_layer = memory_layer("maintenance")
+        damage_layer = memory_layer("damage")
+        statistics = EditStatistics()
+        with ImportSession([maintenance_layer, damage_layer], statistics):
+            maintenance_layer.addFeature(new_feature(maintenance_layer, "me"))
+            for i in range(3):
+                damage_layer.addFeature(new_feature(damage_layer, f"da{i}"))
+
+        added = {entry["layer"]: entry["added"] for entry in statistics.summary()}
+        self.assertEqual(added, {"maintenance": 1, "damage": 3})
+
+    def test_nested_watches(self):
+        layer = memory_layer()
+        statistics = EditStatistics()
+        with edit(layer, statistics):
+            with edit(layer, statistics):
+                layer.addFeature(new_feature(layer, "obj1"))
+            # the inner session must not stop the watch of the outer one
+            self.assertIn(layer.id(), statistics._connections)
+        self.assertNotIn(layer.id(), statistics._connections)
+
+    def test_edit_in_import_session(self):
+        maintenance_layer = memory_layer("maintenance")
+        damage_layer = memory_layer("damage")
+        statistics = EditStatistics()
+        with ImportSession([maintenance_layer, damage_layer], statistics):
+            with edit(damage_layer, statistics):
+                damage_layer.addFeature(new_feature(damage_layer, "da0"))
+            self.assertIn(damage_layer.id(), statistics._connections)
+            maintenance_layer.addFeature(new_feature(maintenance_layer, "me"))
+        self.assertEqual(statistics._connections, {})
+
+        added = {entry["layer"]: entry["added"] for entry in statistics.summary()}
+        self.assertEqual(added, {"maintenance": 1, "damage": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from wincan2teksi.core.objects.inspection import Inspection
+from wincan2teksi.core.objects.project import Project
+from wincan2teksi.core.objects.section import Section
+
+
+def create_project(*sections) -> Project:
+    """
+    Returns a project with a section of 10 m and one inspection for each
+    (use_previous_section, section imported, inspection imported) tuple
+    """
+    project = Project("P1", "project", None)
+    for i, (use_previous, section_import, inspection_import) in enumerate(sections):
+        section = Section(f"S{i}", f"section {i}", "P1", section_length=10, import_=section_import)
+        section.use_previous_section = use_previous
+        section.add_inspection(Inspection(f"I{i}", f"inspection {i}", section.pk))
+        section.inspections[f"I{i}"].import_ = inspection_import
+        project.add_section(section)
+    return project
+
+
+class TestInvalidSectionChains(unittest.TestCase):
+    def test_valid_chain(self):
+        project = create_project((False, True, True), (True, True, True), (True, True, True))
+        self.assertEqual(project.invalid_section_chains(), [])
+        self.assertEqual(project.previous_section_offsets(), {"S1": -10, "S2": -20})
+
+    def test_chain_without_head(self):
+        project = create_project((True, True, True), (True, True, True))
+        self.assertEqual(project.invalid_section_chains(), ["S0", "S1"])
+
+    def test_head_not_imported(self):
+        project = create_project((False, False, True), (True, True, True))
+        self.assertEqual(project.invalid_section_chains(), ["S1"])
+
+    def test_head_without_imported_inspection(self):
+        project = create_project((False, True, False), (True, True, True), (True, True, True))
+        self.assertEqual(project.invalid_section_chains(), ["S1", "S2"])
+
+    def test_chain_broken_by_unchecked_section(self):
+        project = create_project((False, True, True), (True, False, True), (True, True, True))
+        self.assertEqual(project.invalid_section_chains(), ["S2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path, PurePosixPath, PureWindowsPath
+
+from wincan2teksi.core.read_data import _sqlite_uri
+
+
+class TestSqliteUri(unittest.TestCase):
+    def test_posix_path(self):
+        self.assertEqual(
+            _sqlite_uri(PurePosixPath("/data/DB/project.db3"), True),
+            "file:///data/DB/project.db3?mode=ro&immutable=1",
+        )
+
+    def test_windows_drive_path(self):
+        self.assertEqual(
+            _sqlite_uri(PureWindowsPath(r"C:\data\DB\project.db3"), False),
+            "file:///C:/data/DB/project.db3?mode=ro",
+        )
+
+    def test_unc_path(self):
+        self.assertEqual(
+            _sqlite_uri(PureWindowsPath(r"\\server\share\DB\project.db3"), False),
+            "file:////server/share/DB/project.db3?mode=ro",
+        )
+
+    def test_quoted_characters(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "a b#c%d?" / "project.db3"
+            path.parent.mkdir()
+            conn = sqlite3.connect(path)
+            conn.execute("CREATE TABLE PROJECT (PRJ_PK TEXT)")
+            conn.close()
+
+            conn = sqlite3.connect(_sqlite_uri(Path(os.path.abspath(path)), True), uri=True)
+            try:
+                self.assertEqual(conn.execute("SELECT count(*) FROM PROJECT").fetchone(), (0,))
+                with self.assertRaises(sqlite3.OperationalError):
+                    conn.execute("CREATE TABLE other (a)")
+            finally:
+                conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
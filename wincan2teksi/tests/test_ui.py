@@ -0,0 +1,28 @@
+import glob
+import hashlib
+import os
+import unittest
+
+UI_DIR = os.path.join(os.path.dirname(__file__), "..", "ui")
+
+
+class TestCompiledForms(unittest.TestCase):
+    def test_forms_are_up_to_date(self):
+        ui_paths = glob.glob(os.path.join(UI_DIR, "*.ui"))
+        self.assertTrue(ui_paths)
+        for ui_path in ui_paths:
+            name = os.path.splitext(os.path.basename(ui_path))[0]
+            with self.subTest(form=name):
+                with open(ui_path, "rb") as f:
+                    digest = hashlib.sha256(f.read().replace(b"\r\n", b"\n")).hexdigest()
+                with open(os.path.join(UI_DIR, f"ui_{name}.py"), encoding="utf-8") as f:
+                    recorded = [line for line in f if line.startswith("# ui sha256: ")]
+                self.assertEqual(
+                    recorded,
+                    [f"# ui sha256: {digest}\n"],
+                    f"ui_{name}.py is outdated, run scripts/compile_ui.py",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import time
+import unittest
+
+from qgis.core import QgsCoordinateTransformContext, QgsVectorFileWriter, QgsVectorLayer
+from qgis.testing import start_app
+
+from wincan2teksi.core.import_plan import ImportPlan
+from wincan2teksi.core.writers import INSERT_CHUNK_SIZE, SqliteImportWriter
+
+start_app()
+
+
+def create_gpkg_layers(path: str, names) -> dict:
+    """
+    Creates a GeoPackage with a table for each name and returns the layers by name
+    """
+    for i, name in enumerate(names):
+        memory_layer = QgsVectorLayer(
+            "None?field=obj_id:string(16)&field=remark:string", name, "memory"
+        )
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = "GPKG"
+        options.layerName = name
+        if i > 0:
+            options.actionOnExistingFile = (
+                QgsVectorFileWriter.ActionOnExistingFile.CreateOrOverwriteLayer
+            )
+        QgsVectorFileWriter.writeAsVectorFormatV3(
+            memory_layer, path, QgsCoordinateTransformContext(), options
+        )
+    return {name: QgsVectorLayer(f"{path}|layername={name}", name, "ogr") for name in names}
+
+
+class TestSqliteImportWriter(unittest.TestCase):
+    def test_layer_write_time(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            layers = create_gpkg_layers(os.path.join(tmp_dir, "import.gpkg"), ImportPlan.LAYER_KEYS)
+            plan = ImportPlan(layers)
+            writer = SqliteImportWriter(list(layers.values()))
+            # several chunks of INSERT statements
+            for _ in range(INSERT_CHUNK_SIZE * 2 + 1):
+                feature = plan.new_feature(
+                    ImportPlan.DAMAGE, writer.new_obj_id(layers[ImportPlan.DAMAGE])
+                )
+                plan.add_feature(ImportPlan.DAMAGE, feature)
+
+            start = time.perf_counter()
+            added_features = writer.write(plan)
+            elapsed = time.perf_counter() - start
+            writer.close()
+
+            damage_layer = layers[ImportPlan.DAMAGE]
+            self.assertEqual(len(added_features[damage_layer.id()]), INSERT_CHUNK_SIZE * 2 + 1)
+            write_time = writer.layer_write_times[damage_layer.id()]
+            self.assertGreater(write_time, 0)
+            self.assertLessEqual(write_time, elapsed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Generated from databrowserdialog.ui by scripts/compile_ui.py, do not edit.
+# ui sha256: 038359e7de4791a70badf7bd6f3ff69f7038aff59faf2ef365d0dca10236db2f
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_DataBrowserDialog(object):
+    def setupUi(self, DataBrowserDialog):
+        DataBrowserDialog.setObjectName("DataBrowserDialog")
+        DataBrowserDialog.resize(780, 543)
+        self.gridLayout = QtWidgets.QGridLayout(DataBrowserDialog)
+        self.gridLayout.setObjectName("gridLayout")
+        self.cancelButton = QtWidgets.QPushButton(parent=DataBrowserDialog)
+        self.cancelButton.setObjectName("cancelButton")
+        self.gridLayout.addWidget(self.cancelButton, 5, 0, 1, 1)
+        self.importButton = QtWidgets.QPushButton(parent=DataBrowserDialog)
+        self.importButton.setObjectName("importButton")
+        self.gridLayout.addWidget(self.importButton, 5, 2, 1, 1)
+        self.sectionWidget = SectionWidget(parent=DataBrowserDialog)
+        self.sectionWidget.setObjectName("sectionWidget")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.sectionWidget)
+        self.gridLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.gridLayout.addWidget(self.sectionWidget, 4, 0, 1, 3)
+        self.widget_2 = QtWidgets.QWidget(parent=DataBrowserDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget_2.sizePolicy().hasHeightForWidth())
+        self.widget_2.setSizePolicy(sizePolicy)
+        self.widget_2.setObjectName("widget_2")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.widget_2)
+        self.gridLayout_4.setContentsMargins(3, 3, 3, 3)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.label_4 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_4.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout_4.addWidget(self.label_4, 1, 0, 1, 2)
+        self.label_5 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_5.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout_4.addWidget(self.label_5, 3, 1, 1, 1)
+        self.label_6 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_6.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout_4.addWidget(self.label_6, 2, 1, 1, 1)
+        self.channelNameEdit = QtWidgets.QLineEdit(parent=self.widget_2)
+        self.channelNameEdit.setObjectName("channelNameEdit")
+        self.gridLayout_4.addWidget(self.channelNameEdit, 0, 2, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_4.addItem(spacerItem, 0, 4, 1, 1)
+        self.searchButton = QtWidgets.QToolButton(parent=self.widget_2)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("/root/package/wincan2teksi/ui/../icons/magnifier13.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.searchButton.setIcon(icon)
+        self.searchButton.setObjectName("searchButton")
+        self.gridLayout_4.addWidget(self.searchButton, 0, 3, 1, 1)
+        self.projectCombo = QtWidgets.QComboBox(parent=self.widget_2)
+        self.projectCombo.setObjectName("projectCombo")
+        self.gridLayout_4.addWidget(self.projectCombo, 0, 0, 1, 1)
+        self.label_3 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout_4.addWidget(self.label_3, 0, 1, 1, 1)
+        self.data_path_line_edit = QgsFileWidget(parent=self.widget_2)
+        self.data_path_line_edit.setObjectName("data_path_line_edit")
+        self.gridLayout_4.addWidget(self.data_path_line_edit, 1, 2, 1, 3)
+        self.meta_file_widget = QgsFileWidget(parent=self.widget_2)
+        self.meta_file_widget.setEnabled(True)
+        self.meta_file_widget.setProperty("useLink", True)
+        self.meta_file_widget.setObjectName("meta_file_widget")
+        self.gridLayout_4.addWidget(self.meta_file_widget, 2, 2, 1, 3)
+        self.pdf_path_widget = QgsFileWidget(parent=self.widget_2)
+        self.pdf_path_widget.setProperty("useLink", True)
+        self.pdf_path_widget.setObjectName("pdf_path_widget")
+        self.gridLayout_4.addWidget(self.pdf_path_widget, 3, 2, 1, 3)
+        self.gridLayout.addWidget(self.widget_2, 1, 0, 1, 3)
+        self.widget = QtWidgets.QWidget(parent=DataBrowserDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.widget.setObjectName("widget")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.widget)
+        self.gridLayout_3.setContentsMargins(3, 3, 3, 3)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.operatingCompanyComboBox = QtWidgets.QComboBox(parent=self.widget)
+        self.operatingCompanyComboBox.setObjectName("operatingCompanyComboBox")
+        self.gridLayout_3.addWidget(self.operatingCompanyComboBox, 1, 2, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_3.addItem(spacerItem1, 1, 3, 1, 1)
+        self.label = QtWidgets.QLabel(parent=self.widget)
+        self.label.setObjectName("label")
+        self.gridLayout_3.addWidget(self.label, 1, 1, 1, 1)
+        self.gridLayout.addWidget(self.widget, 2, 0, 1, 3)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem2, 5, 1, 1, 1)
+        self.progressBar = QtWidgets.QProgressBar(parent=DataBrowserDialog)
+        self.progressBar.setProperty("value", 24)
+        self.progressBar.setObjectName("progressBar")
+        self.gridLayout.addWidget(self.progressBar, 7, 0, 1, 3)
+        self.messageBar_placeholder = QtWidgets.QWidget(parent=DataBrowserDialog)
+        self.messageBar_placeholder.setObjectName("messageBar_placeholder")
+        self.gridLayout.addWidget(self.messageBar_placeholder, 8, 0, 1, 3)
+
+        self.retranslateUi(DataBrowserDialog)
+        self.channelNameEdit.returnPressed.connect(self.searchButton.click) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(DataBrowserDialog)
+
+    def retranslateUi(self, DataBrowserDialog):
+        _translate = QtCore.QCoreApplication.translate
+        DataBrowserDialog.setWindowTitle(_translate("DataBrowserDialog", "Wincan VX to TEKSI Importer"))
+        self.cancelButton.setText(_translate("DataBrowserDialog", "cancel"))
+        self.importButton.setText(_translate("DataBrowserDialog", "Import"))
+        self.label_4.setText(_translate("DataBrowserDialog", "Path"))
+        self.label_5.setText(_translate("DataBrowserDialog", "PDF"))
+        self.label_6.setText(_translate("DataBrowserDialog", "Meta file"))
+        self.searchButton.setText(_translate("DataBrowserDialog", "..."))
+        self.label_3.setText(_translate("DataBrowserDialog", "Channel"))
+        self.pdf_path_widget.setProperty("filter", _translate("DataBrowserDialog", "*.pdf"))
+        self.label.setText(_translate("DataBrowserDialog", "Company"))
+from qgis.gui import QgsFileWidget
+from wincan2teksi.gui.sectionwidget import SectionWidget
@@ -0,0 +1,95 @@
+# Generated from inspectionwidget.ui by scripts/compile_ui.py, do not edit.
+# ui sha256: 1d2156277623541d92c0ce4e95607ad4c9ba5acc8cbd350e11bc0692e098dce4
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_InspectionWidget(object):
+    def setupUi(self, InspectionWidget):
+        InspectionWidget.setObjectName("InspectionWidget")
+        InspectionWidget.resize(543, 294)
+        self.gridLayout = QtWidgets.QGridLayout(InspectionWidget)
+        self.gridLayout.setObjectName("gridLayout")
+        self.inspectionDirEdit = QtWidgets.QLineEdit(parent=InspectionWidget)
+        self.inspectionDirEdit.setEnabled(False)
+        self.inspectionDirEdit.setObjectName("inspectionDirEdit")
+        self.gridLayout.addWidget(self.inspectionDirEdit, 2, 1, 1, 1)
+        self.inspectionCombo = QtWidgets.QComboBox(parent=InspectionWidget)
+        self.inspectionCombo.setObjectName("inspectionCombo")
+        self.gridLayout.addWidget(self.inspectionCombo, 0, 1, 1, 1)
+        self.label_9 = QtWidgets.QLabel(parent=InspectionWidget)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout.addWidget(self.label_9, 0, 0, 1, 1)
+        self.label_4 = QtWidgets.QLabel(parent=InspectionWidget)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 2, 2, 1, 1)
+        self.label = QtWidgets.QLabel(parent=InspectionWidget)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 1, 0, 1, 1)
+        self.inspMethodEdit = QtWidgets.QLineEdit(parent=InspectionWidget)
+        self.inspMethodEdit.setEnabled(False)
+        self.inspMethodEdit.setObjectName("inspMethodEdit")
+        self.gridLayout.addWidget(self.inspMethodEdit, 1, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(parent=InspectionWidget)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 1, 2, 1, 1)
+        self.inspectedLengthEdit = QtWidgets.QLineEdit(parent=InspectionWidget)
+        self.inspectedLengthEdit.setEnabled(False)
+        self.inspectedLengthEdit.setObjectName("inspectedLengthEdit")
+        self.gridLayout.addWidget(self.inspectedLengthEdit, 1, 3, 1, 1)
+        self.label_2 = QtWidgets.QLabel(parent=InspectionWidget)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 2, 0, 1, 1)
+        self.operatorEdit = QtWidgets.QLineEdit(parent=InspectionWidget)
+        self.operatorEdit.setEnabled(False)
+        self.operatorEdit.setObjectName("operatorEdit")
+        self.gridLayout.addWidget(self.operatorEdit, 2, 3, 1, 1)
+        self.filterLayout = QtWidgets.QHBoxLayout()
+        self.filterLayout.setObjectName("filterLayout")
+        self.codeFilterEdit = QtWidgets.QLineEdit(parent=InspectionWidget)
+        self.codeFilterEdit.setClearButtonEnabled(True)
+        self.codeFilterEdit.setObjectName("codeFilterEdit")
+        self.filterLayout.addWidget(self.codeFilterEdit)
+        self.rateFilterCombo = QtWidgets.QComboBox(parent=InspectionWidget)
+        self.rateFilterCombo.setObjectName("rateFilterCombo")
+        self.filterLayout.addWidget(self.rateFilterCombo)
+        self.label_distance = QtWidgets.QLabel(parent=InspectionWidget)
+        self.label_distance.setObjectName("label_distance")
+        self.filterLayout.addWidget(self.label_distance)
+        self.minDistanceSpinBox = QtWidgets.QDoubleSpinBox(parent=InspectionWidget)
+        self.minDistanceSpinBox.setMaximum(100000.0)
+        self.minDistanceSpinBox.setObjectName("minDistanceSpinBox")
+        self.filterLayout.addWidget(self.minDistanceSpinBox)
+        self.maxDistanceSpinBox = QtWidgets.QDoubleSpinBox(parent=InspectionWidget)
+        self.maxDistanceSpinBox.setMaximum(100000.0)
+        self.maxDistanceSpinBox.setObjectName("maxDistanceSpinBox")
+        self.filterLayout.addWidget(self.maxDistanceSpinBox)
+        self.gridLayout.addLayout(self.filterLayout, 3, 0, 1, 4)
+        self.observationTable = ObservationTable(parent=InspectionWidget)
+        self.observationTable.setObjectName("observationTable")
+        self.gridLayout.addWidget(self.observationTable, 4, 0, 1, 4)
+        self.importCheckBox = QtWidgets.QCheckBox(parent=InspectionWidget)
+        self.importCheckBox.setChecked(True)
+        self.importCheckBox.setObjectName("importCheckBox")
+        self.gridLayout.addWidget(self.importCheckBox, 0, 3, 1, 1)
+
+        self.retranslateUi(InspectionWidget)
+        QtCore.QMetaObject.connectSlotsByName(InspectionWidget)
+
+    def retranslateUi(self, InspectionWidget):
+        _translate = QtCore.QCoreApplication.translate
+        InspectionWidget.setWindowTitle(_translate("InspectionWidget", "Form"))
+        self.label_9.setText(_translate("InspectionWidget", "Inspection"))
+        self.label_4.setText(_translate("InspectionWidget", "Operator"))
+        self.label.setText(_translate("InspectionWidget", "Method"))
+        self.label_3.setText(_translate("InspectionWidget", "Length"))
+        self.label_2.setText(_translate("InspectionWidget", "Way"))
+        self.codeFilterEdit.setPlaceholderText(_translate("InspectionWidget", "Filter by code"))
+        self.rateFilterCombo.setToolTip(_translate("InspectionWidget", "Only show observations with this rate or worse"))
+        self.label_distance.setText(_translate("InspectionWidget", "Distance"))
+        self.minDistanceSpinBox.setSpecialValueText(_translate("InspectionWidget", "min"))
+        self.minDistanceSpinBox.setSuffix(_translate("InspectionWidget", " m"))
+        self.maxDistanceSpinBox.setSpecialValueText(_translate("InspectionWidget", "max"))
+        self.maxDistanceSpinBox.setSuffix(_translate("InspectionWidget", " m"))
+        self.importCheckBox.setText(_translate("InspectionWidget", "Import"))
+from wincan2teksi.gui.observationtable import ObservationTable
@@ -0,0 +1,54 @@
+# Generated from logs_widget.ui by scripts/compile_ui.py, do not edit.
+# ui sha256: 09d2189934ab61712b2ad1a42e2c24d5a1ecc075d68270927a43baaa0aaa12f2
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(833, 300)
+        self.gridLayout = QtWidgets.QGridLayout(Form)
+        self.gridLayout.setObjectName("gridLayout")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout.addItem(spacerItem, 3, 1, 1, 1)
+        self.logs_copy_all_toolButton = QtWidgets.QToolButton(parent=Form)
+        self.logs_copy_all_toolButton.setObjectName("logs_copy_all_toolButton")
+        self.gridLayout.addWidget(self.logs_copy_all_toolButton, 1, 1, 1, 1)
+        self.logs_clear_toolButton = QtWidgets.QToolButton(parent=Form)
+        self.logs_clear_toolButton.setObjectName("logs_clear_toolButton")
+        self.gridLayout.addWidget(self.logs_clear_toolButton, 2, 1, 1, 1)
+        self.logs_treeView = QtWidgets.QTreeView(parent=Form)
+        self.logs_treeView.setObjectName("logs_treeView")
+        self.gridLayout.addWidget(self.logs_treeView, 1, 0, 3, 1)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(parent=Form)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.logs_level_comboBox = QtWidgets.QComboBox(parent=Form)
+        self.logs_level_comboBox.setObjectName("logs_level_comboBox")
+        self.horizontalLayout.addWidget(self.logs_level_comboBox)
+        self.label_2 = QtWidgets.QLabel(parent=Form)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout.addWidget(self.label_2)
+        self.logs_filter_LineEdit = QtWidgets.QLineEdit(parent=Form)
+        self.logs_filter_LineEdit.setClearButtonEnabled(True)
+        self.logs_filter_LineEdit.setObjectName("logs_filter_LineEdit")
+        self.horizontalLayout.addWidget(self.logs_filter_LineEdit)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.gridLayout.addLayout(self.horizontalLayout, 0, 0, 1, 1)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.logs_copy_all_toolButton.setToolTip(_translate("Form", "Copy all logs to clipboard"))
+        self.logs_copy_all_toolButton.setText(_translate("Form", "..."))
+        self.logs_clear_toolButton.setToolTip(_translate("Form", "Clear logs panel"))
+        self.logs_clear_toolButton.setText(_translate("Form", "..."))
+        self.label.setText(_translate("Form", "Minimum level"))
+        self.label_2.setText(_translate("Form", "Filter"))
@@ -0,0 +1,168 @@
+# Generated from sectionwidget.ui by scripts/compile_ui.py, do not edit.
+# ui sha256: 8bff9ef54ae0a62d59a97d7b7cc529c8a1b70f27a187f932983d19404f61c11e
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_SectionWidget(object):
+    def setupUi(self, SectionWidget):
+        SectionWidget.setObjectName("SectionWidget")
+        SectionWidget.resize(649, 335)
+        self.gridLayout = QtWidgets.QGridLayout(SectionWidget)
+        self.gridLayout.setObjectName("gridLayout")
+        self.widget_2 = QtWidgets.QWidget(parent=SectionWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget_2.sizePolicy().hasHeightForWidth())
+        self.widget_2.setSizePolicy(sizePolicy)
+        self.widget_2.setObjectName("widget_2")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.widget_2)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.section_1_selector = FeatureSelectorWidget(parent=self.widget_2)
+        self.section_1_selector.setObjectName("section_1_selector")
+        self.gridLayout_4.addWidget(self.section_1_selector, 1, 1, 1, 1)
+        self.section_2_selector = FeatureSelectorWidget(parent=self.widget_2)
+        self.section_2_selector.setObjectName("section_2_selector")
+        self.gridLayout_4.addWidget(self.section_2_selector, 2, 1, 1, 1)
+        self.label_10 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout_4.addWidget(self.label_10, 1, 0, 1, 1)
+        self.label_12 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_12.setObjectName("label_12")
+        self.gridLayout_4.addWidget(self.label_12, 3, 0, 1, 1)
+        self.section_3_selector = FeatureSelectorWidget(parent=self.widget_2)
+        self.section_3_selector.setObjectName("section_3_selector")
+        self.gridLayout_4.addWidget(self.section_3_selector, 3, 1, 1, 1)
+        self.label_11 = QtWidgets.QLabel(parent=self.widget_2)
+        self.label_11.setObjectName("label_11")
+        self.gridLayout_4.addWidget(self.label_11, 2, 0, 1, 1)
+        self.gridLayout.addWidget(self.widget_2, 1, 6, 1, 2)
+        self.widget = QtWidgets.QWidget(parent=SectionWidget)
+        self.widget.setObjectName("widget")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.widget)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.sectionUseEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.sectionUseEdit.setEnabled(False)
+        self.sectionUseEdit.setObjectName("sectionUseEdit")
+        self.gridLayout_3.addWidget(self.sectionUseEdit, 2, 7, 1, 1)
+        self.endNodeEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.endNodeEdit.setEnabled(False)
+        self.endNodeEdit.setObjectName("endNodeEdit")
+        self.gridLayout_3.addWidget(self.endNodeEdit, 2, 1, 1, 1)
+        self.label_2 = QtWidgets.QLabel(parent=self.widget)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout_3.addWidget(self.label_2, 2, 0, 1, 1)
+        self.profileEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.profileEdit.setEnabled(False)
+        self.profileEdit.setObjectName("profileEdit")
+        self.gridLayout_3.addWidget(self.profileEdit, 1, 7, 1, 1)
+        self.pipeDiaEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.pipeDiaEdit.setEnabled(False)
+        self.pipeDiaEdit.setObjectName("pipeDiaEdit")
+        self.gridLayout_3.addWidget(self.pipeDiaEdit, 1, 5, 1, 1)
+        self.pipeWidthEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.pipeWidthEdit.setEnabled(False)
+        self.pipeWidthEdit.setObjectName("pipeWidthEdit")
+        self.gridLayout_3.addWidget(self.pipeWidthEdit, 2, 5, 1, 1)
+        self.label_7 = QtWidgets.QLabel(parent=self.widget)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout_3.addWidget(self.label_7, 1, 6, 1, 1)
+        self.sectionlengthEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.sectionlengthEdit.setEnabled(False)
+        self.sectionlengthEdit.setObjectName("sectionlengthEdit")
+        self.gridLayout_3.addWidget(self.sectionlengthEdit, 1, 3, 1, 1)
+        self.label_8 = QtWidgets.QLabel(parent=self.widget)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout_3.addWidget(self.label_8, 2, 4, 1, 1)
+        self.label_4 = QtWidgets.QLabel(parent=self.widget)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout_3.addWidget(self.label_4, 2, 6, 1, 1)
+        self.label_5 = QtWidgets.QLabel(parent=self.widget)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout_3.addWidget(self.label_5, 2, 2, 1, 1)
+        self.label = QtWidgets.QLabel(parent=self.widget)
+        self.label.setObjectName("label")
+        self.gridLayout_3.addWidget(self.label, 1, 0, 1, 1)
+        self.label_3 = QtWidgets.QLabel(parent=self.widget)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout_3.addWidget(self.label_3, 1, 2, 1, 1)
+        self.startNodeEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.startNodeEdit.setEnabled(False)
+        self.startNodeEdit.setObjectName("startNodeEdit")
+        self.gridLayout_3.addWidget(self.startNodeEdit, 1, 1, 1, 1)
+        self.label_6 = QtWidgets.QLabel(parent=self.widget)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout_3.addWidget(self.label_6, 1, 4, 1, 1)
+        self.pipeMaterialEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.pipeMaterialEdit.setEnabled(False)
+        self.pipeMaterialEdit.setObjectName("pipeMaterialEdit")
+        self.gridLayout_3.addWidget(self.pipeMaterialEdit, 2, 3, 1, 1)
+        self.label_9 = QtWidgets.QLabel(parent=self.widget)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout_3.addWidget(self.label_9, 0, 0, 1, 1)
+        self.addressEdit = QtWidgets.QLineEdit(parent=self.widget)
+        self.addressEdit.setEnabled(False)
+        self.addressEdit.setObjectName("addressEdit")
+        self.gridLayout_3.addWidget(self.addressEdit, 0, 1, 1, 3)
+        self.gridLayout.addWidget(self.widget, 4, 2, 1, 6)
+        self.checkAllButton = QtWidgets.QPushButton(parent=SectionWidget)
+        self.checkAllButton.setObjectName("checkAllButton")
+        self.gridLayout.addWidget(self.checkAllButton, 3, 2, 1, 1)
+        self.usePreviousSectionCheckBox = QtWidgets.QCheckBox(parent=SectionWidget)
+        self.usePreviousSectionCheckBox.setObjectName("usePreviousSectionCheckBox")
+        self.gridLayout.addWidget(self.usePreviousSectionCheckBox, 0, 6, 1, 2)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem, 3, 5, 1, 1)
+        self.uncheckAllButton = QtWidgets.QPushButton(parent=SectionWidget)
+        self.uncheckAllButton.setObjectName("uncheckAllButton")
+        self.gridLayout.addWidget(self.uncheckAllButton, 3, 3, 1, 1)
+        self.inspectionWidget = InspectionWidget(parent=SectionWidget)
+        self.inspectionWidget.setObjectName("inspectionWidget")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.inspectionWidget)
+        self.gridLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.gridLayout.addWidget(self.inspectionWidget, 11, 1, 1, 7)
+        self.sectionTableView = QtWidgets.QTableView(parent=SectionWidget)
+        self.sectionTableView.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.sectionTableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.sectionTableView.setAlternatingRowColors(True)
+        self.sectionTableView.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.sectionTableView.setObjectName("sectionTableView")
+        self.gridLayout.addWidget(self.sectionTableView, 0, 2, 2, 4)
+        self.filterUnmatchedSectionsButton = QtWidgets.QPushButton(parent=SectionWidget)
+        self.filterUnmatchedSectionsButton.setObjectName("filterUnmatchedSectionsButton")
+        self.gridLayout.addWidget(self.filterUnmatchedSectionsButton, 3, 4, 1, 1)
+
+        self.retranslateUi(SectionWidget)
+        self.usePreviousSectionCheckBox.toggled['bool'].connect(self.widget_2.setDisabled) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(SectionWidget)
+        SectionWidget.setTabOrder(self.endNodeEdit, self.sectionlengthEdit)
+        SectionWidget.setTabOrder(self.sectionlengthEdit, self.pipeDiaEdit)
+        SectionWidget.setTabOrder(self.pipeDiaEdit, self.startNodeEdit)
+        SectionWidget.setTabOrder(self.startNodeEdit, self.profileEdit)
+        SectionWidget.setTabOrder(self.profileEdit, self.pipeMaterialEdit)
+        SectionWidget.setTabOrder(self.pipeMaterialEdit, self.pipeWidthEdit)
+        SectionWidget.setTabOrder(self.pipeWidthEdit, self.sectionUseEdit)
+
+    def retranslateUi(self, SectionWidget):
+        _translate = QtCore.QCoreApplication.translate
+        SectionWidget.setWindowTitle(_translate("SectionWidget", "Form"))
+        self.label_10.setText(_translate("SectionWidget", "Channel 1"))
+        self.label_12.setText(_translate("SectionWidget", "Channel 3"))
+        self.label_11.setText(_translate("SectionWidget", "Channel 2"))
+        self.label_2.setText(_translate("SectionWidget", "To manhole"))
+        self.label_7.setText(_translate("SectionWidget", "Profile"))
+        self.label_8.setText(_translate("SectionWidget", "Width"))
+        self.label_4.setText(_translate("SectionWidget", "Use"))
+        self.label_5.setText(_translate("SectionWidget", "Material"))
+        self.label.setText(_translate("SectionWidget", "From manhole"))
+        self.label_3.setText(_translate("SectionWidget", "Length"))
+        self.label_6.setText(_translate("SectionWidget", "Diameter"))
+        self.label_9.setText(_translate("SectionWidget", "Address"))
+        self.checkAllButton.setText(_translate("SectionWidget", "Check all"))
+        self.usePreviousSectionCheckBox.setText(_translate("SectionWidget", "Reuse previous channel"))
+        self.uncheckAllButton.setText(_translate("SectionWidget", "Uncheck all"))
+        self.filterUnmatchedSectionsButton.setText(_translate("SectionWidget", "Filter unmatched sections"))
+from wincan2teksi.gui.featureselectorwidget import FeatureSelectorWidget
+from wincan2teksi.gui.inspectionwidget import InspectionWidget
@@ -0,0 +1,201 @@
+# Generated from settings.ui by scripts/compile_ui.py, do not edit.
+# ui sha256: 60b867881bebd97d8878f5f9e3c5a818a6b21f7efb516b203dcdaf6c56dd4cbc
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_WincanSettings(object):
+    def setupUi(self, WincanSettings):
+        WincanSettings.setObjectName("WincanSettings")
+        WincanSettings.resize(728, 830)
+        self.gridLayout = QtWidgets.QGridLayout(WincanSettings)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_8 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout.addWidget(self.label_8, 8, 0, 1, 1)
+        self.label_4 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 4, 0, 1, 1)
+        self.highlightGroupBox = QtWidgets.QGroupBox(parent=WincanSettings)
+        self.highlightGroupBox.setObjectName("highlightGroupBox")
+        self.gridLayout_highlight = QtWidgets.QGridLayout(self.highlightGroupBox)
+        self.gridLayout_highlight.setObjectName("gridLayout_highlight")
+        self.label_highlight_color = QtWidgets.QLabel(parent=self.highlightGroupBox)
+        self.label_highlight_color.setObjectName("label_highlight_color")
+        self.gridLayout_highlight.addWidget(self.label_highlight_color, 0, 0, 1, 1)
+        self.highlight_color_button = QgsColorButton(parent=self.highlightGroupBox)
+        self.highlight_color_button.setMinimumSize(QtCore.QSize(100, 0))
+        self.highlight_color_button.setObjectName("highlight_color_button")
+        self.gridLayout_highlight.addWidget(self.highlight_color_button, 0, 1, 1, 1)
+        self.label_highlight_buffer = QtWidgets.QLabel(parent=self.highlightGroupBox)
+        self.label_highlight_buffer.setVisible(False)
+        self.label_highlight_buffer.setObjectName("label_highlight_buffer")
+        self.gridLayout_highlight.addWidget(self.label_highlight_buffer, 1, 0, 1, 1)
+        self.highlight_buffer_spinbox = QtWidgets.QDoubleSpinBox(parent=self.highlightGroupBox)
+        self.highlight_buffer_spinbox.setVisible(False)
+        self.highlight_buffer_spinbox.setDecimals(1)
+        self.highlight_buffer_spinbox.setMinimum(0.0)
+        self.highlight_buffer_spinbox.setMaximum(50.0)
+        self.highlight_buffer_spinbox.setObjectName("highlight_buffer_spinbox")
+        self.gridLayout_highlight.addWidget(self.highlight_buffer_spinbox, 1, 1, 1, 1)
+        self.label_highlight_width = QtWidgets.QLabel(parent=self.highlightGroupBox)
+        self.label_highlight_width.setObjectName("label_highlight_width")
+        self.gridLayout_highlight.addWidget(self.label_highlight_width, 2, 0, 1, 1)
+        self.highlight_width_spinbox = QtWidgets.QSpinBox(parent=self.highlightGroupBox)
+        self.highlight_width_spinbox.setMinimum(0)
+        self.highlight_width_spinbox.setMaximum(50)
+        self.highlight_width_spinbox.setObjectName("highlight_width_spinbox")
+        self.gridLayout_highlight.addWidget(self.highlight_width_spinbox, 2, 1, 1, 1)
+        self.gridLayout.addWidget(self.highlightGroupBox, 12, 0, 1, 2)
+        self.importGroupBox = QtWidgets.QGroupBox(parent=WincanSettings)
+        self.importGroupBox.setObjectName("importGroupBox")
+        self.gridLayout_import = QtWidgets.QGridLayout(self.importGroupBox)
+        self.gridLayout_import.setObjectName("gridLayout_import")
+        self.label_writer_backend = QtWidgets.QLabel(parent=self.importGroupBox)
+        self.label_writer_backend.setObjectName("label_writer_backend")
+        self.gridLayout_import.addWidget(self.label_writer_backend, 0, 0, 1, 1)
+        self.writer_backend_combobox = QtWidgets.QComboBox(parent=self.importGroupBox)
+        self.writer_backend_combobox.setObjectName("writer_backend_combobox")
+        self.gridLayout_import.addWidget(self.writer_backend_combobox, 0, 1, 1, 1)
+        self.stage_db3_locally_checkbox = QtWidgets.QCheckBox(parent=self.importGroupBox)
+        self.stage_db3_locally_checkbox.setObjectName("stage_db3_locally_checkbox")
+        self.gridLayout_import.addWidget(self.stage_db3_locally_checkbox, 1, 0, 1, 2)
+        self.gridLayout.addWidget(self.importGroupBox, 13, 0, 1, 2)
+        self.logsGroupBox = QtWidgets.QGroupBox(parent=WincanSettings)
+        self.logsGroupBox.setObjectName("logsGroupBox")
+        self.gridLayout_logs = QtWidgets.QGridLayout(self.logsGroupBox)
+        self.gridLayout_logs.setObjectName("gridLayout_logs")
+        self.label_max_log_entries = QtWidgets.QLabel(parent=self.logsGroupBox)
+        self.label_max_log_entries.setObjectName("label_max_log_entries")
+        self.gridLayout_logs.addWidget(self.label_max_log_entries, 0, 0, 1, 1)
+        self.max_log_entries_spinbox = QtWidgets.QSpinBox(parent=self.logsGroupBox)
+        self.max_log_entries_spinbox.setMinimum(100)
+        self.max_log_entries_spinbox.setMaximum(1000000)
+        self.max_log_entries_spinbox.setSingleStep(1000)
+        self.max_log_entries_spinbox.setObjectName("max_log_entries_spinbox")
+        self.gridLayout_logs.addWidget(self.max_log_entries_spinbox, 0, 1, 1, 1)
+        self.label_slow_query_threshold = QtWidgets.QLabel(parent=self.logsGroupBox)
+        self.label_slow_query_threshold.setObjectName("label_slow_query_threshold")
+        self.gridLayout_logs.addWidget(self.label_slow_query_threshold, 1, 0, 1, 1)
+        self.slow_query_threshold_spinbox = QtWidgets.QDoubleSpinBox(parent=self.logsGroupBox)
+        self.slow_query_threshold_spinbox.setDecimals(0)
+        self.slow_query_threshold_spinbox.setMaximum(600000.0)
+        self.slow_query_threshold_spinbox.setSingleStep(100.0)
+        self.slow_query_threshold_spinbox.setObjectName("slow_query_threshold_spinbox")
+        self.gridLayout_logs.addWidget(self.slow_query_threshold_spinbox, 1, 1, 1, 1)
+        self.gridLayout.addWidget(self.logsGroupBox, 14, 0, 1, 2)
+        self.buttonBox = QtWidgets.QDialogButtonBox(parent=WincanSettings)
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Cancel|QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.gridLayout.addWidget(self.buttonBox, 15, 0, 1, 2)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout.addItem(spacerItem, 16, 0, 1, 1)
+        self.label_6 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout.addWidget(self.label_6, 6, 0, 1, 1)
+        self.label_7 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout.addWidget(self.label_7, 7, 0, 1, 1)
+        self.channel_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.channel_layer.setObjectName("channel_layer")
+        self.gridLayout.addWidget(self.channel_layer, 1, 1, 1, 1)
+        self.maintenance_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.maintenance_layer.setObjectName("maintenance_layer")
+        self.gridLayout.addWidget(self.maintenance_layer, 3, 1, 1, 1)
+        self.join_maintence_wastewaterstructure_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.join_maintence_wastewaterstructure_layer.setObjectName("join_maintence_wastewaterstructure_layer")
+        self.gridLayout.addWidget(self.join_maintence_wastewaterstructure_layer, 6, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 3, 0, 1, 1)
+        self.label = QtWidgets.QLabel(parent=WincanSettings)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 1, 0, 1, 1)
+        self.label_5 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout.addWidget(self.label_5, 5, 0, 1, 1)
+        self.file_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.file_layer.setObjectName("file_layer")
+        self.gridLayout.addWidget(self.file_layer, 5, 1, 1, 1)
+        self.label_2 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 2, 0, 1, 1)
+        self.damage_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.damage_layer.setObjectName("damage_layer")
+        self.gridLayout.addWidget(self.damage_layer, 4, 1, 1, 1)
+        self.label_9 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout.addWidget(self.label_9, 9, 0, 1, 1)
+        self.cover_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.cover_layer.setObjectName("cover_layer")
+        self.gridLayout.addWidget(self.cover_layer, 2, 1, 1, 1)
+        self.label_10 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout.addWidget(self.label_10, 0, 0, 1, 1)
+        self.wastewater_structure_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.wastewater_structure_layer.setObjectName("wastewater_structure_layer")
+        self.gridLayout.addWidget(self.wastewater_structure_layer, 0, 1, 1, 1)
+        self.vl_damage_channel_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.vl_damage_channel_layer.setObjectName("vl_damage_channel_layer")
+        self.gridLayout.addWidget(self.vl_damage_channel_layer, 7, 1, 1, 1)
+        self.vl_damage_single_class = QgsMapLayerComboBox(parent=WincanSettings)
+        self.vl_damage_single_class.setObjectName("vl_damage_single_class")
+        self.gridLayout.addWidget(self.vl_damage_single_class, 8, 1, 1, 1)
+        self.vl_wastewater_structure_structure_condition = QgsMapLayerComboBox(parent=WincanSettings)
+        self.vl_wastewater_structure_structure_condition.setObjectName("vl_wastewater_structure_structure_condition")
+        self.gridLayout.addWidget(self.vl_wastewater_structure_structure_condition, 9, 1, 1, 1)
+        self.label_12 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_12.setObjectName("label_12")
+        self.gridLayout.addWidget(self.label_12, 10, 0, 1, 1)
+        self.organisation_layer = QgsMapLayerComboBox(parent=WincanSettings)
+        self.organisation_layer.setObjectName("organisation_layer")
+        self.gridLayout.addWidget(self.organisation_layer, 10, 1, 1, 1)
+        self.label_11 = QtWidgets.QLabel(parent=WincanSettings)
+        self.label_11.setObjectName("label_11")
+        self.gridLayout.addWidget(self.label_11, 11, 0, 1, 1)
+        self.import_log_dir_widget = QgsFileWidget(parent=WincanSettings)
+        self.import_log_dir_widget.setObjectName("import_log_dir_widget")
+        self.gridLayout.addWidget(self.import_log_dir_widget, 11, 1, 1, 1)
+
+        self.retranslateUi(WincanSettings)
+        self.buttonBox.accepted.connect(WincanSettings.accept) # type: ignore
+        self.buttonBox.rejected.connect(WincanSettings.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(WincanSettings)
+
+    def retranslateUi(self, WincanSettings):
+        _translate = QtCore.QCoreApplication.translate
+        WincanSettings.setWindowTitle(_translate("WincanSettings", "Wincan VX to TEKSI Importer - Settings"))
+        self.label_8.setText(_translate("WincanSettings", "VL damage single class"))
+        self.label_4.setText(_translate("WincanSettings", "Damage"))
+        self.highlightGroupBox.setTitle(_translate("WincanSettings", "Section highlighting"))
+        self.label_highlight_color.setText(_translate("WincanSettings", "Color"))
+        self.label_highlight_buffer.setText(_translate("WincanSettings", "Buffer (mm)"))
+        self.label_highlight_width.setText(_translate("WincanSettings", "Width"))
+        self.importGroupBox.setTitle(_translate("WincanSettings", "Import"))
+        self.label_writer_backend.setText(_translate("WincanSettings", "Writer backend"))
+        self.stage_db3_locally_checkbox.setToolTip(_translate("WincanSettings", "Faster on network shares and does not lock the delivered files"))
+        self.stage_db3_locally_checkbox.setText(_translate("WincanSettings", "Copy the WinCan database to a local temporary file before reading it"))
+        self.logsGroupBox.setTitle(_translate("WincanSettings", "Logs"))
+        self.label_max_log_entries.setText(_translate("WincanSettings", "Maximum entries in the logs panel"))
+        self.label_slow_query_threshold.setText(_translate("WincanSettings", "Log layer requests slower than"))
+        self.slow_query_threshold_spinbox.setSpecialValueText(_translate("WincanSettings", "never"))
+        self.slow_query_threshold_spinbox.setSuffix(_translate("WincanSettings", " ms"))
+        self.label_6.setText(_translate("WincanSettings", "Maintenance - WS join"))
+        self.label_7.setText(_translate("WincanSettings", "VL damage channel"))
+        self.label_3.setText(_translate("WincanSettings", "Maintenance"))
+        self.label.setText(_translate("WincanSettings", "Channel"))
+        self.label_5.setText(_translate("WincanSettings", "File"))
+        self.label_2.setText(_translate("WincanSettings", "Cover"))
+        self.label_9.setText(_translate("WincanSettings", "VL WS structure condition"))
+        self.label_10.setText(_translate("WincanSettings", "Wastewater structures"))
+        self.label_12.setText(_translate("WincanSettings", "Organisation"))
+        self.label_11.setText(_translate("WincanSettings", "Import log directory"))
+from qgis.gui import QgsFileWidget
+from qgis.gui import QgsColorButton
+from qgis.gui import QgsMapLayerComboBox
@@ -34,9 +34,11 @@ import logging
 from pathlib import Path
 
 from wincan2teksi.core.settings import Settings, PLUGIN_NAME
-from wincan2teksi.core.read_data import read_data
-from wincan2teksi.gui.databrowserdialog import DataBrowserDialog
-from wincan2teksi.gui.settings_dialog import SettingsDialog
+from wincan2teksi.core.utils import start_logging, stop_logging
+from wincan2teksi.core import tracing
+
+# the reader and the GUI modules (with their .ui files) are only imported when first used,
+# not when QGIS loads the plugin
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,8 @@ class Wincan2Teksi(QObject):
             QCoreApplication.installTranslator(self.translator)
 
     def initGui(self):
+        tracing.set_enabled(self.settings.tracing_enabled.value())
+
         self.actions["openInspection"] = QAction(
             QIcon(str(self.plugin_dir / "icons" / "wincan_logo.png")),
             self.tr("Open an inspection report"),
@@ -95,6 +99,8 @@ class Wincan2Teksi(QObject):
         if self.dlg:
             self.dlg.close()
 
+        # does nothing if the plugin has not been used
+        stop_logging()
         QgsSettingsTree.unregisterPluginTreeNode(PLUGIN_NAME)
 
     def open_inspection(self):
@@ -106,12 +112,17 @@ class Wincan2Teksi(QObject):
         )
 
         if file_path:
+            # the log file and its listener thread are only set up once the plugin is used
+            start_logging()
             logger.info(f"Opening Wincan inspection file: {file_path}")
             absolute_path = os.path.dirname(os.path.realpath(file_path))
             parent_path = os.path.abspath(os.path.join(absolute_path, os.pardir))
             self.settings.db3_path.setValue(absolute_path)
+            from wincan2teksi.core.read_data import read_data
+            from wincan2teksi.gui.databrowserdialog import DataBrowserDialog
+
             try:
-                data = read_data(file_path)
+                data = read_data(file_path, stage_locally=self.settings.stage_db3_locally.value())
             except Exception as e:
                 logger.error(f"Error reading Wincan file: {e}")
                 self.iface.messageBar().pushMessage(
@@ -124,4 +135,6 @@ class Wincan2Teksi(QObject):
             self.dlg.show()
 
     def show_settings(self):
+        from wincan2teksi.gui.settings_dialog import SettingsDialog
+
         SettingsDialog().exec()